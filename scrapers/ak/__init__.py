@@ -1,13 +1,16 @@
-from utils import State, url_xpath
-
-from .bills import AKBillScraper
-from .events import AKEventScraper
+from utils import State, LazyScrapers, url_xpath
 
 settings = dict(SCRAPELIB_TIMEOUT=600)
 
 
 class Alaska(State):
-    scrapers = {"bills": AKBillScraper, "events": AKEventScraper}
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:AKBillScraper",
+            "events": ".events:AKEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "28th Legislature (2013-2014)",
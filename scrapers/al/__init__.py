@@ -1,16 +1,15 @@
-from utils import State
-
-from .bills import ALBillScraper
-from .events import ALEventScraper
-from .people import ALPersonScraper
+from utils import State, LazyScrapers
 
 
 class Alabama(State):
-    scrapers = {
-        "bills": ALBillScraper,
-        "events": ALEventScraper,
-        "people": ALPersonScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:ALBillScraper",
+            "events": ".events:ALEventScraper",
+            "people": ".people:ALPersonScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "Regular Session 2011",
@@ -1,18 +1,19 @@
-from utils import url_xpath, State
-from .people import ARLegislatorScraper
-from .bills import ARBillScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import ARCommitteeScraper
 # from .events import AREventScraper
 
 
 class Arkansas(State):
-    scrapers = {
-        "people": ARLegislatorScraper,
-        # 'committees': ARCommitteeScraper,
-        "bills": ARBillScraper,
-        # 'events': AREventScraper
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:ARLegislatorScraper",
+            # 'committees': ARCommitteeScraper,
+            "bills": ".bills:ARBillScraper",
+            # 'events': AREventScraper
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "Regular Session, 2011",
@@ -1,9 +1,9 @@
 import re
 import csv
-import urllib
 import datetime
 import pytz
 from openstates.scrape import Scraper, Bill, VoteEvent
+from utils import bulk
 
 import lxml.html
 
@@ -13,13 +13,9 @@ TIMEZONE = pytz.timezone("US/Central")
 
 
 def get_utf_16_ftp_content(url):
-    # Rough to do this within Scrapelib, as it doesn't allow custom decoding
-    raw = urllib.request.urlopen(url).read().decode("utf-16")
-    # Also, legislature may use `NUL` bytes when a cell is empty
-    NULL_BYTE_CODE = "\x00"
-    text = raw.replace(NULL_BYTE_CODE, "")
-    text = text.replace("\r", "")
-    return text
+    # The files are UTF-16, which is sniffed (once) and decoded as they're
+    # read. Also, legislature may use `NUL` bytes when a cell is empty
+    return bulk.iter_lines(url, drop="\x00\r")
 
 
 class ARBillScraper(Scraper):
@@ -39,7 +35,7 @@ class ARBillScraper(Scraper):
 
     def scrape_bill(self, chamber, session):
         url = "ftp://www.arkleg.state.ar.us/SessionInformation/LegislativeMeasures.txt"
-        page = csv.reader(get_utf_16_ftp_content(url).splitlines(), delimiter="|")
+        page = csv.reader(get_utf_16_ftp_content(url), delimiter="|")
 
         for row in page:
             bill_chamber = {"H": "lower", "S": "upper"}[row[0]]
@@ -94,7 +90,7 @@ class ARBillScraper(Scraper):
 
     def scrape_actions(self):
         url = "ftp://www.arkleg.state.ar.us/SessionInformation/ChamberActions.txt"
-        page = csv.reader(get_utf_16_ftp_content(url).splitlines(), delimiter="|")
+        page = csv.reader(get_utf_16_ftp_content(url), delimiter="|")
 
         for row in page:
             bill_id = "%s%s %s" % (row[1], row[2], row[3])
@@ -1,21 +1,22 @@
 import lxml.html
 import re
 import requests
-from utils import State
-from .people import AZPersonScraper
-from .bills import AZBillScraper
+from utils import State, LazyScrapers
 
 # from .committees import AZCommitteeScraper
 # from .events import AZEventScraper
 
 
 class Arizona(State):
-    scrapers = {
-        "people": AZPersonScraper,
-        # 'committees': AZCommitteeScraper,
-        # 'events': AZEventScraper,
-        "bills": AZBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:AZPersonScraper",
+            # 'committees': AZCommitteeScraper,
+            # 'events': AZEventScraper,
+            "bills": ".bills:AZBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009 - Forty-ninth Legislature - First Regular Session",
@@ -4,6 +4,7 @@ import datetime
 from lxml import html
 from openstates.scrape import Scraper, Bill, VoteEvent
 
+from utils.legislators import LegislatorDirectory
 from . import utils
 from . import session_metadata
 
@@ -106,14 +107,7 @@ class AZBillScraper(Scraper):
             else:
                 sponsor_type = "cosponsor"
 
-            # Some older bills don't have the FullName key
-            if "FullName" in sponsor["Legislator"]:
-                sponsor_name = sponsor["Legislator"]["FullName"]
-            else:
-                sponsor_name = "{} {}".format(
-                    sponsor["Legislator"]["FirstName"],
-                    sponsor["Legislator"]["LastName"],
-                )
+            sponsor_name = self.legislator_name(sponsor["Legislator"])
             bill.add_sponsorship(
                 classification=str(sponsor_type),
                 name=sponsor_name,
@@ -121,6 +115,22 @@ class AZBillScraper(Scraper):
                 primary=sponsor_type == "primary",
             )
 
+    def legislator_name(self, legislator):
+        """The full name of a legislator record from the API, remembering
+        it by the legislator's id for the records that come without one.
+        """
+        member_id = legislator.get("Id")
+        if "FullName" in legislator:
+            name = legislator["FullName"]
+            if member_id is not None and self.legislators.get(member_id) != name:
+                self.legislators.set(member_id, name)
+            return name
+
+        # Some older bills don't have the FullName key
+        if member_id in self.legislators:
+            return self.legislators[member_id]
+        return "{} {}".format(legislator["FirstName"], legislator["LastName"])
+
     def scrape_subjects(self, bill, internal_id):
         # https://apps.azleg.gov/api/Keyword/?billStatusId=68149
         subjects_url = "https://apps.azleg.gov/api/Keyword/?billStatusId={}".format(
@@ -292,7 +302,7 @@ class AZBillScraper(Scraper):
 
                 for v in action["Votes"]:
                     vote_type = {"Y": "yes", "N": "no"}.get(v["Vote"], "other")
-                    vote.vote(vote_type, v["Legislator"]["FullName"])
+                    vote.vote(vote_type, self.legislator_name(v["Legislator"]))
                 vote.pupa_id = resp.url + str(action["ReferralNumber"])
                 yield vote
 
@@ -301,19 +311,20 @@ class AZBillScraper(Scraper):
             session = self.latest_session()
             self.info("no session specified, using %s", session)
         session_id = session_metadata.session_id_meta_data[session]
+        self.legislators = LegislatorDirectory("az", session_id)
 
-        # Get the bills page to start the session
-        req = self.get("https://www.azleg.gov/bills/")
-
-        session_form_url = "https://www.azleg.gov/azlegwp/setsession.php"
-        form = {"sessionID": session_id}
-        req = self.post(
-            url=session_form_url, data=form, cookies=req.cookies, allow_redirects=True
-        )
-
+        # Get the bills page to start the session, and pick the legislative
+        # session to list; the scraper's cookie jar carries the site's
+        # session cookie from one request to the next
         bill_list_url = "https://www.azleg.gov/bills/"
+        self.get(bill_list_url)
+        self.post(
+            "https://www.azleg.gov/azlegwp/setsession.php",
+            data={"sessionID": session_id},
+            allow_redirects=True,
+        )
 
-        page = self.get(bill_list_url, cookies=req.cookies).content
+        page = self.get(bill_list_url).content
         # There's an errant close-comment that browsers handle
         # but LXML gets really confused.
         page = page.replace(b"--!>", b"-->")
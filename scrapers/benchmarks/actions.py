@@ -0,0 +1,107 @@
+"""
+Replay recorded action strings through each state's categorizer, comparing
+the plain rule loop against the compiled engine in utils.actions.
+
+Action strings are read from a directory laid out either as
+
+    <corpus>/<state>.txt            one action string per line
+    <corpus>/<state>/bill_*.json    scrape output, e.g. a copy of _data/
+
+Usage:
+
+    PYTHONPATH=scrapers python -m benchmarks.actions _data [--states ca wa] [--repeat 3]
+"""
+import argparse
+import glob
+import importlib
+import inspect
+import json
+import os
+import time
+
+from utils.actions import BaseCategorizer
+
+
+STATES = ["ca", "co", "de", "ma", "me", "nd", "ok", "wa", "wv"]
+
+
+def load_actions(corpus, state):
+    path = os.path.join(corpus, state + ".txt")
+    if os.path.exists(path):
+        with open(path) as f:
+            return [line.rstrip("\n") for line in f if line.strip()]
+
+    actions = []
+    for path in glob.glob(os.path.join(corpus, state, "bill_*.json")):
+        with open(path) as f:
+            bill = json.load(f)
+        actions.extend(action["description"] for action in bill.get("actions", []))
+    return actions
+
+
+def get_categorizer_class(state):
+    module = importlib.import_module(state + ".actions")
+    for obj in vars(module).values():
+        if (
+            inspect.isclass(obj)
+            and issubclass(obj, BaseCategorizer)
+            and obj is not BaseCategorizer
+        ):
+            return obj
+
+
+def normalize(result):
+    return {
+        k: sorted(v, key=str) if isinstance(v, list) else v for k, v in result.items()
+    }
+
+
+def run(categorizer, actions, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [categorizer.categorize(text) for text in actions]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("corpus")
+    parser.add_argument("--states", nargs="+", default=STATES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        "{:<6}{:>6}{:>9}{:>10}{:>10}{:>9}".format(
+            "state", "rules", "actions", "plain", "compiled", "speedup"
+        )
+    )
+    for state in args.states:
+        actions = load_actions(args.corpus, state)
+        if not actions:
+            print("{:<6} no recorded actions, skipping".format(state))
+            continue
+        cls = get_categorizer_class(state)
+
+        plain_time, expected = run(cls(compiled=False), actions, args.repeat)
+        compiled_time, got = run(cls(compiled=True), actions, args.repeat)
+
+        for text, a, b in zip(actions, expected, got):
+            if normalize(a) != normalize(b):
+                raise AssertionError(
+                    "{}: results differ for {!r}:\n{}\n{}".format(state, text, a, b)
+                )
+
+        print(
+            "{:<6}{:>6}{:>9}{:>9.3f}s{:>9.3f}s{:>8.1f}x".format(
+                state,
+                len(cls.rules),
+                len(actions),
+                plain_time,
+                compiled_time,
+                plain_time / compiled_time,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
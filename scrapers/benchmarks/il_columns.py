@@ -0,0 +1,104 @@
+"""
+Time IL roll-call column detection (il.bills.find_columns) against the
+original per-offset implementation, over a directory of recorded IL vote
+PDFs (or their pdftotext -layout output saved as .txt).
+
+Usage:
+
+    PYTHONPATH=scrapers python -m benchmarks.il_columns path/to/votes [--repeat 5]
+"""
+import argparse
+import glob
+import os
+import re
+import time
+
+from il.bills import VOTE_VALUES, find_columns
+from utils.pdf import convert_pdf
+
+VOTE_LINE_RE = re.compile(r"^\s*(%s)\s+\w" % "|".join(VOTE_VALUES))
+
+
+def _is_potential_column(line, i):
+    for val in VOTE_VALUES:
+        if re.search(r"^%s\s{2,10}(\w.).*" % val, line[i:]):
+            return True
+    return False
+
+
+def find_columns_reference(vote_lines):
+    """find_columns as it was before it scanned each line only once."""
+    potential_columns = []
+
+    for line in vote_lines:
+        pcols = set()
+        for i, x in enumerate(line):
+            if _is_potential_column(line, i):
+                pcols.add(i)
+        potential_columns.append(pcols)
+
+    starter = potential_columns[0]
+    for pc in potential_columns[1:-1]:
+        starter.intersection_update(pc)
+    last_row_cols = potential_columns[-1]
+    if not last_row_cols.issubset(starter):
+        raise Exception("columns don't align")
+    return sorted(starter)
+
+
+def load_vote_lines(corpus):
+    documents = []
+    for path in sorted(glob.glob(os.path.join(corpus, "*"))):
+        if path.endswith(".pdf"):
+            text = convert_pdf(path, "text").decode("utf-8")
+        elif path.endswith(".txt"):
+            with open(path) as f:
+                text = f.read()
+        else:
+            continue
+        lines = [line for line in text.splitlines() if VOTE_LINE_RE.match(line)]
+        if lines:
+            documents.append((path, lines))
+    return documents
+
+
+def run(func, documents, repeat):
+    results = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = []
+        for path, lines in documents:
+            try:
+                results.append(func(lines))
+            except Exception:
+                results.append(None)
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("corpus")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    documents = load_vote_lines(args.corpus)
+    if not documents:
+        raise SystemExit("no vote PDFs found in %s" % args.corpus)
+
+    reference_time, expected = run(find_columns_reference, documents, args.repeat)
+    new_time, got = run(find_columns, documents, args.repeat)
+
+    for (path, _), a, b in zip(documents, expected, got):
+        if a != b:
+            raise AssertionError("%s: %s != %s" % (path, a, b))
+
+    print(
+        "%d documents, %d vote lines"
+        % (len(documents), sum(len(lines) for _, lines in documents))
+    )
+    print("reference: %.3fs" % reference_time)
+    print("current:   %.3fs (%.1fx)" % (new_time, reference_time / new_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Time importing each jurisdiction in a fresh interpreter: the package alone
+(what listing jurisdictions or their scrapers costs now that metadata and
+scrapers load lazily), and with every scraper class and the metadata
+resolved (what every import used to cost).
+
+Usage:
+
+    PYTHONPATH=scrapers python -m benchmarks.imports [ak al ...] [--budget 250]
+
+With --budget, exits non-zero if any package import takes longer than that
+many milliseconds.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from utils.state import jurisdiction_modules
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from utils.state import get_state_class
+cls = get_state_class(sys.argv[1])
+names = list(cls.scrapers)
+lazy = time.perf_counter() - start
+errors = []
+if sys.argv[2] == "full":
+    for name in names:
+        try:
+            cls.scrapers[name]
+        except Exception as e:
+            errors.append("%s: %r" % (name, e))
+    try:
+        cls.metadata
+    except Exception as e:
+        errors.append("metadata: %r" % e)
+print(json.dumps({"lazy": lazy, "full": time.perf_counter() - start, "errors": errors}))
+"""
+
+
+def measure(module_name, mode, timeout):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+        + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    )
+    try:
+        process = subprocess.run(
+            [sys.executable, "-c", CHILD, module_name, mode],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            universal_newlines=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        # e.g. a scraper module that talks to its site at import time
+        return {"error": "timed out after %ss" % timeout}
+    if process.returncode:
+        return {"error": process.stderr.strip().splitlines()[-1]}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("jurisdictions", nargs="*")
+    parser.add_argument("--budget", type=float, help="milliseconds")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds")
+    args = parser.parse_args()
+
+    over = []
+    lazy_total = full_total = 0
+    print("%-4s %10s %10s" % ("", "lazy ms", "full ms"))
+    for module_name in args.jurisdictions or jurisdiction_modules():
+        lazy = measure(module_name, "lazy", args.timeout)
+        if "error" in lazy:
+            print("%-4s %s" % (module_name, lazy["error"]))
+            over.append(module_name)
+            continue
+        full = measure(module_name, "full", args.timeout)
+        lazy_ms = lazy["lazy"] * 1000
+        full_ms = full.get("full", 0) * 1000
+        lazy_total += lazy_ms
+        full_total += full_ms
+        note = "; ".join(full.get("errors", [])) or full.get("error", "")
+        if "error" in full:
+            full_ms = float("nan")
+        print("%-4s %10.1f %10.1f  %s" % (module_name, lazy_ms, full_ms, note))
+        if args.budget and lazy_ms > args.budget:
+            over.append(module_name)
+
+    print("%-4s %10.1f %10.1f" % ("all", lazy_total, full_total))
+    if over:
+        print("over budget or failed: %s" % " ".join(over))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
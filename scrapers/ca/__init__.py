@@ -1,22 +1,22 @@
 import re
-from utils import url_xpath, State
-from .bills import CABillScraper
-from .people import CAPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .events import CAEventScraper
 # from .committees import CACommitteeScraper
 
-
 settings = dict(SCRAPELIB_RPM=30)
 
 
 class California(State):
-    scrapers = {
-        "bills": CABillScraper,
-        # 'events': CAEventScraper,
-        "people": CAPersonScraper,
-        # 'committees': CACommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:CABillScraper",
+            # 'events': CAEventScraper,
+            "people": ".people:CAPersonScraper",
+            # 'committees': CACommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "classification": "primary",
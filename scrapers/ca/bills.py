@@ -4,12 +4,12 @@ import pytz
 import operator
 import itertools
 import datetime
-from lxml import etree, html
+from lxml import html
 from utils import LXMLMixin
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, selectinload
+from sqlalchemy import create_engine, event
 from openstates.scrape import Scraper, Bill, VoteEvent
-from .models import CABill
+from .models import CABill, CABillVersion, CAVoteSummary
 from .actions import CACategorizer
 
 SPONSOR_TYPES = {
@@ -22,6 +22,9 @@ MYSQL_HOST = os.environ.get("MYSQL_HOST", "localhost")
 MYSQL_USER = os.environ.get("MYSQL_USER", "root")
 MYSQL_PASSWORD = os.environ.get("MYSQL_PASSWORD", "")
 
+# how many bills (with their versions, actions and votes) to load at a time
+BILL_CHUNK_SIZE = 200
+
 
 def clean_title(s):
     # replace smart quote characters
@@ -225,6 +228,12 @@ class CABillScraper(Scraper, LXMLMixin):
         self.Session = sessionmaker(bind=self.engine)
         self.session = self.Session()
 
+        self.query_count = 0
+        event.listen(self.engine, "before_cursor_execute", self._count_query)
+
+    def _count_query(self, *args, **kwargs):
+        self.query_count += 1
+
     def committee_code_to_name(
         self, code, committee_code_to_name=get_committee_code_data()
     ):
@@ -284,16 +293,29 @@ class CABillScraper(Scraper, LXMLMixin):
         type_abbr,
         committee_abbr_regex=get_committee_name_regex(),
     ):
+        # load everything a bill touches up front, a chunk of bills at a
+        # time, rather than lazily per bill
         bills = (
             self.session.query(CABill)
             .filter_by(session_year=session)
             .filter_by(measure_type=type_abbr)
+            .options(
+                selectinload(CABill.versions).selectinload(CABillVersion.authors),
+                selectinload(CABill.actions),
+                selectinload(CABill.votes).joinedload(CAVoteSummary.votes),
+                selectinload(CABill.votes).joinedload(CAVoteSummary.motion),
+                selectinload(CABill.votes).joinedload(CAVoteSummary.location),
+            )
+            .yield_per(BILL_CHUNK_SIZE)
         )
+        start_query_count = self.query_count
+        bill_count = 0
 
         archive_year = int(session[0:4])
         not_archive_year = archive_year >= 2009
 
         for bill in bills:
+            bill_count += 1
             bill_session = session
             if bill.session_num != "0":
                 bill_session += " Special Session %s" % bill.session_num
@@ -327,19 +349,15 @@ class CABillScraper(Scraper, LXMLMixin):
             # Get digest test (aka "summary") from latest version.
             if bill.versions and not_archive_year:
                 version = bill.versions[-1]
-                nsmap = version.xml.nsmap
-                xpath = "//caml:DigestText/xhtml:p"
-                els = version.xml.xpath(xpath, namespaces=nsmap)
                 chunks = []
-                for el in els:
-                    t = etree_text_content(el)
+                for t in version.digest:
                     t = re.sub(r"\s+", " ", t)
                     t = re.sub(r"\)(\S)", lambda m: ") %s" % m.group(1), t)
                     chunks.append(t)
                 summary = "\n\n".join(chunks)
 
             for version in bill.versions:
-                if not version.bill_xml:
+                if not version.has_bill_xml:
                     continue
 
                 version_date = self._tz.localize(version.bill_version_action_date)
@@ -711,8 +729,11 @@ class CABillScraper(Scraper, LXMLMixin):
                         yield fsvote
 
             yield fsbill
-            self.session.expire_all()
-
 
-def etree_text_content(el):
-    return html.fromstring(etree.tostring(el)).text_content()
+        self.info(
+            "%s %s: %d bills loaded with %d queries",
+            session,
+            type_abbr,
+            bill_count,
+            self.query_count - start_query_count,
+        )
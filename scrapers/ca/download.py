@@ -5,11 +5,16 @@ The workflow is:
  - Drop & recreate the local capublic database.
  - Inspect the site with regex and determine which files have been updated, if any.
  - For each such file, unzip it & call import.
+
+With --incremental, an existing capublic is kept and only the daily
+archives newer than the last applied one are downloaded and upserted.
 """
 import os
 import re
 import glob
+import time
 import os.path
+import tempfile
 import subprocess
 import logging
 import lxml.html
@@ -26,6 +31,10 @@ import MySQLdb
 MYSQL_HOST = os.environ.get("MYSQL_HOST", "localhost")
 MYSQL_USER = os.environ.get("MYSQL_USER", "root")
 MYSQL_PASSWORD = os.environ.get("MYSQL_PASSWORD", "")
+# loading bill versions with LOAD DATA LOCAL INFILE (rather than batched
+# REPLACE) hasn't been checked against MariaDB yet, so it's opt-in; the
+# pubinfo .sql scripts use LOAD DATA LOCAL INFILE either way
+LOAD_DATA_INFILE = os.environ.get("CA_LOAD_DATA_INFILE", "") in ("1", "true", "yes")
 
 BASE_URL = "https://downloads.leginfo.legislature.ca.gov/"
 
@@ -122,71 +131,136 @@ def encode_or_none(value):
     return value.encode() if value else None
 
 
-def load_bill_versions(connection):
-    """
-    Given a data folder, read its BILL_VERSION_TBL.dat file in python,
-    construct individual REPLACE statements and execute them one at
-    a time. This method is slower that letting mysql do the import,
-    but doesn't fail mysteriously.
-    """
+# LOAD DATA's default escaping: backslash sequences for the field and line
+# terminators and \N for NULL.
+LOAD_DATA_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"}
+)
 
-    sql = """
-        REPLACE INTO capublic.bill_version_tbl (
-            BILL_VERSION_ID,
-            BILL_ID,
-            VERSION_NUM,
-            BILL_VERSION_ACTION_DATE,
-            BILL_VERSION_ACTION,
-            REQUEST_NUM,
-            SUBJECT,
-            VOTE_REQUIRED,
-            APPROPRIATION,
-            FISCAL_COMMITTEE,
-            LOCAL_PROGRAM,
-            SUBSTANTIVE_CHANGES,
-            URGENCY,
-            TAXLEVY,
-            BILL_XML,
-            ACTIVE_FLG,
-            TRANS_UID,
-            TRANS_UPDATE)
-
-        VALUES (%s)
-        """
-    sql = sql % ", ".join(["%s"] * 18)
 
-    cursor = connection.cursor()
-    with open("BILL_VERSION_TBL.dat") as f:
+def load_data_field(value):
+    # empty strings become NULL, as with encode_or_none
+    if not value:
+        return "\\N"
+    return value.translate(LOAD_DATA_ESCAPES)
+
+
+def iter_bill_versions(filename="BILL_VERSION_TBL.dat"):
+    """
+    Stream rows of the BILL_VERSION_TBL.dat file, with each row's bill_xml
+    path replaced by the cleaned contents of that XML file.
+    """
+    with open(filename) as f:
         for row in f:
             # The files are supposedly already in utf-8, but with
             # copious bogus characters.
-            row = clean_text(row)
+            row = clean_text(row.rstrip("\r\n"))
             row = dat_row_2_tuple(row)
-            with open(row.bill_xml) as f:
-                text = f.read()
-                text = clean_text(text)
-                row = row._replace(bill_xml=text)
-                cursor.execute(sql, [encode_or_none(column) for column in row])
+            with open(row.bill_xml) as xml:
+                text = clean_text(xml.read())
+            yield row._replace(bill_xml=text)
 
-    cursor.close()
 
-
-def load(folder, sql_name=partial(re.compile(r"\.dat$").sub, ".sql")):
+def load_bill_versions_infile(connection, rows, table="capublic.bill_version_tbl"):
     """
-    Import into mysql any .dat files located in `folder`.
+    Write rows to a temporary tab-separated file and bulk load it with
+    LOAD DATA LOCAL INFILE. Returns the number of rows written.
+    """
+    count = 0
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", newline="\n", suffix=".tsv", dir="."
+    ) as tsv:
+        for row in rows:
+            tsv.write("\t".join(load_data_field(column) for column in row))
+            tsv.write("\n")
+            count += 1
+        tsv.flush()
+
+        # CHARACTER SET binary stores the bytes as written, the same as the
+        # pre-encoded values the REPLACE path sends.
+        sql = """
+            LOAD DATA LOCAL INFILE %s
+            REPLACE INTO TABLE {}
+            CHARACTER SET binary
+            FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+            LINES TERMINATED BY '\\n'
+            ({})
+            """.format(
+            table, ", ".join(field.upper() for field in DatRow._fields)
+        )
+        cursor = connection.cursor()
+        cursor.execute(sql, [os.path.abspath(tsv.name)])
+        cursor.close()
+    return count
 
-    First get a list of filenames like *.dat, then for each, execute
-    the corresponding .sql file after swapping out windows paths for
-    `folder`.
 
-    This function doesn't bother to delete the imported data files
-    afterwards; they'll be overwritten within a week, and leaving them
-    around makes testing easier (they're huge).
+def load_bill_versions_batched(
+    connection, rows, table="capublic.bill_version_tbl", batch_size=100
+):
     """
+    REPLACE rows in batches of ``batch_size`` within a single transaction;
+    the default, and the fallback for servers that refuse LOAD DATA LOCAL.
+    """
+    sql = """
+        REPLACE INTO {} ({})
+        VALUES ({})
+        """.format(
+        table,
+        ", ".join(field.upper() for field in DatRow._fields),
+        ", ".join(["%s"] * len(DatRow._fields)),
+    )
+
+    count = 0
+    connection.autocommit(False)
+    cursor = connection.cursor()
+    try:
+        batch = []
+        for row in rows:
+            batch.append([encode_or_none(column) for column in row])
+            if len(batch) >= batch_size:
+                cursor.executemany(sql, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+            count += len(batch)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+        connection.autocommit(True)
+    return count
+
+
+def load_bill_versions(connection, table="capublic.bill_version_tbl"):
+    """
+    Read the BILL_VERSION_TBL.dat file in python, inline each row's XML
+    file and load the result with batched REPLACE statements, or with
+    CA_LOAD_DATA_INFILE=1, bulk load it with LOAD DATA LOCAL INFILE,
+    falling back to batches if the server doesn't allow it.
+    """
+    start = time.time()
+    if LOAD_DATA_INFILE:
+        try:
+            count = load_bill_versions_infile(connection, iter_bill_versions(), table)
+        except MySQLdb.OperationalError as e:
+            logger.warning(
+                "LOAD DATA LOCAL INFILE failed (%s), using batched REPLACE", e
+            )
+            count = load_bill_versions_batched(connection, iter_bill_versions(), table)
+    else:
+        count = load_bill_versions_batched(connection, iter_bill_versions(), table)
+
+    elapsed = time.time() - start
+    logger.info(
+        "loaded %d bill versions in %.1fs (%.0f rows/sec)"
+        % (count, elapsed, count / elapsed if elapsed else 0)
+    )
 
-    logger.info("Loading data from %s..." % folder)
-    os.chdir(folder)
 
+def connect():
     connection = MySQLdb.connect(
         host=MYSQL_HOST,
         user=MYSQL_USER,
@@ -195,10 +269,15 @@ def load(folder, sql_name=partial(re.compile(r"\.dat$").sub, ".sql")):
         local_infile=1,
     )
     connection.autocommit(True)
+    return connection
 
-    filenames = glob.glob("*.dat")
 
-    for filename in filenames:
+def load_scripts(folder, sql_name=partial(re.compile(r"\.dat$").sub, ".sql")):
+    """
+    Yield (table name, load script) for each .dat file in the current
+    directory, `folder`, with windows paths in the script swapped out.
+    """
+    for filename in glob.glob("*.dat"):
 
         # The corresponding sql file is in data/ca/dbadmin
         _, filename = split(filename)
@@ -209,9 +288,31 @@ def load(folder, sql_name=partial(re.compile(r"\.dat$").sub, ".sql")):
             script = f.read().replace(r"c:\\pubinfo\\", folder)
 
         _, sql_filename = split(sql_filename)
-        logger.info("loading " + sql_filename)
-        if sql_filename == "bill_version_tbl.sql":
-            logger.info("inserting xml files (slow)")
+        yield sql_filename.replace(".sql", ""), script
+
+
+def load(folder):
+    """
+    Import into mysql any .dat files located in `folder`.
+
+    First get a list of filenames like *.dat, then for each, execute
+    the corresponding .sql file after swapping out windows paths for
+    `folder`.
+
+    This function doesn't bother to delete the imported data files
+    afterwards; they'll be overwritten within a week, and leaving them
+    around makes testing easier (they're huge).
+    """
+
+    logger.info("Loading data from %s..." % folder)
+    os.chdir(folder)
+
+    connection = connect()
+
+    for table, script in load_scripts(folder):
+        logger.info("loading " + table)
+        if table == "bill_version_tbl":
+            logger.info("inserting xml files")
             load_bill_versions(connection)
         else:
             cursor = connection.cursor()
@@ -223,6 +324,188 @@ def load(folder, sql_name=partial(re.compile(r"\.dat$").sub, ".sql")):
     logging.info("...Done loading from %s" % folder)
 
 
+# ---------------------------------------------------------------------------
+# Incremental updates from the daily archives.
+
+STATE_TABLE = "capublic.openstates_applied_archives"
+
+
+def get_last_applied(connection):
+    """Return the date of the newest archive applied to capublic, or None."""
+    cursor = connection.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS {} (
+            FILENAME VARCHAR(64) NOT NULL PRIMARY KEY,
+            ARCHIVE_DATE DATETIME NOT NULL,
+            APPLIED_AT DATETIME NOT NULL
+        )
+        """.format(
+            STATE_TABLE
+        )
+    )
+    cursor.execute("SELECT MAX(ARCHIVE_DATE) FROM {}".format(STATE_TABLE))
+    (last_applied,) = cursor.fetchone()
+    cursor.close()
+    return last_applied
+
+
+def record_applied(filename, date):
+    connection = connect()
+    get_last_applied(connection)
+    cursor = connection.cursor()
+    cursor.execute(
+        "REPLACE INTO {} (FILENAME, ARCHIVE_DATE, APPLIED_AT) "
+        "VALUES (%s, %s, %s)".format(STATE_TABLE),
+        [filename, date, datetime.now()],
+    )
+    cursor.close()
+    connection.close()
+
+
+def get_key_columns(connection, table):
+    cursor = connection.cursor()
+    cursor.execute(
+        """
+        SELECT COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = 'capublic' AND TABLE_NAME = %s
+            AND CONSTRAINT_NAME = 'PRIMARY'
+        ORDER BY ORDINAL_POSITION
+        """,
+        [table],
+    )
+    keys = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        """
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = 'capublic' AND TABLE_NAME = %s
+            AND COLUMN_NAME = 'TRANS_UPDATE'
+        """,
+        [table],
+    )
+    (has_trans_update,) = cursor.fetchone()
+    cursor.close()
+    return keys, bool(has_trans_update)
+
+
+def merge_staged(connection, table, staging):
+    """
+    Upsert rows from `staging` into `table` in a single transaction: rows
+    replace existing ones with the same primary key unless the existing
+    row has a newer TRANS_UPDATE.
+    """
+    keys, has_trans_update = get_key_columns(connection, table)
+    target = "capublic." + table
+    staging = "capublic." + staging
+
+    connection.autocommit(False)
+    cursor = connection.cursor()
+    try:
+        if keys:
+            join_on = " AND ".join("t.{0} = s.{0}".format(key) for key in keys)
+            where = ""
+            if has_trans_update:
+                where = (
+                    "WHERE t.TRANS_UPDATE IS NULL OR s.TRANS_UPDATE IS NULL "
+                    "OR s.TRANS_UPDATE >= t.TRANS_UPDATE"
+                )
+            cursor.execute(
+                "DELETE t FROM {} t JOIN {} s ON {} {}".format(
+                    target, staging, join_on, where
+                )
+            )
+            # staged rows whose key is still there lost to a newer row;
+            # the rest go in, with any other error still raised
+            cursor.execute(
+                "INSERT INTO {0} SELECT s.* FROM {1} s LEFT JOIN {0} t ON {2} "
+                "WHERE t.{3} IS NULL".format(target, staging, join_on, keys[0])
+            )
+        else:
+            # nothing to match rows on, so this behaves like a plain load
+            cursor.execute("INSERT INTO {} SELECT * FROM {}".format(target, staging))
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+        connection.autocommit(True)
+
+
+def upsert(folder):
+    """
+    Apply the .dat files in `folder` to the existing tables. Each file is
+    loaded into a staging copy of its table and then merged with
+    merge_staged, so the live tables stay usable throughout.
+    """
+    logger.info("Applying data from %s..." % folder)
+    os.chdir(folder)
+
+    connection = connect()
+    cursor = connection.cursor()
+
+    for table, script in load_scripts(folder):
+        staging = table + "_staging"
+        logger.info("applying " + table)
+
+        cursor.execute("DROP TABLE IF EXISTS capublic.{}".format(staging))
+        cursor.execute(
+            "CREATE TABLE capublic.{} LIKE capublic.{}".format(staging, table)
+        )
+        try:
+            if table == "bill_version_tbl":
+                load_bill_versions(connection, "capublic." + staging)
+            else:
+                script = re.sub(
+                    r"(INTO\s+TABLE\s+)(?:`?capublic`?\.)?`?%s\b`?" % table,
+                    r"\g<1>capublic.%s" % staging,
+                    script,
+                    flags=re.I,
+                )
+                cursor.execute(script)
+            merge_staged(connection, table, staging)
+        finally:
+            cursor.execute("DROP TABLE IF EXISTS capublic.{}".format(staging))
+
+    cursor.close()
+    connection.close()
+    os.chdir("..")
+    logging.info("...Done applying %s" % folder)
+
+
+def db_exists():
+    try:
+        connection = connect()
+    except MySQLdb._exceptions.OperationalError:
+        return False
+    connection.close()
+    return True
+
+
+def update(contents):
+    """
+    Download and apply, oldest first, each daily archive newer than the
+    last one recorded in STATE_TABLE.
+    """
+    connection = connect()
+    last_applied = get_last_applied(connection)
+    connection.close()
+
+    daily = sorted(
+        (date, filename)
+        for filename, date in contents.items()
+        if filename.startswith("pubinfo_daily")
+        and (last_applied is None or date > last_applied)
+    )
+    if not daily:
+        logger.info("capublic is up to date (last applied %s)" % last_applied)
+
+    for date, filename in daily:
+        dirname = get_zip(filename)
+        upsert(dirname)
+        record_applied(filename, date)
+
+
 def db_create():
     """Create the database"""
 
@@ -307,15 +590,25 @@ def get_data(contents, year):
     for file in files_to_get:
         dirname = get_zip(file)
         load(dirname)
+        if file in contents:
+            record_applied(file, contents[file])
 
 
 if __name__ == "__main__":
     my_parser = argparse.ArgumentParser()
     my_parser.add_argument("--year", action="store", type=int)
+    my_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="apply only daily archives newer than the last applied one",
+    )
     args = my_parser.parse_args()
     year = args.year
 
-    db_drop()
-    db_create()
-    contents = get_contents()
-    get_data(contents, year)
+    if args.incremental and not year and db_exists():
+        update(get_contents())
+    else:
+        db_drop()
+        db_create()
+        contents = get_contents()
+        get_data(contents, year)
@@ -6,15 +6,70 @@ from sqlalchemy import (
     DateTime,
     Numeric,
     UnicodeText,
+    func,
 )
+from io import BytesIO
+
 from sqlalchemy.sql import and_
-from sqlalchemy.orm import backref, relation, foreign
+from sqlalchemy.orm import backref, relation, foreign, deferred, column_property
 from sqlalchemy.ext.declarative import declarative_base
 
-from lxml import etree
+from lxml import etree, html
+
+from utils.cache import KeyValueCache
 
 Base = declarative_base()
 
+# headers extracted from bill version XML, keyed on version id and
+# trans_update so unchanged versions are never parsed twice
+header_cache = KeyValueCache("ca_bill_version_headers")
+
+
+def etree_text_content(el):
+    return html.fromstring(etree.tostring(el)).text_content()
+
+
+def extract_header(xml):
+    """
+    Pull the title, subject and digest paragraphs out of a bill version's
+    XML without building a tree of the whole bill: the XML is parsed
+    incrementally and parsing stops at the end of the element holding the
+    digest, once the title and subject have also been seen.
+    """
+    title = subject = None
+    digest = []
+    nsmap = None
+    digest_parent = None
+
+    for event, el in etree.iterparse(
+        BytesIO(xml), events=("start", "end"), recover=True
+    ):
+        if nsmap is None:
+            # the first event is the start of the root element
+            nsmap = el.nsmap
+        if event == "start":
+            continue
+
+        name = etree.QName(el).localname
+        if name == "Title" and title is None:
+            title = el.xpath("string()")
+        elif name == "Subject" and subject is None:
+            subject = el.xpath("string()")
+        elif el.tag == "{%s}DigestText" % nsmap.get("caml"):
+            digest.extend(
+                etree_text_content(p)
+                for p in el.iterchildren("{%s}p" % nsmap.get("xhtml"))
+            )
+            digest_parent = el.getparent()
+        elif el is digest_parent and title is not None and subject is not None:
+            break
+
+    return {
+        "title": (title or "").strip(),
+        "short_title": (subject or "").strip(),
+        "digest": digest,
+    }
+
 
 class CABill(Base):
     __tablename__ = "bill_tbl"
@@ -76,11 +131,14 @@ class CABillVersion(Base):
     substantive_changes = Column(String(3))
     urgency = Column(String(3))
     taxlevy = Column(String(3))
-    bill_xml = Column(UnicodeText)
+    # the bill text can be megabytes, so only load it when it's needed
+    bill_xml = deferred(Column(UnicodeText))
     active_flg = Column(String(1))
     trans_uid = Column(String(30))
     trans_update = Column(DateTime)
 
+    has_bill_xml = column_property(func.length(bill_xml.columns[0]) > 0)
+
     @property
     def xml(self):
         if "_xml" not in self.__dict__:
@@ -89,15 +147,31 @@ class CABillVersion(Base):
             )
         return self._xml
 
+    @property
+    def header(self):
+        if "_header" not in self.__dict__:
+            key = "%s:%s" % (self.bill_version_id, self.trans_update)
+            header = header_cache.get(key)
+            if header is None:
+                if self.has_bill_xml:
+                    header = extract_header(self.bill_xml.encode("utf-8"))
+                else:
+                    header = {"title": "", "short_title": "", "digest": []}
+                header_cache.set(key, header)
+            self._header = header
+        return self._header
+
     @property
     def title(self):
-        text = self.xml.xpath("string(//*[local-name() = 'Title'])") or ""
-        return text.strip()
+        return self.header["title"]
 
     @property
     def short_title(self):
-        text = self.xml.xpath("string(//*[local-name() = 'Subject'])") or ""
-        return text.strip()
+        return self.header["short_title"]
+
+    @property
+    def digest(self):
+        return self.header["digest"]
 
 
 class CABillVersionAuthor(Base):
@@ -1,19 +1,19 @@
 import re
-from utils import url_xpath, State
-from .people import COLegislatorScraper
-from .bills import COBillScraper
-from .events import COEventScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import COCommitteeScraper
 
 
 class Colorado(State):
-    scrapers = {
-        "people": COLegislatorScraper,
-        # 'committees': COCommitteeScraper,
-        "bills": COBillScraper,
-        "events": COEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:COLegislatorScraper",
+            # 'committees': COCommitteeScraper,
+            "bills": ".bills:COBillScraper",
+            "events": ".events:COEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011 Regular Session",
@@ -1,9 +1,6 @@
 import lxml.html
 import scrapelib
-from utils import State
-from .people import CTPersonScraper
-from .bills import CTBillScraper
-from .events import CTEventScraper
+from utils import State, LazyScrapers
 
 settings = {"SCRAPELIB_RPM": 20}
 
@@ -11,11 +8,14 @@ SKIP_SESSIONS = {"incoming", "pub", "CGAAudio", "rba", "NCSL", "FOI_1", "stained
 
 
 class Connecticut(State):
-    scrapers = {
-        "people": CTPersonScraper,
-        "bills": CTBillScraper,
-        "events": CTEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:CTPersonScraper",
+            "bills": ".bills:CTBillScraper",
+            "events": ".events:CTEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011",
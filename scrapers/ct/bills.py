@@ -39,8 +39,7 @@ class CTBillScraper(Scraper):
 
     def scrape_bill_info(self, session, chambers):
         info_url = "ftp://ftp.cga.ct.gov/pub/data/bill_info.csv"
-        data = self.get(info_url)
-        page = open_csv(data)
+        page = open_csv(info_url)
 
         chamber_map = {"H": "lower", "S": "upper"}
 
@@ -219,8 +218,7 @@ class CTBillScraper(Scraper):
 
     def scrape_bill_history(self):
         history_url = "ftp://ftp.cga.ct.gov/pub/data/bill_history.csv"
-        page = self.get(history_url)
-        page = open_csv(page)
+        page = open_csv(history_url)
 
         action_rows = defaultdict(list)
 
@@ -324,16 +322,14 @@ class CTBillScraper(Scraper):
 
     def scrape_subjects(self):
         info_url = "ftp://ftp.cga.ct.gov/pub/data/subject.csv"
-        data = self.get(info_url)
-        page = open_csv(data)
+        page = open_csv(info_url)
 
         for row in page:
             self._subjects[row["bill_num"]].append(row["subj_desc"])
 
     def scrape_committee_names(self):
         comm_url = "ftp://ftp.cga.ct.gov/pub/data/committee.csv"
-        page = self.get(comm_url)
-        page = open_csv(page)
+        page = open_csv(comm_url)
 
         for row in page:
             comm_code = row["comm_code"].strip()
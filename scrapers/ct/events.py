@@ -57,6 +57,5 @@ class CTEventScraper(Scraper):
 
     def get_comm_codes(self):
         url = "ftp://ftp.cga.ct.gov/pub/data/committee.csv"
-        page = self.get(url)
-        page = open_csv(page)
+        page = open_csv(url)
         return [(row["comm_code"].strip(), row["comm_name"].strip()) for row in page]
@@ -44,15 +44,13 @@ class CTPersonScraper(Scraper):
     def scrape(self):
         # chambers = [chamber] if chamber is not None else ['upper', 'lower']
         leg_url = "ftp://ftp.cga.ct.gov/pub/data/LegislatorDatabase.csv"
-        page = self.get(leg_url)
+        page = open_csv(leg_url)
 
         committees = {}
 
         # Ensure that the spreadsheet's structure hasn't generally changed
-        _row_headers = page.text.split("\r\n")[0].replace('"', "").split(",")
-        assert _row_headers == HEADERS, "Spreadsheet structure may have changed"
+        assert page.fieldnames == HEADERS, "Spreadsheet structure may have changed"
 
-        page = open_csv(page)
         for row in page:
 
             chamber = {"H": "lower", "S": "upper"}[row["office code"]]
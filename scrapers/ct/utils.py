@@ -1,14 +1,13 @@
 import re
 import datetime
 import collections
-import chardet
-import csv
-from io import StringIO
 
+from utils import bulk
 
-def open_csv(data):
-    char_encoding = chardet.detect(data.content)["encoding"]
-    return csv.DictReader(StringIO(data.content.decode(char_encoding)))
+
+def open_csv(url):
+    # streamed, with the encoding sniffed once and remembered
+    return bulk.open_csv(url)
 
 
 Listing = collections.namedtuple("Listing", "mtime size filename")
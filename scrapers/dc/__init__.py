@@ -1,20 +1,20 @@
 import os
-import requests
-from utils import State
-from .people import DCPersonScraper
-from .bills import DCBillScraper
+from utils import State, LazyScrapers, http
 
 # from .committees import DCCommitteeScraper
 # from .events import DCEventScraper
 
 
 class DistrictOfColumbia(State):
-    scrapers = {
-        "people": DCPersonScraper,
-        # 'committees': DCCommitteeScraper,
-        # 'events': DCEventScraper,
-        "bills": DCBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:DCPersonScraper",
+            # 'committees': DCCommitteeScraper,
+            # 'events': DCEventScraper,
+            "bills": ".bills:DCBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "19",
@@ -74,7 +74,7 @@ class DistrictOfColumbia(State):
             "Accept": "application/json",
             "User-Agent": useragent,
         }
-        resp = requests.get(
+        resp = http.get(
             "https://lims.dccouncil.us/api/v2/PublicData/CouncilPeriods",
             headers=headers,
             verify=False,
@@ -6,6 +6,7 @@ import requests
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 
 from openstates.scrape import Scraper, Bill, VoteEvent
+from utils import http
 
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
@@ -60,7 +61,7 @@ class DCBillScraper(Scraper):
             leg_listing_url = (
                 self._API_BASE_URL + f"BulkData/{category['categoryId']}/{session}"
             )
-            resp = requests.post(leg_listing_url, headers=self._headers, verify=False,)
+            resp = http.post(leg_listing_url, headers=self._headers, verify=False,)
             resp.raise_for_status()
             leg_listing = resp.json()
 
@@ -145,7 +146,7 @@ class DCBillScraper(Scraper):
                     self._API_BASE_URL
                     + f"LegislationDetails/{leg['legislationNumber']}"
                 )
-                details_resp = requests.get(
+                details_resp = http.get(
                     leg_details_url, headers=self._headers, verify=False,
                 )
                 details_resp.raise_for_status()
@@ -1,5 +1,6 @@
 import json
-import requests
+
+from utils import http
 
 
 API_BASE_URL = "http://lims.dccouncil.us/_layouts/15/uploader/AdminProxy.aspx"
@@ -10,7 +11,7 @@ def api_request(path, **kwargs):
     url = "{}{}".format(API_BASE_URL, path)
     headers = dict(API_HEADERS)
     headers.update(kwargs.pop("headers", {}))
-    response = requests.post(url, headers=headers, **kwargs)
+    response = http.post(url, headers=headers, **kwargs)
     response.raise_for_status()
     return decode_json(response.json())
 
@@ -1,18 +1,19 @@
-from utils import url_xpath, State
-from .people import DEPersonScraper
-from .bills import DEBillScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .events import DEEventScraper
 # from .committees import DECommitteeScraper
 
 
 class Delaware(State):
-    scrapers = {
-        "people": DEPersonScraper,
-        "bills": DEBillScraper,
-        # 'events': DEEventScraper,
-        # 'committees': DECommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:DEPersonScraper",
+            "bills": ".bills:DEBillScraper",
+            # 'events': DEEventScraper,
+            # 'committees': DECommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "1998 - 2000 (GA 140)",
@@ -3,16 +3,18 @@ import json
 
 from openstates.scrape import Scraper, Bill, VoteEvent
 from utils import LXMLMixin
+from utils.legislators import LegislatorDirectory
+from utils.pagination import paginate
+from utils.parallel import ParallelFetchMixin
 from .actions import Categorizer
 
 
-class DEBillScraper(Scraper, LXMLMixin):
+class DEBillScraper(ParallelFetchMixin, Scraper, LXMLMixin):
     categorizer = Categorizer()
     chamber_codes = {"upper": 1, "lower": 2}
     chamber_codes_rev = {1: "upper", 2: "lower"}
     chamber_map = {"House": "lower", "Senate": "upper"}
     legislators = {}
-    legislators_by_short = {}
 
     def scrape(self, session=None):
         if not session:
@@ -26,83 +28,121 @@ class DEBillScraper(Scraper, LXMLMixin):
         # returns bills that are currently _active_ in a chamber,
         # and is not a search by chamber-of-origin
         per_page = 200
-        page = self.post_search(session, 1, per_page)
 
-        bills_and_votes = []
-        page_number = 1
-        while True:
-            page = self.post_search(session, page_number, per_page)
+        def next_page(page_number, page):
             if not page["Data"]:
                 self.info("Found no more bills in pagination")
-                break
-            for bill in page["Data"]:
-                bills_and_votes.extend(list(self.scrape_bill(bill, session)))
-            page_number += 1
-        yield from self.filter_bills(bills_and_votes)
+                return None
+            return page_number + 1
 
-    def filter_bills(self, items):
+        pages = paginate(
+            lambda page_number: self.post_search(session, page_number, per_page),
+            1,
+            next_page,
+        )
+        rows = (row for page in pages for row in page["Data"])
+
+        for row, superseded in self.filter_bills(rows):
+            if superseded:
+                yield from self.scrape_superseded_votes(row, session)
+            else:
+                yield from self.scrape_bill(row, session)
+
+    @staticmethod
+    def parse_bill_id(display_code):
+        """
+        Split a LegislationDisplayCode into (bill_id, amendment, substitute),
+        e.g. `SS 1 for SB 5 w/ SA 1` is (`SB 5`, `SA 1`, `SS 1`)
+        """
+        bill_id = display_code
+        amendment = None
+        substitute = None
+
+        if bill_id.count(" ") > 1:
+            if " w/ " in bill_id:
+                bill_id, amendment = bill_id.split(" w/ ")
+            # A bill can _both_ be amended and be substituted
+            if " for " in bill_id:
+                substitute, bill_id = bill_id.split(" for ")
+            if amendment is None and substitute is None:
+                raise ValueError("unknown bill_id format: " + bill_id)
+
+        return bill_id, amendment, substitute
+
+    def filter_bills(self, rows):
         """
-        Read through all bills on a page. If a bill has no subsitutes,
-        yield it. If a bill does have substitutes, keep the highest-
-        numbered substitute and only yield that Bill object.
+        Read through the search results, which post_search asks for newest
+        first, and yield ``(row, superseded)`` for each. If a bill has no
+        subsitutes, keep it. If a bill does have substitutes, keep the
+        highest-numbered substitute.
         Bills may be amended (`BILL_ID w/ AMENDMENT ID` on the website),
         but if that is the case then the original (unamended) version
         should not exist any more.
+
+        A substitute is entered after the bill it replaces, so it has a
+        higher LegislationId: the first row seen for a bill is the one to
+        keep, and can be scraped straight away, and any later row for it
+        has been superseded. Only the ids of the kept rows are held.
         """
-        # Map of {bill_id: bill}
+        # Map of {bill_id: (amendment, substitute)} of the rows kept
         bills = {}
+        last_id = None
 
-        for bill in items:
-            # The generator also yields VoteEvent objects
-            if isinstance(bill, VoteEvent):
-                yield bill
+        for row in rows:
+            if last_id is not None and row["LegislationId"] > last_id:
+                raise ValueError("legislation search results aren't newest first")
+            last_id = row["LegislationId"]
+
+            display_code = row["LegislationDisplayCode"]
+            bill_id, amendment, substitute = self.parse_bill_id(display_code)
+            if amendment:
+                self.info("Found amended bill `{}`".format(display_code))
+            if substitute:
+                self.info("Found substitute to use instead: `{}`".format(display_code))
+
+            if bill_id not in bills:
+                # This includes bills that were never substituted
+                bills[bill_id] = (amendment, substitute)
+                yield row, False
                 continue
 
-            if (
-                bill.identifier in bills
-                and (
-                    "amendment" in bill.extras
-                    or "amendment" in bills[bill.identifier].extras
+            kept_amendment, kept_substitute = bills[bill_id]
+            if (amendment or kept_amendment) and substitute == kept_substitute:
+                raise ValueError(
+                    "Bill `{}` showed up _both_ amended and unamended".format(bill_id)
                 )
-                and bill.extras.get("substitute")
-                == bills[bill.identifier].extras.get("substitute")
-            ):
+            if substitute and (not kept_substitute or substitute > kept_substitute):
                 raise ValueError(
-                    "Bill `{}` showed up _both_ amended and unamended".format(
-                        bill.identifier
+                    "`{}` was entered before the bill it substitutes for".format(
+                        display_code
                     )
                 )
 
-            if bill.identifier not in bills:
-                # This includes bills that were never substituted
-                bills[bill.identifier] = bill
-            elif "substitute" in bill.extras and (
-                "substitute" not in bills[bill.identifier].extras
-                or bill.extras["substitute"]
-                > bills[bill.identifier].extras["substitute"]
-            ):
-                bills[bill.identifier] = bill
-            else:
-                self.warning("Ignoring substituted bill `{}`".format(bill.identifier))
+            self.warning("Ignoring substituted bill `{}`".format(display_code))
+            yield row, True
 
-        yield from bills.values()
+    def scrape_superseded_votes(self, row, session):
+        """
+        The votes taken on a version of a bill that was substituted, which
+        are attached to the bill (scraped from its substitute's row).
+        """
+        bill_id, _, _ = self.parse_bill_id(row["LegislationDisplayCode"])
+        chamber = "upper" if bill_id.startswith("S") else "lower"
+        bill = Bill(
+            identifier=bill_id,
+            legislative_session=session,
+            chamber=chamber,
+            title=row["LongTitle"],
+        )
+        for vote in self.scrape_votes(bill, row["LegislationId"], session):
+            # point at the bill that's saved, not this stand-in
+            vote.set_bill(bill_id, chamber=chamber)
+            yield vote
 
     def scrape_bill(self, row, session):
-        bill_id = row["LegislationDisplayCode"]
-
-        amendment = None
-        substitute = None
-
-        if bill_id.count(" ") > 1:
-            if " w/ " in bill_id:
-                self.info("Found amended bill `{}`".format(bill_id))
-                bill_id, amendment = bill_id.split(" w/ ")
-            # A bill can _both_ be amended and be substituted
-            if " for " in bill_id:
-                self.info("Found substitute to use instead: `{}`".format(bill_id))
-                substitute, bill_id = bill_id.split(" for ")
-            if amendment is None and substitute is None:
-                raise ValueError("unknown bill_id format: " + bill_id)
+        bill_id, amendment, substitute = self.parse_bill_id(
+            row["LegislationDisplayCode"]
+        )
 
         bill_type = self.classify_bill(bill_id)
         chamber = "upper" if bill_id.startswith("S") else "lower"
@@ -173,6 +213,11 @@ class DEBillScraper(Scraper, LXMLMixin):
         yield bill
 
     def scrape_legislators(self, session):
+        self.legislators = LegislatorDirectory("de", session).populate(
+            lambda: self.fetch_legislators(session)
+        )
+
+    def fetch_legislators(self, session):
         search_form_url = "https://legis.delaware.gov/json/Search/GetFullLegislatorList"
         form = {
             "value": "",
@@ -187,8 +232,7 @@ class DEBillScraper(Scraper, LXMLMixin):
         page = self.post(url=search_form_url, data=form, allow_redirects=True).json()
         assert page["Data"], "Cound not fetch legislators!"
         for row in page["Data"]:
-            self.legislators[str(row["PersonId"])] = row
-            self.legislators_by_short[str(row["ShortName"])] = row
+            yield row["PersonId"], row
 
     def scrape_fiscal_note(self, bill, link):
         media_type = self.mime_from_link(link)
@@ -261,7 +305,7 @@ class DEBillScraper(Scraper, LXMLMixin):
                 # AssemblyMemberId looks like it should work here,
                 # but for some sessions it's bugged to only return session
                 try:
-                    voter = self.legislators_by_short[str(row["ShortName"])]
+                    voter = self.legislators.find("ShortName", row["ShortName"])
                     name = voter["DisplayName"]
                 except KeyError:
                     self.warning(
@@ -421,7 +465,8 @@ class DEBillScraper(Scraper, LXMLMixin):
             "selectedLegislationTypeId[3]": "4",
             # Ignore the `Amendment` legislation type, `5`
             "selectedLegislationTypeId[4]": "6",
-            "sort": "",
+            # newest first, so substitutes come before what they replace
+            "sort": "LegislationId-desc",
             "group": "",
             "filter": "",
             "sponsorName": "",
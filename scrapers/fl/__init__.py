@@ -1,22 +1,23 @@
 # encoding=utf-8
 import logging
-from .bills import FlBillScraper
-from .people import FlPersonScraper
 
 # from .committees import FlCommitteeScraper
 # from .events import FlEventScraper
-from utils import url_xpath, State
+from utils import url_xpath, State, LazyScrapers
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 
 class Florida(State):
-    scrapers = {
-        "bills": FlBillScraper,
-        "people": FlPersonScraper,
-        # "committees": FlCommitteeScraper,
-        # "events": FlEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:FlBillScraper",
+            "people": ".people:FlPersonScraper",
+            # "committees": FlCommitteeScraper,
+            # "events": FlEventScraper,
+        },
+    )
     # Full session list through 2019:
     # https://www.flsenate.gov/PublishedContent/OFFICES/SECRETARY/SessionsoftheFloridaSenateFromStatehood.pdf
     legislative_sessions = [
@@ -5,7 +5,7 @@ import logging
 import requests
 from urllib import parse
 from openstates.scrape import Scraper, Person
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 from spatula import Spatula, Page
 from .utils import fix_name
 
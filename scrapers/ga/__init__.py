@@ -1,17 +1,18 @@
-from utils import State
+from utils import State, LazyScrapers
 from .util import get_client, backoff
-from .bills import GABillScraper
-from .people import GAPersonScraper
 
 # from .committees import GACommitteeScraper
 
 
 class Georgia(State):
-    scrapers = {
-        "bills": GABillScraper,
-        "people": GAPersonScraper,
-        # 'committee': GACommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:GABillScraper",
+            "people": ".people:GAPersonScraper",
+            # 'committee': GACommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011-2012 Regular Session",
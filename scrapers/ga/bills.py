@@ -1,9 +1,11 @@
 import re
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 from openstates.scrape import Scraper, Bill, VoteEvent
 
-from .util import get_client, get_url, backoff, SESSION_SITE_IDS
+from utils.legislators import LegislatorDirectory
+from .util import ClientPool, get_url, SESSION_SITE_IDS
 
 #         Methods (7):
 #            GetLegislationDetail(xs:int LegislationId, )
@@ -24,27 +26,80 @@ from .util import get_client, get_url, backoff, SESSION_SITE_IDS
 #            GetTitles()
 
 
-member_cache = {}
 SOURCE_URL = "http://www.legis.ga.gov/Legislation/en-US/display/{session}/{bid}"
 
 vote_name_pattern = re.compile(r"(.*), (\d+(?:ST|ND|RD|TH))", re.IGNORECASE)
 
 
 class GABillScraper(Scraper):
-    lservice = get_client("Legislation").service
-    vservice = get_client("Votes").service
-    mservice = get_client("Members").service
     lsource = get_url("Legislation")
     msource = get_url("Members")
     vsource = get_url("Votes")
+    # how many calls to have in flight at once (and clients per service)
+    pool_size = 4
+
+    @staticmethod
+    def _member_record(member):
+        # only the name is used, and that's all that's worth keeping
+        return {
+            "Name": {
+                k: None if v is None else str(v)
+                for k, v in dict(member["Name"]).items()
+            }
+        }
 
-    def get_member(self, member_id):
-        if member_id in member_cache:
-            return member_cache[member_id]
+    def get_members(self, sid):
+        listing = self.mservice.call("GetMembersBySession", sid)["MemberListing"]
+        for member in listing:
+            if "Name" in member and member["Name"]:
+                yield member["Id"], self._member_record(member)
 
-        mem = backoff(self.mservice.GetMember, member_id)
-        member_cache[member_id] = mem
-        return mem
+    def get_member(self, member_id):
+        return self.members.resolve(
+            member_id,
+            lambda member_id: self._member_record(
+                self.mservice.call("GetMember", member_id)
+            ),
+        )
+
+    def get_instrument(self, lid):
+        """Fetch a piece of legislation along with its votes and sponsors."""
+        instrument = self.lservice.call("GetLegislationDetail", lid)
+        votes = []
+        sponsors = []
+        if instrument["Caption"] is None:
+            return instrument, votes, sponsors
+
+        if instrument["Votes"]:
+            for vote_ in instrument["Votes"]:
+                _, vote_ = vote_
+                votes.append(self.vservice.call("GetVote", vote_[0]["VoteId"]))
+
+        if instrument["Authors"]:
+            sponsors = instrument["Authors"]["Sponsorship"]
+            if "Sponsors" in instrument and instrument["Sponsors"]:
+                sponsors += instrument["Sponsors"]["Sponsorship"]
+        sponsors = [(x["Type"], self.get_member(x["MemberId"])) for x in sponsors]
+
+        return instrument, votes, sponsors
+
+    def get_instruments(self, legislation):
+        """Yield ``get_instrument`` for each of ``legislation`` in order,
+        with the next few being fetched in the meantime.
+        """
+        window = self.pool_size * 2
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.pool_size) as pool:
+            try:
+                for leg in legislation:
+                    pending.append(pool.submit(self.get_instrument, leg["Id"]))
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def scrape(self, session=None, chamber=None):
         bill_type_map = {
@@ -129,13 +184,18 @@ class GABillScraper(Scraper):
             self.info("no session specified, using %s", session)
         sid = SESSION_SITE_IDS[session]
 
-        legislation = backoff(self.lservice.GetLegislationForSession, sid)[
+        self.lservice = ClientPool("Legislation", self.pool_size)
+        self.vservice = ClientPool("Votes", self.pool_size)
+        self.mservice = ClientPool("Members", self.pool_size)
+        self.members = LegislatorDirectory("ga", sid).populate(
+            lambda: self.get_members(sid)
+        )
+
+        legislation = self.lservice.call("GetLegislationForSession", sid)[
             "LegislationIndex"
         ]
 
-        for leg in legislation:
-            lid = leg["Id"]
-            instrument = backoff(self.lservice.GetLegislationDetail, lid)
+        for instrument, votes, sponsors in self.get_instruments(legislation):
             history = [x for x in instrument["StatusHistory"][0]]
 
             actions = reversed(
@@ -177,39 +237,33 @@ class GABillScraper(Scraper):
             bill.add_abstract(description, note="description")
             bill.extras = {"guid": guid}
 
-            if instrument["Votes"]:
-                for vote_ in instrument["Votes"]:
-                    _, vote_ = vote_
-                    vote_ = backoff(self.vservice.GetVote, vote_[0]["VoteId"])
-
-                    vote = VoteEvent(
-                        start_date=vote_["Date"].strftime("%Y-%m-%d"),
-                        motion_text=vote_["Caption"] or "Vote on Bill",
-                        chamber={"House": "lower", "Senate": "upper"}[vote_["Branch"]],
-                        result="pass" if vote_["Yeas"] > vote_["Nays"] else "fail",
-                        classification="passage",
-                        bill=bill,
-                    )
-                    vote.set_count("yes", vote_["Yeas"])
-                    vote.set_count("no", vote_["Nays"])
-                    vote.set_count("other", vote_["Excused"] + vote_["NotVoting"])
+            for vote_ in votes:
+                vote = VoteEvent(
+                    start_date=vote_["Date"].strftime("%Y-%m-%d"),
+                    motion_text=vote_["Caption"] or "Vote on Bill",
+                    chamber={"House": "lower", "Senate": "upper"}[vote_["Branch"]],
+                    result="pass" if vote_["Yeas"] > vote_["Nays"] else "fail",
+                    classification="passage",
+                    bill=bill,
+                )
+                vote.set_count("yes", vote_["Yeas"])
+                vote.set_count("no", vote_["Nays"])
+                vote.set_count("other", vote_["Excused"] + vote_["NotVoting"])
 
-                    vote.add_source(self.vsource)
+                vote.add_source(self.vsource)
 
-                    methods = {"Yea": "yes", "Nay": "no"}
+                methods = {"Yea": "yes", "Nay": "no"}
 
-                    if vote_["Votes"] is not None:
-                        for vdetail in vote_["Votes"][0]:
-                            whom = vdetail["Member"]
-                            how = vdetail["MemberVoted"]
-                            if whom["Name"] == "VACANT":
-                                continue
-                            name, district = vote_name_pattern.search(
-                                whom["Name"]
-                            ).groups()
-                            vote.vote(methods.get(how, "other"), name, note=district)
+                if vote_["Votes"] is not None:
+                    for vdetail in vote_["Votes"][0]:
+                        whom = vdetail["Member"]
+                        how = vdetail["MemberVoted"]
+                        if whom["Name"] == "VACANT":
+                            continue
+                        name, district = vote_name_pattern.search(whom["Name"]).groups()
+                        vote.vote(methods.get(how, "other"), name, note=district)
 
-                    yield vote
+                yield vote
 
             ccommittees = defaultdict(list)
             committees = instrument["Committees"]
@@ -247,14 +301,6 @@ class GABillScraper(Scraper):
                     act.add_related_entity(committee, "organization")
                 act.extras = {"code": action["code"], "guid": action["_guid"]}
 
-            sponsors = []
-            if instrument["Authors"]:
-                sponsors = instrument["Authors"]["Sponsorship"]
-                if "Sponsors" in instrument and instrument["Sponsors"]:
-                    sponsors += instrument["Sponsors"]["Sponsorship"]
-
-            sponsors = [(x["Type"], self.get_member(x["MemberId"])) for x in sponsors]
-
             for typ, sponsor in sponsors:
                 name = "{First} {Last}".format(**dict(sponsor["Name"]))
                 bill.add_sponsorship(
@@ -3,6 +3,8 @@ import logging
 import socket
 import urllib.error
 import time
+import queue
+import threading
 import suds
 
 logging.getLogger("suds").setLevel(logging.WARNING)
@@ -21,31 +23,126 @@ def get_url(service):
     return url % (service)
 
 
+class RateController(object):
+    """Paces calls to the GA web services: a token bucket that lets
+    ``rate`` calls a second through (with bursts of up to ``burst``),
+    where ``rate`` creeps up by ``increase`` after every call that works
+    and is cut by ``decrease`` whenever the server chokes (additive
+    increase, multiplicative decrease). Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        rate=1.0,
+        min_rate=0.05,
+        max_rate=8.0,
+        burst=4,
+        increase=0.05,
+        decrease=0.5,
+    ):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a call may go out."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def succeeded(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def failed(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            # give the server a moment before anyone tries again
+            self._refill()
+            self.tokens = min(self.tokens, 0)
+
+
+rate = RateController()
+
+
 def backoff(function, *args, **kwargs):
     retries = 5
 
-    def _():
-        time.sleep(1)  # Seems like their server can't handle the load.
-        return function(*args, **kwargs)
-
     for attempt in range(retries):
+        rate.acquire()
         try:
-            return _()
+            result = function(*args, **kwargs)
         except (socket.timeout, urllib.error.URLError, suds.WebFault) as e:
             if "This Roll Call Vote is not published." in str(e):
                 raise ValueError("Roll Call Vote isn't published")
 
-            backoff = (attempt + 1) * 15
+            rate.failed()
             log.warning(
-                "[attempt %s]: Connection broke. Backing off for %s seconds."
-                % (attempt, backoff)
+                "[attempt %s]: Connection broke. Slowing down to %.2f calls/s."
+                % (attempt, rate.rate)
             )
             log.info(str(e))
-            time.sleep(backoff)
+        else:
+            rate.succeeded()
+            return result
 
     raise ValueError("The server's not playing nice. We can't keep slamming it.")
 
 
+class ClientPool(object):
+    """A few clients for one service, so calls can be made from several
+    threads at once (a suds client can't be shared between threads).
+    Clients are created as they're first needed.
+    """
+
+    def __init__(self, service, size=4):
+        self.service = service
+        self.size = size
+        self._clients = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _checkout(self):
+        with self._lock:
+            if self._clients.empty() and self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+        if create:
+            try:
+                return get_client(self.service)
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        return self._clients.get()
+
+    def call(self, method, *args):
+        """Call ``method`` on the service (through ``backoff``)."""
+        client = self._checkout()
+        try:
+            return backoff(getattr(client.service, method), *args)
+        finally:
+            self._clients.put(client)
+
+
 SESSION_SITE_IDS = {
     "2020_ss": "1027",
     "2019_20": 27,
@@ -1,7 +1,4 @@
-from utils import url_xpath, State
-from .people import HIPersonScraper
-from .events import HIEventScraper
-from .bills import HIBillScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import HICommitteeScraper
 
@@ -9,12 +6,15 @@ settings = dict(SCRAPELIB_TIMEOUT=300)
 
 
 class Hawaii(State):
-    scrapers = {
-        "people": HIPersonScraper,
-        "bills": HIBillScraper,
-        # 'committees': HICommitteeScraper,
-        "events": HIEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:HIPersonScraper",
+            "bills": ".bills:HIBillScraper",
+            # 'committees': HICommitteeScraper,
+            "events": ".events:HIEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2012",
@@ -1,18 +1,17 @@
 import re
-from utils import url_xpath, State
-from .people import IAPersonScraper
-from .bills import IABillScraper
-from .votes import IAVoteScraper
-from .events import IAEventScraper
+from utils import url_xpath, State, LazyScrapers
 
 
 class Iowa(State):
-    scrapers = {
-        "people": IAPersonScraper,
-        "bills": IABillScraper,
-        "votes": IAVoteScraper,
-        "events": IAEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:IAPersonScraper",
+            "bills": ".bills:IABillScraper",
+            "votes": ".votes:IAVoteScraper",
+            "events": ".events:IAEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "General Assembly: 84",
@@ -1,8 +1,8 @@
 import re
 import datetime
 import lxml.html
-import requests
 from openstates.scrape import Scraper, Bill
+from utils import http
 
 
 class IABillScraper(Scraper):
@@ -40,10 +40,7 @@ class IABillScraper(Scraper):
 
             yield self.scrape_bill(chamber, session, session_id, bill_id, bill_url)
 
-    def scrape_subjects(self, bill, bill_number, session, req):
-
-        req.headers.update({"X-Requested-With": "XMLHttpRequest"})
-
+    def scrape_subjects(self, bill, bill_number, session):
         session_id = self.get_session_id(session)
         bill_id = bill_number.replace(" ", "+")
         subject_url = (
@@ -53,7 +50,9 @@ class IABillScraper(Scraper):
             )
         )
 
-        html = req.get(subject_url, cookies=req.cookies).text
+        html = http.get(
+            subject_url, headers={"X-Requested-With": "XMLHttpRequest"}
+        ).text
         page = lxml.html.fromstring(html)
 
         subjects = page.xpath('//div[@class="taggedTopics"]/a/text()')
@@ -68,8 +67,7 @@ class IABillScraper(Scraper):
             f"https://www.legis.iowa.gov/legislation/billTracking/"
             f"billHistory?billName={bill_id}&ga={session_id}"
         )
-        req_session = requests.Session()
-        req = requests.get(hist_url)
+        req = http.get(hist_url)
         if req.status_code == 500:
             self.warning("500 error on {}, skipping".format(hist_url))
             return
@@ -286,7 +284,7 @@ class IABillScraper(Scraper):
                     description=action, date=date, chamber=actor, classification=atype
                 )
 
-        self.scrape_subjects(bill, bill_id, session, req_session)
+        self.scrape_subjects(bill, bill_id, session)
 
         yield bill
 
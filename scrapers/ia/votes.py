@@ -4,7 +4,7 @@ import re
 import collections
 import lxml.etree
 
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 from openstates.scrape import Scraper, VoteEvent
 
 
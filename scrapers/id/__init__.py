@@ -1,16 +1,17 @@
-from .people import IDPersonScraper
-from .bills import IDBillScraper
-from utils import url_xpath, State
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import IDCommitteeScraper
 
 
 class Idaho(State):
-    scrapers = {
-        "people": IDPersonScraper,
-        # 'committees': IDCommitteeScraper,
-        "bills": IDBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:IDPersonScraper",
+            # 'committees': IDCommitteeScraper,
+            "bills": ".bills:IDBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011 Session",
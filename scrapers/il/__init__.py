@@ -1,19 +1,19 @@
 # encoding=utf-8
-from utils import url_xpath, State
-from .bills import IlBillScraper
-from .people import IlPersonScraper
-from .events import IlEventScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import IlCommitteeScraper
 
 
 class Illinois(State):
-    scrapers = {
-        "bills": IlBillScraper,
-        "people": IlPersonScraper,
-        "events": IlEventScraper,
-        # "committees": IlCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:IlBillScraper",
+            "people": ".people:IlPersonScraper",
+            "events": ".events:IlEventScraper",
+            # "committees": IlCommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "name": "90th Regular Session",
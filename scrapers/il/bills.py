@@ -6,7 +6,7 @@ import pytz
 import scrapelib
 import lxml.html
 from openstates.scrape import Scraper, Bill, VoteEvent
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdfs
 
 central = pytz.timezone("US/Central")
 
@@ -599,6 +599,7 @@ class IlBillScraper(Scraper):
         doc = lxml.html.fromstring(html)
         doc.make_links_absolute(votes_url)
 
+        pending = []
         for link in doc.xpath('//a[contains(@href, "votehistory")]'):
 
             if link.get("href") in DUPE_VOTES:
@@ -661,29 +662,48 @@ class IlBillScraper(Scraper):
             else:
                 raise AssertionError("Date '{}' does not follow a format".format(date))
 
+            pending.append((actor, date, motion.strip(), link.get("href")))
+
+        # fetch all of the bill's roll calls, then convert them together
+        all_pdflines = self.fetch_pdfs_lines([href for *_, href in pending])
+        for (actor, date, motion, href), pdflines in zip(pending, all_pdflines):
             # manual fix for bad bill. TODO: better error catching here
             vote = self.scrape_pdf_for_votes(
-                session, actor, date, motion.strip(), link.get("href")
+                session, actor, date, motion, href, pdflines
             )
             if vote:
                 vote.set_bill(bill)
                 yield vote
 
     def fetch_pdf_lines(self, href):
-        # download the file
-        try:
-            fname, resp = self.urlretrieve(href)
-            pdflines = [
-                line.decode("utf-8") for line in convert_pdf(fname, "text").splitlines()
-            ]
+        return self.fetch_pdfs_lines([href])[0]
+
+    def fetch_pdfs_lines(self, hrefs):
+        """Download each PDF, then convert them in one batch. Returns a list
+        of lines per href, or False for PDFs that weren't found.
+        """
+        fnames = []
+        for href in hrefs:
+            try:
+                fname, resp = self.urlretrieve(href)
+            except scrapelib.HTTPError as e:
+                assert "404" in e.args[0], "File not found: {}".format(e)
+                self.warning("404 error for vote; skipping vote")
+                fname = None
+            fnames.append(fname)
+
+        texts = iter(convert_pdfs([fname for fname in fnames if fname], "text"))
+        all_pdflines = []
+        for fname in fnames:
+            if fname is None:
+                all_pdflines.append(False)
+                continue
+            pdflines = [line.decode("utf-8") for line in next(texts).splitlines()]
             os.remove(fname)
-            return pdflines
-        except scrapelib.HTTPError as e:
-            assert "404" in e.args[0], "File not found: {}".format(e)
-            self.warning("404 error for vote; skipping vote")
-            return False
+            all_pdflines.append(pdflines)
+        return all_pdflines
 
-    def scrape_pdf_for_votes(self, session, actor, date, motion, href):
+    def scrape_pdf_for_votes(self, session, actor, date, motion, href, pdflines=None):
         warned = False
         # vote indicator, a few spaces, a name, newline or multiple spaces
         # VOTE_RE = re.compile('(Y|N|E|NV|A|P|-)\s{2,5}(\w.+?)(?:\n|\s{2})')
@@ -699,7 +719,8 @@ class IlBillScraper(Scraper):
             "LOST": "fail",
         }
 
-        pdflines = self.fetch_pdf_lines(href)
+        if pdflines is None:
+            pdflines = self.fetch_pdf_lines(href)
 
         if not pdflines:
             return False
@@ -876,27 +897,24 @@ def find_columns_and_parse(vote_lines):
     return votes
 
 
-def _is_potential_column(line, i):
-    for val in VOTE_VALUES:
-        if re.search(r"^%s\s{2,10}(\w.).*" % val, line[i:]):
-            return True
-    return False
+# matches (without consuming anything) at every offset where a column could
+# start: a vote value, 2-10 spaces, then the start of a name
+COLUMN_RE = re.compile(r"(?=(?:%s)\s{2,10}\w.)" % "|".join(VOTE_VALUES))
 
 
-def find_columns(vote_lines):
-    potential_columns = []
+def _potential_columns(line):
+    return {m.start() for m in COLUMN_RE.finditer(line)}
 
-    for line in vote_lines:
-        pcols = set()
-        for i, x in enumerate(line):
-            if _is_potential_column(line, i):
-                pcols.add(i)
-        potential_columns.append(pcols)
-
-    starter = potential_columns[0]
-    for pc in potential_columns[1:-1]:
-        starter.intersection_update(pc)
-    last_row_cols = potential_columns[-1]
+
+def find_columns(vote_lines):
+    vote_lines = list(vote_lines)
+
+    starter = _potential_columns(vote_lines[0])
+    for line in vote_lines[1:-1]:
+        # only offsets that are still candidates need checking
+        starter = {i for i in starter if COLUMN_RE.match(line, i)}
+    line = vote_lines[-1]
+    last_row_cols = _potential_columns(line)
     if not last_row_cols.issubset(starter):
         raise Exception(
             "Row's columns [%s] don't align with candidate final columns [%s]: %s"
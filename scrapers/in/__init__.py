@@ -1,18 +1,18 @@
 import os
-import requests
-from utils import State
-from .people import INPersonScraper
-from .bills import INBillScraper
+from utils import State, LazyScrapers, http
 
 # from .committees import INCommitteeScraper
 
 
 class Indiana(State):
-    scrapers = {
-        "people": INPersonScraper,
-        # 'committees': INCommitteeScraper,
-        "bills": INBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:INPersonScraper",
+            # 'committees': INCommitteeScraper,
+            "bills": ".bills:INBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "First Regular Session 116th General Assembly (2009)",
@@ -135,6 +135,6 @@ class Indiana(State):
             "Accept": "application/json",
             "User-Agent": useragent,
         }
-        resp = requests.get("https://api.iga.in.gov/sessions", headers=headers)
+        resp = http.get("https://api.iga.in.gov/sessions", headers=headers)
         resp.raise_for_status()
         return [session["name"] for session in resp.json()["items"]]
@@ -7,12 +7,13 @@ import scrapelib
 import pytz
 
 from openstates.scrape import Scraper, Bill, VoteEvent
-from openstates.utils import convert_pdf
+from utils.incremental import HighWaterMark, IncrementalMixin
+from utils.pdf import convert_pdfs
 
 from .apiclient import ApiClient
 
 
-class INBillScraper(Scraper):
+class INBillScraper(IncrementalMixin, Scraper):
     jurisdiction = "in"
 
     _tz = pytz.timezone("US/Eastern")
@@ -60,6 +61,8 @@ class INBillScraper(Scraper):
             "ADOPTED": True,
         }
 
+        # download all of the roll calls, then convert them together
+        fetched = []
         for r in rollcalls:
             proxy_link = proxy["url"] + r["link"]
 
@@ -73,8 +76,12 @@ class INBillScraper(Scraper):
                     )
                 )
                 continue
+            fetched.append((r, proxy_link, path))
 
-            text = convert_pdf(path, "text").decode("utf-8")
+        texts = convert_pdfs([path for _, _, path in fetched], "text")
+
+        for (r, proxy_link, path), text in zip(fetched, texts):
+            text = text.decode("utf-8")
             lines = text.split("\n")
             os.remove(path)
 
@@ -159,6 +166,15 @@ class INBillScraper(Scraper):
 
             yield vote
 
+    def _parse_stamps(self, stamps):
+        times = []
+        for stamp in stamps:
+            try:
+                times.append(datetime.datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%S"))
+            except (TypeError, ValueError):
+                continue
+        return times
+
     def deal_with_version(self, version, bill, bill_id, chamber, session, proxy):
         # documents
         docs = OrderedDict()
@@ -215,11 +231,18 @@ class INBillScraper(Scraper):
         votes = version["rollcalls"]
         yield from self._process_votes(votes, bill_id, chamber, session, proxy)
 
-    def scrape(self, session=None):
+    # since=last|1d6h|2021-03-01 only scrapes bills changed since then,
+    # see utils.incremental
+    def scrape(self, session=None, since=None):
         if not session:
             session = self.latest_session()
             self.info("no session specified, using %s", session)
 
+        with HighWaterMark(self, session, since) as mark:
+            yield from self.scrape_bills(session, mark)
+
+    def scrape_bills(self, session, mark):
+
         self._bill_prefix_map = {
             "HB": {"type": "bill", "url_segment": "bills/house"},
             "HR": {"type": "resolution", "url_segment": "resolutions/house/simple"},
@@ -344,6 +367,15 @@ class INBillScraper(Scraper):
                 self.logger.warning("Could not find bill actions page")
                 actions = {"items": []}
 
+            # the latest version's timestamps and the action dates are the
+            # only change information the API gives; skip before fetching
+            # every version (and roll call PDF) of a bill that hasn't changed
+            latest = bill_json["latestVersion"]
+            updated = self._parse_stamps([latest.get("updated"), latest.get("created")])
+            action_dates = self._parse_stamps([a["date"] for a in actions["items"]])
+            if not mark.changed(*updated, dates=action_dates, tz=self._tz):
+                continue
+
             for a in actions["items"]:
                 action_desc = a["description"]
                 if "governor" in action_desc.lower():
@@ -1,10 +1,7 @@
-from utils import url_xpath, State
-from .bills import KSBillScraper
-from .people import KSPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import KSCommitteeScraper
 
-
 # Kansas API's 429 error response includes:
 # You have received this notification because this IP address is querying
 # the kslegislature.org website at a high rate. If the queries are generated
@@ -13,11 +10,14 @@ settings = dict(SCRAPELIB_TIMEOUT=300, SCRAPELIB_RPM=12)
 
 
 class Kansas(State):
-    scrapers = {
-        "bills": KSBillScraper,
-        "people": KSPersonScraper,
-        # 'committees': KSCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:KSBillScraper",
+            "people": ".people:KSPersonScraper",
+            # 'committees': KSCommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "b2011_12",
@@ -5,6 +5,7 @@ import requests
 
 import lxml.html
 from openstates.scrape import Scraper, Bill, VoteEvent
+from utils import http
 
 from . import ksapi
 
@@ -228,7 +229,7 @@ class KSBillScraper(Scraper):
         # sometimes not
         try:
             self.info("Get {}".format(link))
-            text = requests.get(link).text
+            text = http.get(link).text
         except requests.exceptions.HTTPError as err:
             self.warning("{} fetching vote {}, skipping".format(err, link))
             return
@@ -1,17 +1,18 @@
 import re
-from utils import url_xpath, State
-from .people import KYPersonScraper
-from .bills import KYBillScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import KYCommitteeScraper
 
 
 class Kentucky(State):
-    scrapers = {
-        "people": KYPersonScraper,
-        # 'committees': KYCommitteeScraper,
-        "bills": KYBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:KYPersonScraper",
+            # 'committees': KYCommitteeScraper,
+            "bills": ".bills:KYBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011 Regular Session",
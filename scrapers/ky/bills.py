@@ -6,7 +6,7 @@ from pytz import timezone
 from datetime import datetime
 from openstates.scrape import Scraper, Bill, VoteEvent
 from utils import LXMLMixin
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 import pytz
 import math
 
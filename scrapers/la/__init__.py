@@ -1,18 +1,18 @@
-from utils import url_xpath, State
-from .people import LAPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import LACommitteeScraper
-from .events import LAEventScraper
-from .bills import LABillScraper
 
 
 class Louisiana(State):
-    scrapers = {
-        "people": LAPersonScraper,
-        # "committees": LACommitteeScraper,
-        'events': LAEventScraper,
-        "bills": LABillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:LAPersonScraper",
+            # "committees": LACommitteeScraper,
+            "events": ".events:LAEventScraper",
+            "bills": ".bills:LABillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009 Regular Session",
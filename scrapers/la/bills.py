@@ -5,7 +5,8 @@ import os
 import re
 from collections import defaultdict
 from openstates.scrape import Scraper, Bill, VoteEvent
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
+from utils.webforms import WebForm
 from utils import LXMLMixin
 
 
@@ -54,28 +55,15 @@ class LABillScraper(Scraper, LXMLMixin):
 
         return bill_abbreviations
 
-    def do_post_back(self, page, event_target, event_argument):
-        form = page.xpath("//form[@id='aspnetForm']")[0]
-        block = {
-            name: value
-            for name, value in [(obj.name, obj.value) for obj in form.xpath(".//input")]
-        }
-        block["__EVENTTARGET"] = event_target
-        block["__EVENTARGUMENT"] = event_argument
-        if form.method == "GET":
-            ret = lxml.html.fromstring(self.get(form.action, data=block).text)
-        elif form.method == "POST":
-            ret = lxml.html.fromstring(self.post(form.action, data=block).text)
-        else:
-            raise AssertionError(
-                "Unrecognized request type found: {}".format(form.method)
-            )
-
+    def do_post_back(self, form, event_target, event_argument):
+        response = form.post_back(event_target, event_argument)
+        ret = lxml.html.fromstring(response.text)
         ret.make_links_absolute(form.action)
         return ret
 
     def bill_pages(self, url):
-        response = self.get(url, allow_redirects=False)
+        form = WebForm(self, url, form_id="aspnetForm")
+        response = form.get(allow_redirects=False)
         page = lxml.html.fromstring(response.text)
         page.make_links_absolute(url)
         yield page
@@ -88,7 +76,7 @@ class LABillScraper(Scraper, LXMLMixin):
             href = hrefs[0].attrib["href"]
             tokens = re.match(r".*\(\'(?P<token>.*)\',\'.*", href).groupdict()
 
-            page = self.do_post_back(page, tokens["token"], "")
+            page = self.do_post_back(form, tokens["token"], "")
             if page:
                 yield page
 
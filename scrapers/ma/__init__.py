@@ -1,9 +1,6 @@
 import re
-import requests
 import lxml.html
-from utils import State
-from .people import MAPersonScraper
-from .bills import MABillScraper
+from utils import State, LazyScrapers, http
 
 # from .events import MAEventScraper
 
@@ -11,12 +8,15 @@ from .bills import MABillScraper
 
 
 class Massachusetts(State):
-    scrapers = {
-        "people": MAPersonScraper,
-        # 'committees': MACommitteeScraper,
-        "bills": MABillScraper,
-        # "events": MAEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:MAPersonScraper",
+            # 'committees': MACommitteeScraper,
+            "bills": ".bills:MABillScraper",
+            # "events": MAEventScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "186th",
@@ -71,7 +71,7 @@ class Massachusetts(State):
 
     def get_session_list(self):
         doc = lxml.html.fromstring(
-            requests.get("https://malegislature.gov/Bills/Search", verify=False).text
+            http.get("https://malegislature.gov/Bills/Search", verify=False).text
         )
         sessions = doc.xpath(
             "//div[@data-refinername='lawsgeneralcourt']/div/label/text()"
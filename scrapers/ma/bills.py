@@ -4,7 +4,7 @@ import os
 from datetime import datetime
 import lxml.html
 from openstates.scrape import Scraper, Bill, VoteEvent
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 
 from .actions import Categorizer
 
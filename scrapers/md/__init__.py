@@ -1,21 +1,20 @@
-from utils import url_xpath, State
-from .bills import MDBillScraper
-from .people import MDPersonScraper
-from .events import MDEventScraper
-from .votes import MDVoteScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .events import MDEventScraper
 # from .committees import MDCommitteeScraper
 
 
 class Maryland(State):
-    scrapers = {
-        "bills": MDBillScraper,
-        "people": MDPersonScraper,
-        "events": MDEventScraper,
-        "votes": MDVoteScraper,
-        # 'committees': MDCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:MDBillScraper",
+            "people": ".people:MDPersonScraper",
+            "events": ".events:MDEventScraper",
+            "votes": ".votes:MDVoteScraper",
+            # 'committees': MDCommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2007 Regular Session",
@@ -4,7 +4,7 @@ from collections import defaultdict
 from utils import LXMLMixin
 from utils.votes import check_counts
 from openstates.scrape import Scraper, VoteEvent
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf, convert_pdfs
 
 
 class MDVoteScraper(Scraper, LXMLMixin):
@@ -28,16 +28,24 @@ class MDVoteScraper(Scraper, LXMLMixin):
         for link in links:
             doc = self.lxmlize(link)
 
+            vote_urls = []
             for vote_url in doc.xpath('//a[contains(@href, "/votes/")]/@href'):
                 if vote_url not in seen_urls:
-                    v = self.scrape_vote(vote_url, session)
-                    if v:
-                        yield v
+                    vote_urls.append(vote_url)
                     seen_urls.add(vote_url)
 
-    def scrape_vote(self, url, session):
-        fname, _ = self.urlretrieve(url)
-        text = convert_pdf(fname, type="text").decode()
+            # download the day's roll calls, then convert them together
+            fnames = [self.urlretrieve(vote_url)[0] for vote_url in vote_urls]
+            texts = convert_pdfs(fnames, type="text")
+            for vote_url, text in zip(vote_urls, texts):
+                v = self.scrape_vote(vote_url, session, text.decode())
+                if v:
+                    yield v
+
+    def scrape_vote(self, url, session, text=None):
+        if text is None:
+            fname, _ = self.urlretrieve(url)
+            text = convert_pdf(fname, type="text").decode()
         lines = text.splitlines()
 
         chamber = "upper" if "senate" in url else "lower"
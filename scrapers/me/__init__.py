@@ -1,6 +1,4 @@
-from utils import url_xpath, State
-from .bills import MEBillScraper
-from .people import MEPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .events import MEEventScraper
 
@@ -8,12 +6,15 @@ from .people import MEPersonScraper
 
 
 class Maine(State):
-    scrapers = {
-        "bills": MEBillScraper,
-        "people": MEPersonScraper,
-        # 'events': MEEventScraper,
-        # 'committees': MECommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:MEBillScraper",
+            "people": ".people:MEPersonScraper",
+            # 'events': MEEventScraper,
+            # 'committees': MECommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "121st Legislature",
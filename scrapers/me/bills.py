@@ -8,6 +8,7 @@ import lxml.html
 import scrapelib
 
 from openstates.scrape import Scraper, Bill, VoteEvent
+from utils.pagination import paginate
 
 from .actions import Categorizer
 
@@ -49,25 +50,29 @@ class MEBillScraper(Scraper):
         r = request_session.post(url=search_url, data=form_data)
         r.raise_for_status()
 
-        yield from self._recursively_process_bills(
+        yield from self._process_bills(
             request_session=request_session, chamber=chamber, session=session
         )
 
-    def _recursively_process_bills(
-        self, request_session, chamber, session, first_item=1
-    ):
+    def _process_bills(self, request_session, chamber, session):
         """
         Once a search has been initiated, this function will save a
         Bill object for every Paper from the given chamber
         """
 
         url = "http://legislature.maine.gov/LawMakerWeb/searchresults.asp"
-        r = request_session.get(url, params={"StartWith": first_item})
-        r.raise_for_status()
+        PAGE_SIZE = 25
+
+        def fetch(first_item):
+            r = request_session.get(url, params={"StartWith": first_item})
+            r.raise_for_status()
+            return lxml.html.fromstring(r.text).xpath("//tr/td/b/a")
+
+        def next_key(first_item, bills):
+            return first_item + PAGE_SIZE if bills else None
 
-        bills = lxml.html.fromstring(r.text).xpath("//tr/td/b/a")
-        seen = set()
-        if bills:
+        for bills in paginate(fetch, 1, next_key):
+            seen = set()
             for bill in bills:
                 bill_id_slug = bill.xpath("./@href")[0]
                 if bill_id_slug == "summary.asp?ID=280068396":
@@ -96,15 +101,6 @@ class MEBillScraper(Scraper):
                 yield from self.scrape_bill(bill, chamber)
                 yield bill
 
-            # Make a recursive call to this function, for the next page
-            PAGE_SIZE = 25
-            yield from self._recursively_process_bills(
-                request_session=request_session,
-                chamber=chamber,
-                session=session,
-                first_item=first_item + PAGE_SIZE,
-            )
-
     def scrape_bill(self, bill, chamber):
         url = bill.sources[0]["url"]
         html = self.get(url).text
@@ -1,18 +1,18 @@
-from utils import url_xpath, State
-from .bills import MIBillScraper
-from .events import MIEventScraper
-from .people import MIPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import MICommitteeScraper
 
 
 class Michigan(State):
-    scrapers = {
-        "bills": MIBillScraper,
-        "events": MIEventScraper,
-        "people": MIPersonScraper,
-        # 'committees': MICommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:MIBillScraper",
+            "events": ".events:MIEventScraper",
+            "people": ".people:MIPersonScraper",
+            # 'committees': MICommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011-2012",
@@ -1,8 +1,4 @@
-from utils import url_xpath, State
-
-from .bills import MNBillScraper
-from .people import MNPersonScraper
-from .vote_events import MNVoteScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import MNCommitteeScraper
 # from .events import MNEventScraper
@@ -20,13 +16,16 @@ sense to get vote data from the bill pages.
 
 
 class Minnesota(State):
-    scrapers = {
-        "bills": MNBillScraper,
-        # "committees": MNCommitteeScraper,
-        "people": MNPersonScraper,
-        "votes": MNVoteScraper,
-        # "events": MNEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:MNBillScraper",
+            # "committees": MNCommitteeScraper,
+            "people": ".people:MNPersonScraper",
+            "votes": ".vote_events:MNVoteScraper",
+            # "events": MNEventScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "86th Legislature, 2009-2010",
@@ -1,20 +1,22 @@
-from utils import url_xpath, State
+from utils import url_xpath, State, LazyScrapers
 from .bills import MOBillScraper
 from .events import MOEventScraper
-from .people import MOPersonScraper
 
 # from .votes import MOVoteScraper
 # from .committees import MOCommitteeScraper
 
 
 class Missouri(State):
-    scrapers = {
-        #        'bills': MOBillScraper,
-        # 'votes': MOVoteScraper,
-        #        'events': MOEventScraper,
-        "people": MOPersonScraper,
-        # 'committees': MOCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            #        'bills': MOBillScraper,
+            # 'votes': MOVoteScraper,
+            #        'events': MOEventScraper,
+            "people": ".people:MOPersonScraper",
+            # 'committees': MOCommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2019 Regular Session",
@@ -6,7 +6,7 @@ import datetime as dt
 
 from utils import LXMLMixin
 
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 from openstates.scrape import Scraper, VoteEvent
 
 motion_re = r"(?i)On motion of .*, .*"
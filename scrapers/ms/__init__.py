@@ -1,17 +1,17 @@
-from utils import url_xpath, State
-
-from .people import MSLegislatorScraper
-from .bills import MSBillScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import MSCommitteeScraper
 
 
 class Mississippi(State):
-    scrapers = {
-        "people": MSLegislatorScraper,
-        # "committees": MSCommitteeScraper,
-        "bills": MSBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:MSLegislatorScraper",
+            # "committees": MSCommitteeScraper,
+            "bills": ".bills:MSBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2008 Regular Session",
@@ -1,5 +1,5 @@
 from openstates.scrape import Scraper, Bill, VoteEvent
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 from datetime import datetime
 from .utils import append_parens
 import lxml.etree
@@ -1,16 +1,17 @@
-from utils import url_xpath, State
-from .people import MTPersonScraper
-from .bills import MTBillScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import MTCommitteeScraper
 
 
 class Montana(State):
-    scrapers = {
-        "people": MTPersonScraper,
-        # 'committees': MTCommitteeScraper,
-        "bills": MTBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:MTPersonScraper",
+            # 'committees': MTCommitteeScraper,
+            "bills": ".bills:MTBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "20111",
@@ -8,7 +8,7 @@ from datetime import datetime
 from collections import defaultdict
 
 from openstates.scrape import Scraper, Bill, VoteEvent
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 from scrapelib import HTTPError
 
 import lxml.html
@@ -2,7 +2,7 @@
 import re
 from itertools import dropwhile
 from openstates.scrape import Organization, Scraper
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 
 
 committee_urls = {
@@ -1,17 +1,18 @@
 import lxml
-from utils import State
-from .people import NCPersonScraper
-from .bills import NCBillScraper
+from utils import State, LazyScrapers
 
 # from .committees import NCCommitteeScraper
 
 
 class NorthCarolina(State):
-    scrapers = {
-        "people": NCPersonScraper,
-        # 'committees': NCCommitteeScraper,
-        "bills": NCBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:NCPersonScraper",
+            # 'committees': NCCommitteeScraper,
+            "bills": ".bills:NCBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "1985-1986 Session",
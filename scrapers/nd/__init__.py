@@ -1,18 +1,18 @@
-from utils import State
-from .votes import NDVoteScraper
-from .people import NDPersonScraper
-from .bills import NDBillScraper
+from utils import State, LazyScrapers
 
 # from .committees import NDCommitteeScraper
 
 
 class NorthDakota(State):
-    scrapers = {
-        "people": NDPersonScraper,
-        "votes": NDVoteScraper,
-        # 'committees': NDCommitteeScraper,
-        "bills": NDBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:NDPersonScraper",
+            "votes": ".votes:NDVoteScraper",
+            # 'committees': NDCommitteeScraper,
+            "bills": ".bills:NDBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "62nd Legislative Assembly (2011-12)",
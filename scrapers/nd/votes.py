@@ -3,7 +3,7 @@ import re
 import datetime
 import requests.exceptions
 from utils import LXMLMixin
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 from openstates.scrape import Scraper, VoteEvent as Vote
 
 
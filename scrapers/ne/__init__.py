@@ -1,16 +1,17 @@
-from utils import url_xpath, State
-from .bills import NEBillScraper
-from .people import NEPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import NECommitteeScraper
 
 
 class Nebraska(State):
-    scrapers = {
-        "bills": NEBillScraper,
-        "people": NEPersonScraper,
-        # 'committees': NECommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:NEBillScraper",
+            "people": ".people:NEPersonScraper",
+            # 'committees': NECommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "102nd Legislature 1st and 2nd Sessions",
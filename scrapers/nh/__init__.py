@@ -1,17 +1,18 @@
 import datetime
-from utils import State
-from .people import NHPersonScraper
-from .bills import NHBillScraper
+from utils import State, LazyScrapers
 
 # from .committees import NHCommitteeScraper
 
 
 class NewHampshire(State):
-    scrapers = {
-        "people": NHPersonScraper,
-        # 'committees': NHCommitteeScraper,
-        "bills": NHBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:NHPersonScraper",
+            # 'committees': NHCommitteeScraper,
+            "bills": ".bills:NHBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "identifier": "2011",
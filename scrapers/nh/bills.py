@@ -69,38 +69,14 @@ class NHBillScraper(Scraper):
             self.output_names = ["1"]
             return
 
+        # the data files cover both chambers, so they're only fetched once
+        self.load_data_files(session)
+
         # bill basics
         self.bills = {}  # LSR->Bill
         self.bills_by_id = {}  # need a second table to attach votes
-        self.versions_by_lsr = {}  # mapping of bill ID to lsr
-        self.amendments_by_lsr = {}
-
-        # pre load the mapping table of LSR -> version id
-        self.scrape_version_ids()
-        self.scrape_amendments()
 
-        last_line = []
-        for line in (
-            self.get("http://gencourt.state.nh.us/dynamicdatafiles/LSRs.txt")
-            .content.decode("utf-8")
-            .split("\n")
-        ):
-            line = line.split("|")
-            if len(line) < 1:
-                continue
-
-            if len(line) < 36:
-                if len(last_line + line[1:]) == 36:
-                    # combine two lines for processing
-                    # (skip an empty entry at beginning of second line)
-                    line = last_line + line
-                    self.warning("used bad line")
-                else:
-                    # skip this line, maybe we'll use it later
-                    self.warning("bad line: %s" % "|".join(line))
-                    last_line = line
-                    continue
-            session_yr = line[0]
+        for line in self.lsrs:
             lsr = line[1]
             title = line[2]
             body = line[3]
@@ -108,7 +84,7 @@ class NHBillScraper(Scraper):
             expanded_bill_id = line[9]
             bill_id = line[10]
 
-            if body == body_code[chamber] and session_yr == session:
+            if body == body_code[chamber]:
                 if expanded_bill_id.startswith("CACR"):
                     bill_type = "constitutional amendment"
                 elif expanded_bill_id.startswith("PET"):
@@ -167,81 +143,32 @@ class NHBillScraper(Scraper):
 
                 self.bills_by_id[bill_id] = self.bills[lsr]
 
-        # load legislators
-        self.legislators = {}
-        for line in (
-            self.get(
-                "http://gencourt.state.nh.us/dynamicdatafiles/legislators.txt?x={}".format(
-                    self.cachebreaker
-                )
-            )
-            .content.decode("utf-8")
-            .split("\n")
-        ):
-            if len(line) < 2:
-                continue
-
-            line = line.split("|")
-            employee_num = line[0]
-
-            # first, last, middle
-            if len(line) > 2:
-                name = "%s %s %s" % (line[2], line[3], line[1])
-            else:
-                name = "%s %s" % (line[2], line[1])
-
-            self.legislators[employee_num] = {"name": name, "seat": line[5]}
-            # body = line[4]
-
         # sponsors
-        for line in (
-            self.get("http://gencourt.state.nh.us/dynamicdatafiles/LsrSponsors.txt")
-            .content.decode("utf-8")
-            .split("\n")
-        ):
-            if len(line) < 1:
-                continue
-
-            session_yr, lsr, _seq, employee, primary = line.strip().split("|")
-
-            if session_yr == session and lsr in self.bills:
+        for lsr, bill in self.bills.items():
+            for employee, primary in self.sponsors_by_lsr.get(lsr, ()):
                 sp_type = "primary" if primary == "1" else "cosponsor"
                 try:
                     # Removes extra spaces in names
                     sponsor_name = self.legislators[employee]["name"].strip()
                     sponsor_name = " ".join(sponsor_name.split())
-                    self.bills[lsr].add_sponsorship(
+                    bill.add_sponsorship(
                         classification=sp_type,
                         name=sponsor_name,
                         entity_type="person",
                         primary=True if sp_type == "primary" else False,
                     )
-                    self.bills[lsr].extras = {
-                        "_code": self.legislators[employee]["seat"]
-                    }
+                    bill.extras = {"_code": self.legislators[employee]["seat"]}
                 except KeyError:
                     self.warning("Error, can't find person %s" % employee)
 
         # actions
-        for line in (
-            self.get("http://gencourt.state.nh.us/dynamicdatafiles/Docket.txt")
-            .content.decode("utf-8")
-            .split("\n")
-        ):
-            if len(line) < 1:
-                continue
-            # a few blank/irregular lines, irritating
-            if "|" not in line:
-                continue
-
-            (session_yr, lsr, timestamp, bill_id, body, action, _) = line.split("|")
-
-            if session_yr == session and lsr in self.bills:
+        for lsr, bill in self.bills.items():
+            for timestamp, body, action in self.actions_by_lsr.get(lsr, ()):
                 actor = "lower" if body == "H" else "upper"
                 time = dt.datetime.strptime(timestamp, "%m/%d/%Y %H:%M:%S %p")
                 action = action.strip()
                 atype = classify_action(action)
-                self.bills[lsr].add_action(
+                bill.add_action(
                     chamber=actor,
                     description=action,
                     date=time.strftime("%Y-%m-%d"),
@@ -249,7 +176,7 @@ class NHBillScraper(Scraper):
                 )
                 amendment_id = extract_amendment_id(action)
                 if amendment_id:
-                    self.bills[lsr].add_document_link(
+                    bill.add_document_link(
                         note="amendment %s" % amendment_id,
                         url=AMENDMENT_URL % amendment_id,
                         on_duplicate='ignore'
@@ -263,6 +190,108 @@ class NHBillScraper(Scraper):
             self.add_source(self.bills[bill], bill, session)
             yield self.bills[bill]
 
+    def iter_lines(self, url, universal=False):
+        """Yield the lines of a data file as it downloads, split the same way
+        as ``.content.decode("utf-8").split("\\n")``, or with ``universal``
+        as ``.content.decode("utf-8").splitlines()``.
+        """
+        response = self.get(url, stream=True)
+        response.encoding = "utf-8"
+        pending = ""
+        for chunk in response.iter_content(chunk_size=65536, decode_unicode=True):
+            pending += chunk
+            if universal:
+                # the last line may be incomplete, or a \r whose \n is to come
+                *lines, pending = pending.splitlines(True) or [""]
+                for line in lines:
+                    yield line.splitlines()[0]
+            else:
+                *lines, pending = pending.split("\n")
+                yield from lines
+        if universal:
+            yield from pending.splitlines()
+        else:
+            yield pending
+
+    def load_data_files(self, session):
+        """
+        Download and index the dynamic data files for ``session``: LSR rows,
+        legislators by employee number, sponsors and actions by LSR, and
+        roll calls. Only done once per scrape.
+        """
+        if getattr(self, "data_files_session", None) == session:
+            return
+
+        # pre load the mapping table of LSR -> version id
+        self.versions_by_lsr = {}
+        self.scrape_version_ids()
+
+        self.amendments_by_lsr = {}
+        self.actions_by_lsr = defaultdict(list)
+        self.scrape_docket(session)
+
+        # LSR rows for the session, in file order
+        self.lsrs = []
+        last_line = []
+        for line in self.iter_lines(
+            "http://gencourt.state.nh.us/dynamicdatafiles/LSRs.txt"
+        ):
+            line = line.split("|")
+            if len(line) < 1:
+                continue
+
+            if len(line) < 36:
+                if len(last_line + line[1:]) == 36:
+                    # combine two lines for processing
+                    # (skip an empty entry at beginning of second line)
+                    line = last_line + line
+                    self.warning("used bad line")
+                else:
+                    # skip this line, maybe we'll use it later
+                    self.warning("bad line: %s" % "|".join(line))
+                    last_line = line
+                    continue
+            if line[0] == session:
+                self.lsrs.append(line)
+
+        # load legislators
+        self.legislators = {}
+        for line in self.iter_lines(
+            "http://gencourt.state.nh.us/dynamicdatafiles/legislators.txt?x={}".format(
+                self.cachebreaker
+            )
+        ):
+            if len(line) < 2:
+                continue
+
+            line = line.split("|")
+            employee_num = line[0]
+
+            # first, last, middle
+            if len(line) > 2:
+                name = "%s %s %s" % (line[2], line[3], line[1])
+            else:
+                name = "%s %s" % (line[2], line[1])
+
+            self.legislators[employee_num] = {"name": name, "seat": line[5]}
+            # body = line[4]
+
+        # sponsors
+        self.sponsors_by_lsr = defaultdict(list)
+        for line in self.iter_lines(
+            "http://gencourt.state.nh.us/dynamicdatafiles/LsrSponsors.txt"
+        ):
+            if len(line) < 1:
+                continue
+
+            session_yr, lsr, _seq, employee, primary = line.strip().split("|")
+
+            if session_yr == session:
+                self.sponsors_by_lsr[lsr].append((employee, primary))
+
+        self.load_roll_calls(session)
+        self.data_files_session = session
+
     def add_source(self, bill, lsr, session):
         bill_url = (
             "http://www.gencourt.state.nh.us/bill_Status/bill_status.aspx?"
@@ -272,10 +301,8 @@ class NHBillScraper(Scraper):
 
     def scrape_version_ids(self):
 
-        for line in (
-            self.get("http://gencourt.state.nh.us/dynamicdatafiles/LsrsOnly.txt")
-            .content.decode("utf-8")
-            .split("\n")
+        for line in self.iter_lines(
+            "http://gencourt.state.nh.us/dynamicdatafiles/LsrsOnly.txt"
         ):
             if len(line) < 1:
                 continue
@@ -289,11 +316,11 @@ class NHBillScraper(Scraper):
             lsr = lsr[1]
             self.versions_by_lsr[lsr] = file_id
 
-    def scrape_amendments(self):
-        for line in (
-            self.get("http://gencourt.state.nh.us/dynamicdatafiles/Docket.txt")
-            .content.decode("utf-8")
-            .split("\n")
+    def scrape_docket(self, session):
+        amendment_regex = re.compile(r"Amendment # (\d{4}-\d+\w)", re.IGNORECASE)
+
+        for line in self.iter_lines(
+            "http://gencourt.state.nh.us/dynamicdatafiles/Docket.txt"
         ):
             if len(line) < 1:
                 continue
@@ -301,22 +328,20 @@ class NHBillScraper(Scraper):
             if "|" not in line:
                 continue
 
-            line = line.split("|")
-            lsr = line[1]
-
-            amendment_regex = re.compile(r"Amendment # (\d{4}-\d+\w)", re.IGNORECASE)
+            (session_yr, lsr, timestamp, bill_id, body, action, _) = line.split("|")
 
-            for match in amendment_regex.finditer(line[5]):
+            for match in amendment_regex.finditer(action):
                 self.amendments_by_lsr[lsr] = match.group(1)
 
-    def scrape_votes(self, session):
-        votes = {}
-        other_counts = defaultdict(int)
+            if session_yr == session:
+                self.actions_by_lsr[lsr].append((timestamp, body, action))
+
+    def load_roll_calls(self, session):
+        self.roll_calls = []
         last_line = []
         vote_url = "http://gencourt.state.nh.us/dynamicdatafiles/RollCallSummary.txt"
-        lines = self.get(vote_url).content.decode("utf-8").splitlines()
 
-        for line in lines:
+        for line in self.iter_lines(vote_url, universal=True):
 
             if len(line) < 2:
                 continue
@@ -343,7 +368,45 @@ class NHBillScraper(Scraper):
             # absent = int(line[8])
             motion = line[11].strip() or "[not available]"
 
-            if session_yr == session and bill_id in self.bills_by_id:
+            if session_yr == session:
+                self.roll_calls.append(
+                    (session_yr, body, vote_num, timestamp, bill_id, yeas, nays, motion)
+                )
+
+        self.roll_call_votes = []
+        for line in self.iter_lines(
+            "http://gencourt.state.nh.us/dynamicdatafiles/RollCallHistory.txt",
+            universal=True,
+        ):
+            if len(line) < 2:
+                continue
+
+            # 2016|H|2|330795||Yea|
+            # 2012    | H   | 2    | 330795  | 964 |  HB309  | Yea | 1/4/2012 8:27:03 PM
+            session_yr, body, v_num, _, employee, bill_id, vote, date = line.split("|")
+
+            if not bill_id:
+                continue
+
+            if session_yr == session:
+                self.roll_call_votes.append((body, v_num, employee, bill_id, vote))
+
+    def scrape_votes(self, session):
+        votes = {}
+        other_counts = defaultdict(int)
+        vote_url = "http://gencourt.state.nh.us/dynamicdatafiles/RollCallSummary.txt"
+
+        for (
+            session_yr,
+            body,
+            vote_num,
+            timestamp,
+            bill_id,
+            yeas,
+            nays,
+            motion,
+        ) in self.roll_calls:
+            if bill_id in self.bills_by_id:
                 actor = "lower" if body == "H" else "upper"
                 time = dt.datetime.strptime(timestamp, "%m/%d/%Y %I:%M:%S %p")
                 time = pytz.timezone("America/New_York").localize(time).isoformat()
@@ -363,22 +426,8 @@ class NHBillScraper(Scraper):
                 vote.pupa_id = session_yr + body + vote_num  # unique ID for vote
                 votes[body + vote_num] = vote
 
-        for line in (
-            self.get("http://gencourt.state.nh.us/dynamicdatafiles/RollCallHistory.txt")
-            .content.decode("utf-8")
-            .splitlines()
-        ):
-            if len(line) < 2:
-                continue
-
-            # 2016|H|2|330795||Yea|
-            # 2012    | H   | 2    | 330795  | 964 |  HB309  | Yea | 1/4/2012 8:27:03 PM
-            session_yr, body, v_num, _, employee, bill_id, vote, date = line.split("|")
-
-            if not bill_id:
-                continue
-
-            if session_yr == session and bill_id.strip() in self.bills_by_id:
+        for body, v_num, employee, bill_id, vote in self.roll_call_votes:
+            if bill_id.strip() in self.bills_by_id:
                 try:
                     leg = " ".join(self.legislators[employee]["name"].split())
                 except KeyError:
@@ -1,8 +1,7 @@
 import re
 import csv
 from openstates.scrape import Person, Scraper
-from utils import LXMLMixin
-import requests
+from utils import LXMLMixin, http
 
 
 class NHPersonScraper(Scraper, LXMLMixin):
@@ -123,7 +122,7 @@ class NHPersonScraper(Scraper, LXMLMixin):
         return person
 
     def _parse_members_txt(self):
-        response = requests.get(self.members_url)
+        response = http.get(self.members_url)
         lines = csv.reader(response.text.strip().split("\n"), delimiter=",")
 
         header = next(lines)
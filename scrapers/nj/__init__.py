@@ -1,7 +1,4 @@
-from utils import url_xpath, State
-from .bills import NJBillScraper
-from .events import NJEventScraper
-from .people import NJPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import NJCommitteeScraper
 
@@ -10,12 +7,15 @@ settings = dict(SCRAPELIB_RETRY_ATTEMPTS=0)
 
 
 class NewJersey(State):
-    scrapers = {
-        "bills": NJBillScraper,
-        "events": NJEventScraper,
-        "people": NJPersonScraper,
-        # 'committees': NJCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:NJBillScraper",
+            "events": ".events:NJEventScraper",
+            "people": ".people:NJPersonScraper",
+            # 'committees': NJCommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2008-2009",
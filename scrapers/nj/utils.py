@@ -1,8 +1,8 @@
 import os
 import re
-import csv
 import zipfile
-import subprocess
+
+from utils.mdb import AccessDatabase
 
 
 def clean_committee_name(comm_name):
@@ -36,11 +36,9 @@ class MDBMixin(object):
             fname, resp = self.urlretrieve(url)
             self.mdbfile = fname
             self.info("mdb filename = " + fname)
+        self.mdb = AccessDatabase(self.mdbfile, source=url)
 
     # stolen from nm/bills.py
     def access_to_csv(self, table):
-        """ using mdbtools, read access tables as CSV """
-        commands = ["mdb-export", self.mdbfile, table]
-        pipe = subprocess.Popen(commands, stdout=subprocess.PIPE, close_fds=True).stdout
-        csvfile = csv.DictReader(line.decode() for line in pipe)
-        return csvfile
+        """ using mdbtools, read access tables as dicts """
+        return self.mdb.rows(table)
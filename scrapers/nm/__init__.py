@@ -1,18 +1,18 @@
-from utils import url_xpath, State
-from .people import NMPersonScraper
-from .bills import NMBillScraper
-from .votes import NMVoteScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import NMCommitteeScraper
 
 
 class NewMexico(State):
-    scrapers = {
-        "people": NMPersonScraper,
-        # 'committees': NMCommitteeScraper,
-        "bills": NMBillScraper,
-        "votes": NMVoteScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:NMPersonScraper",
+            # 'committees': NMCommitteeScraper,
+            "bills": ".bills:NMBillScraper",
+            "votes": ".votes:NMVoteScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011 Regular",
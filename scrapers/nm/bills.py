@@ -1,8 +1,6 @@
 import os
 import re
-import csv
 import zipfile
-import subprocess
 from datetime import datetime
 
 import lxml.html
@@ -10,6 +8,8 @@ import lxml.etree
 
 from openstates.scrape import Scraper, Bill
 
+from utils.mdb import AccessDatabase
+
 
 def session_slug(session):
     session_type = "Special" if session.endswith("S") else "Regular"
@@ -49,16 +49,15 @@ class NMBillScraper(Scraper):
             zf = zipfile.ZipFile(fname)
             zf.extract(self.mdbfile)
             os.remove(fname)
+            self.mdb = AccessDatabase(self.mdbfile, source=ftp_base + mdbfile)
 
-    def access_to_csv(self, table):
-        """ using mdbtools, read access tables as CSV """
-        commands = ["mdb-export", self.mdbfile, table]
+    def access_to_csv(self, table, column=None, prefix=None):
+        """ using mdbtools, read access tables (or the rows of one where
+        column starts with prefix) as dicts """
         try:
-            pipe = subprocess.Popen(
-                commands, stdout=subprocess.PIPE, close_fds=True
-            ).stdout
-            csvfile = csv.DictReader([line.decode("utf8") for line in pipe.readlines()])
-            return csvfile
+            if column:
+                return self.mdb.startswith(table, column, prefix)
+            return self.mdb.rows(table)
         except OSError:
             self.warning("Failed to read mdb file. Have you installed " "'mdbtools' ?")
             raise
@@ -107,11 +106,7 @@ class NMBillScraper(Scraper):
 
         # get all bills into this dict, fill in action/docs before saving
         bills = {}
-        for data in [
-            row
-            for row in self.access_to_csv("Legislation")
-            if row["BillID"].startswith(chamber_letter)
-        ]:
+        for data in self.access_to_csv("Legislation", "BillID", chamber_letter):
             # use their BillID for the key but build our own for storage
             bill_key = data["BillID"].replace(" ", "")
 
@@ -394,11 +389,7 @@ class NMBillScraper(Scraper):
         # these actions need a committee name spliced in
         actions_with_committee = ("SENT", "7650", "7654")
 
-        for action in [
-            row
-            for row in self.access_to_csv("Actions")
-            if row["BillID"].startswith(chamber_letter)
-        ]:
+        for action in self.access_to_csv("Actions", "BillID", chamber_letter):
             bill_key = action["BillID"].replace(" ", "")
 
             if bill_key not in bills:
@@ -9,7 +9,7 @@ import lxml.etree
 import scrapelib
 
 from openstates.scrape import Scraper, VoteEvent
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 
 # Senate vote header
 s_vote_header = re.compile(r"(YES)|(NO)|(ABS)|(EXC)|(REC)")
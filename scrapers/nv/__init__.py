@@ -1,18 +1,18 @@
-from utils import url_xpath, State
-from .people import NVPeopleScraper
-from .bills import NVBillScraper
-from .events import NVEventScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import NVCommitteeScraper
 
 
 class Nevada(State):
-    scrapers = {
-        "people": NVPeopleScraper,
-        # 'committees': NVCommitteeScraper,
-        "bills": NVBillScraper,
-        "events": NVEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:NVPeopleScraper",
+            # 'committees': NVCommitteeScraper,
+            "bills": ".bills:NVBillScraper",
+            "events": ".events:NVEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "26th (2010) Special Session",
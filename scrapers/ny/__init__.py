@@ -1,22 +1,20 @@
-from utils import url_xpath, State
-
-from .bills import NYBillScraper
-from .events import NYEventScraper
-from .people import NYPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import NYCommitteeScraper
 
-
 settings = dict(SCRAPELIB_TIMEOUT=120)
 
 
 class NewYork(State):
-    scrapers = {
-        "bills": NYBillScraper,
-        "events": NYEventScraper,
-        "people": NYPersonScraper,
-        # 'committees': NYCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:NYBillScraper",
+            "events": ".events:NYEventScraper",
+            "people": ".people:NYPersonScraper",
+            # 'committees': NYCommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009",
@@ -4,7 +4,7 @@ from itertools import chain
 
 from openstates.scrape import Person, Scraper
 from utils import LXMLMixin, validate_phone_number
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 
 
 class NYPersonScraper(Scraper, LXMLMixin):
@@ -2,7 +2,7 @@ import collections
 
 import lxml.html
 
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 
 
 class CachedAttr(object):
@@ -1,16 +1,17 @@
-from utils import url_xpath, State
-from .people import OHLegislatorScraper
-from .bills import OHBillScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .events import OHEventScraper
 
 
 class Ohio(State):
-    scrapers = {
-        "people": OHLegislatorScraper,
-        # 'events': OHEventScraper,
-        "bills": OHBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:OHLegislatorScraper",
+            # 'events': OHEventScraper,
+            "bills": ".bills:OHBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "128",
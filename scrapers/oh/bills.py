@@ -3,6 +3,9 @@ import datetime
 
 from openstates.scrape import Scraper, Bill, VoteEvent
 from openstates.scrape.base import ScrapeError
+from utils.incremental import HighWaterMark, IncrementalMixin
+from utils.pagination import paginate
+from utils.parallel import ParallelFetchMixin
 
 import xlrd
 import scrapelib
@@ -11,7 +14,7 @@ import pytz
 import re
 
 
-class OHBillScraper(Scraper):
+class OHBillScraper(IncrementalMixin, ParallelFetchMixin, Scraper):
     _tz = pytz.timezone("US/Eastern")
 
     # Vote Motion Dictionary was created by comparing vote codes to
@@ -43,14 +46,20 @@ class OHBillScraper(Scraper):
         "amend_452": "Amended",
     }
 
-    def scrape(self, session=None, chambers=None):
-        # Bills endpoint can sometimes take a very long time to load
-        self.timeout = 300
-
+    # since=last|1d6h|2021-03-01 only scrapes bills with actions since then
+    # (131st GA on), see utils.incremental
+    def scrape(self, session=None, chambers=None, since=None):
         if not session:
             session = self.latest_session()
             self.info("no session, using %s", session)
 
+        with HighWaterMark(self, session, since) as mark:
+            yield from self.scrape_session(session, mark)
+
+    def scrape_session(self, session, mark):
+        # Bills endpoint can sometimes take a very long time to load
+        self.timeout = 300
+
         if int(session) < 128:
             raise AssertionError("No data for period {}".format(session))
 
@@ -237,6 +246,7 @@ class OHBillScraper(Scraper):
                         primary=False,
                     )
 
+                last_action = None
                 try:
                     action_doc = self.get(base_url + bill_version["action"][0]["link"])
                 except scrapelib.HTTPError:
@@ -262,12 +272,19 @@ class OHBillScraper(Scraper):
                                 action["datetime"], "%Y-%m-%dT%H:%M:%S"
                             )
                         )
+                        last_action = max(last_action or date, date)
                         date = "{:%Y-%m-%d}".format(date)
 
                         bill.add_action(
                             action_desc, date, chamber=actor, classification=action_type
                         )
 
+                # the search results carry no dates, so the action dates are
+                # the first change information there is; skip the votes, veto
+                # and disapprove lookups (and the bill) if there's nothing new
+                if not mark.changed(dates=[last_action], tz=self._tz):
+                    continue
+
                 # attach documents gathered earlier
                 self.add_document(all_amendments, bill_id, "amendment", bill, base_url)
                 self.add_document(all_fiscals, bill_id, "fiscal", bill, base_url)
@@ -357,31 +374,31 @@ class OHBillScraper(Scraper):
                 yield bill
 
     def pages(self, base_url, first_page):
-        page = self.get(first_page)
-        page = page.json()
-        yield page
-        while "nextLink" in page:
-            page = self.get(base_url + page["nextLink"])
-            page = page.json()
-            yield page
-
-    def get_bill_rows(self, session, start=1):
+        def next_url(url, page):
+            return base_url + page["nextLink"] if "nextLink" in page else None
+
+        return paginate(lambda url: self.get(url).json(), first_page, next_url)
+
+    def get_bill_rows(self, session):
         # bill API endpoint times out so we're now getting this from the normal search
-        bill_url = (
-            "https://www.legislature.ohio.gov/legislation/search?pageSize=500&start={}&"
-            "sort=LegislationNumber&dir=asc&statusCode&generalAssemblies={}"
-            "&legislationTypes=HR,HB,SR,SB,HCR,SCR,HJR,SJR".format(start, session)
-        )
-        doc = self.get(bill_url)
-        doc = lxml.html.fromstring(doc.text)
-        doc.make_links_absolute(bill_url)
-
-        rows = doc.xpath("//tr")[1:]
-        yield from rows
-        if len(rows) == 500:
-            yield from self.get_bill_rows(session, start + 500)
+        def fetch(start):
+            bill_url = (
+                "https://www.legislature.ohio.gov/legislation/search?pageSize=500&start={}&"
+                "sort=LegislationNumber&dir=asc&statusCode&generalAssemblies={}"
+                "&legislationTypes=HR,HB,SR,SB,HCR,SCR,HJR,SJR".format(start, session)
+            )
+            doc = self.get(bill_url)
+            doc = lxml.html.fromstring(doc.text)
+            doc.make_links_absolute(bill_url)
+            return doc.xpath("//tr")[1:]
+
         # if page is full, get next page - could use pagination info in
         # //div[id="searchResultsInfo"] to improve this
+        def next_start(start, rows):
+            return start + 500 if len(rows) == 500 else None
+
+        for rows in paginate(fetch, 1, next_start):
+            yield from rows
 
     def get_other_data_source(self, first_page, base_url, source_name):
         # produces a dictionary from bill_id to a list of
@@ -5,7 +5,7 @@ import re
 import pytz
 
 from openstates.scrape import Scraper, Event
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 
 
 class OHEventScraper(Scraper):
@@ -1,18 +1,19 @@
-from utils import State
-from .people import OKPersonScraper
-from .bills import OKBillScraper
+from utils import State, LazyScrapers
 
 # from .committees import OKCommitteeScraper
 # from .events import OKEventScraper
 
 
 class Oklahoma(State):
-    scrapers = {
-        "people": OKPersonScraper,
-        # 'committees': OKCommitteeScraper,
-        # 'events': OKEventScraper,
-        "bills": OKBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:OKPersonScraper",
+            # 'committees': OKCommitteeScraper,
+            # 'events': OKEventScraper,
+            "bills": ".bills:OKBillScraper",
+        },
+    )
     # Sessions are named on OK's website as "{odd year} regular session" until the even year,
     # when all data rolls over. For example, even year sessions include all odd-year-session bills.
     # We have opted to name sessions {odd-even} Regular Session and treat them as such.
@@ -1,20 +1,19 @@
-from utils import State
-from .people import ORPersonScraper
-from .bills import ORBillScraper
-from .votes import ORVoteScraper
-from .events import OREventScraper
+from utils import State, LazyScrapers
 
 # from .committees import ORCommitteeScraper
 
 
 class Oregon(State):
-    scrapers = {
-        "people": ORPersonScraper,
-        # 'committees': ORCommitteeScraper,
-        "bills": ORBillScraper,
-        "votes": ORVoteScraper,
-        "events": OREventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:ORPersonScraper",
+            # 'committees': ORCommitteeScraper,
+            "bills": ".bills:ORBillScraper",
+            "votes": ".votes:ORVoteScraper",
+            "events": ".events:OREventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2007 Regular Session",
@@ -4,12 +4,19 @@ import re
 
 from openstates.scrape import Scraper, Bill
 from .apiclient import OregonLegislatorODataClient
-from .utils import index_legislators, get_timezone, url_fix, SESSION_KEYS
+from utils.incremental import HighWaterMark, IncrementalMixin
+from .utils import (
+    index_legislators,
+    get_timezone,
+    last_modified,
+    url_fix,
+    SESSION_KEYS,
+)
 
 logger = logging.getLogger("openstates")
 
 
-class ORBillScraper(Scraper):
+class ORBillScraper(IncrementalMixin, Scraper):
     tz = get_timezone()
 
     bill_types = {
@@ -41,14 +48,17 @@ class ORBillScraper(Scraper):
         (r".*Read\. .* Adopted.*", ["passage"]),
     )
 
-    def scrape(self, session=None):
+    # since=last|1d6h|2021-03-01 only scrapes measures changed since then,
+    # see utils.incremental
+    def scrape(self, session=None, since=None):
         self.api_client = OregonLegislatorODataClient(self)
         if not session:
             session = self.latest_session()
 
-        yield from self.scrape_bills(session)
+        with HighWaterMark(self, session, since) as mark:
+            yield from self.scrape_bills(session, mark)
 
-    def scrape_bills(self, session):
+    def scrape_bills(self, session, mark=None):
         session_key = SESSION_KEYS[session]
         measures_response = self.api_client.get(
             "measures", page=500, session=session_key
@@ -57,6 +67,9 @@ class ORBillScraper(Scraper):
         legislators = index_legislators(self, session_key)
 
         for measure in measures_response:
+            if mark and not mark.changed(last_modified(measure), tz=self.tz):
+                continue
+
             bid = "{} {}".format(measure["MeasurePrefix"], measure["MeasureNumber"])
 
             chamber = self.chamber_code[bid[0]]
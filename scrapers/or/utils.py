@@ -1,21 +1,57 @@
+import datetime
 import pytz
 import urllib.parse
 
+from utils.incremental import to_utc
+from utils.legislators import LegislatorDirectory
+
 
 def index_legislators(scraper, session_key):
     """
     Get the full name of legislators. The membership API only returns a "LegislatorCode".
     This will cross-reference the name.
+
+    The names are kept in the shared legislator directory, so the bill,
+    vote and committee scrapers fetch them once between them.
     """
-    legislators_response = scraper.api_client.get("legislators", session=session_key)
 
-    legislators = {}
-    for leg in legislators_response:
-        legislators[leg["LegislatorCode"]] = "{} {}".format(
-            leg["FirstName"], leg["LastName"]
+    def fetch():
+        legislators_response = scraper.api_client.get(
+            "legislators", session=session_key
         )
+        for leg in legislators_response:
+            yield leg["LegislatorCode"], "{} {}".format(
+                leg["FirstName"], leg["LastName"]
+            )
+
+    return LegislatorDirectory("or", session_key).populate(fetch)
 
-    return legislators
+
+def last_modified(record):
+    """The latest CreatedDate/ModifiedDate anywhere in an API record,
+    including the related records expanded into it, in UTC, or None.
+    Dates without an offset are taken to be Pacific time.
+    """
+    latest = None
+    if isinstance(record, list):
+        for item in record:
+            when = last_modified(item)
+            if when and (latest is None or when > latest):
+                latest = when
+    elif isinstance(record, dict):
+        for key, value in record.items():
+            if key in ("CreatedDate", "ModifiedDate") and isinstance(value, str):
+                try:
+                    when = to_utc(
+                        datetime.datetime.fromisoformat(value), get_timezone()
+                    )
+                except ValueError:
+                    continue
+            else:
+                when = last_modified(value)
+            if when and (latest is None or when > latest):
+                latest = when
+    return latest
 
 
 def get_timezone():
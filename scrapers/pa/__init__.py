@@ -1,7 +1,4 @@
-from utils import url_xpath, State
-from .bills import PABillScraper
-from .events import PAEventScraper
-from .people import PALegislatorScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import PACommitteeScraper
 
@@ -9,12 +6,15 @@ settings = {"SCRAPELIB_RPM": 30}
 
 
 class Pennsylvania(State):
-    scrapers = {
-        "bills": PABillScraper,
-        "events": PAEventScraper,
-        "people": PALegislatorScraper,
-        # 'committees': PACommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:PABillScraper",
+            "events": ".events:PAEventScraper",
+            "people": ".people:PALegislatorScraper",
+            # 'committees': PACommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009-2010 Regular Session",
@@ -1,6 +1,4 @@
-from utils import State
-from .people import PRPersonScraper
-from .bills import PRBillScraper
+from utils import State, LazyScrapers
 
 # from .committees import PRCommitteeScraper
 
@@ -8,11 +6,14 @@ settings = dict(SCRAPELIB_TIMEOUT=300)
 
 
 class PuertoRico(State):
-    scrapers = {
-        "people": PRPersonScraper,
-        # 'committees': PRCommitteeScraper,
-        "bills": PRBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:PRPersonScraper",
+            # 'committees': PRCommitteeScraper,
+            "bills": ".bills:PRBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009-2012",
@@ -6,6 +6,7 @@ import math
 import requests
 import pytz
 from openstates.scrape import Scraper, Bill, VoteEvent as Vote
+from utils.webforms import WebForm
 
 
 class NoSuchBill(Exception):
@@ -46,11 +47,11 @@ _classifiers = (
 
 class PRBillScraper(Scraper):
     _TZ = pytz.timezone("America/Puerto_Rico")
-    s = requests.Session()
+    # the search form, which carries the event validation code
+    # from each page of results to the next for paginating
+    search = None
 
-    # keep a reference to the last search results page
-    # so we can scrape the right event validation code
-    # for paginating
+    # and the last page of results
     last_page = None
 
     bill_types = {
@@ -62,41 +63,31 @@ class PRBillScraper(Scraper):
         # 'PR': 'plan de reorganizacion',
     }
 
-    def asp_post(self, url, params, page=None):
-        headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/79.0.3945.117 Safari/537.36",
-            "referer": url,
-            "origin": "https://sutra.oslpr.org",
-            "authority": "sutra.oslpr.org",
-        }
-
-        if page is None:
-            page = self.s.get(url, headers=headers)
-            page = lxml.html.fromstring(page.content)
-
-        (viewstate,) = page.xpath('//input[@id="__VIEWSTATE"]/@value')
-        (viewstategenerator,) = page.xpath('//input[@id="__VIEWSTATEGENERATOR"]/@value')
-        (eventvalidation,) = page.xpath('//input[@id="__EVENTVALIDATION"]/@value')
-
-        form = {
-            "__VIEWSTATE": viewstate,
-            "__VIEWSTATEGENERATOR": viewstategenerator,
-            "__EVENTVALIDATION": eventvalidation,
-            "__LASTFOCUS": "",
-            "__SCROLLPOSITIONX": "0",
-            "__SCROLLPOSITIONY": "453",
-        }
-
-        form = {**form, **params}
-
-        cookie_obj = requests.cookies.create_cookie(
-            domain="sutra.oslpr.org", name="SUTRASplash", value="NoSplash"
+    def search_form(self, url):
+        form = WebForm(
+            self,
+            url,
+            headers={
+                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/79.0.3945.117 Safari/537.36",
+                "referer": url,
+                "origin": "https://sutra.oslpr.org",
+                "authority": "sutra.oslpr.org",
+            },
         )
-        self.s.cookies.set_cookie(cookie_obj)
+        self.cookies.set_cookie(
+            requests.cookies.create_cookie(
+                domain="sutra.oslpr.org", name="SUTRASplash", value="NoSplash"
+            )
+        )
+        form.get()
+        return form
 
-        xml = self.s.post(url, data=form, headers=headers).text
-        return xml
+    def asp_post(self, form, params):
+        form.fields.update(
+            {"__LASTFOCUS": "", "__SCROLLPOSITIONX": "0", "__SCROLLPOSITIONY": "453"}
+        )
+        return form.post(params).text
 
     def clean_name(self, name):
         for ch in ["Sr,", "Sr.", "Sra.", "Rep.", "Sen."]:
@@ -196,6 +187,9 @@ class PRBillScraper(Scraper):
         # required for page 1, we need a copy of the dict to set Buscar for just this page
         first_scrape_params = params.copy()
         first_scrape_params["ctl00$CPHBody$btnFilter"] = "Buscar"
+        self.search = self.search_form(
+            "https://sutra.oslpr.org/osl/esutra/MedidaBus.aspx"
+        )
         yield from self.scrape_search_results(chamber, session, first_scrape_params)
 
         page = self.last_page
@@ -227,14 +221,10 @@ class PRBillScraper(Scraper):
                     chamber, page_number, max_page, page_str, page_field
                 )
             )
-            yield from self.scrape_search_results(
-                chamber, session, params, self.last_page
-            )
+            yield from self.scrape_search_results(chamber, session, params)
 
-    def scrape_search_results(self, chamber, session, params, page=None):
-        resp = self.asp_post(
-            "https://sutra.oslpr.org/osl/esutra/MedidaBus.aspx", params, page
-        )
+    def scrape_search_results(self, chamber, session, params):
+        resp = self.asp_post(self.search, params)
         page = lxml.html.fromstring(resp)
         self.last_page = page
 
@@ -1,19 +1,19 @@
-from utils import url_xpath, State
-
-from .bills import RIBillScraper
-from .people import RIPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .events import RIEventScraper
 # from .committees import RICommitteeScraper
 
 
 class RhodeIsland(State):
-    scrapers = {
-        "bills": RIBillScraper,
-        # 'events': RIEventScraper,
-        "people": RIPersonScraper,
-        # 'committees': RICommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:RIBillScraper",
+            # 'events': RIEventScraper,
+            "people": ".people:RIPersonScraper",
+            # 'committees': RICommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2012",
@@ -1,17 +1,16 @@
-from .people import SCPersonScraper
-from .bills import SCBillScraper
-from .events import SCEventScraper
-from utils import State
-import requests
+from utils import State, LazyScrapers, http
 import lxml.html
 
 
 class SouthCarolina(State):
-    scrapers = {
-        "people": SCPersonScraper,
-        "bills": SCBillScraper,
-        "events": SCEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:SCPersonScraper",
+            "bills": ".bills:SCBillScraper",
+            "events": ".events:SCEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "119 - (2011-2012)",
@@ -80,5 +79,5 @@ class SouthCarolina(State):
         url = "http://www.scstatehouse.gov/billsearch.php"
         path = "//select[@id='session']/option/text()"
 
-        doc = lxml.html.fromstring(requests.get(url).text)
+        doc = lxml.html.fromstring(http.get(url).text)
         return doc.xpath(path)
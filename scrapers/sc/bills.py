@@ -4,41 +4,13 @@ import datetime
 import os
 import re
 from collections import defaultdict
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 
 from openstates.scrape import Scraper, Bill, VoteEvent
-from openstates.utils import convert_pdf
+from utils.http import HTTP10Adapter
+from utils.parallel import ParallelFetchMixin
+from utils.pdf import convert_pdf
 import lxml.html
-import urllib
-
-# Workaround to prevent chunking error (thanks @showerst)
-#
-# @see https://stackoverflow.com/a/37818792/1858091
-import http.client
-
-_HTTP_VSN = http.client.HTTPConnection._http_vsn
-_HTTP_VSN_STR = http.client.HTTPConnection._http_vsn_str
-
-
-def downgrade_http_version():
-    http.client.HTTPConnection._http_vsn = 10
-    http.client.HTTPConnection._http_vsn_str = "HTTP/1.0"
-
-
-def undo_downgrade_http_version():
-    http.client.HTTPConnection._http_vsn = _HTTP_VSN
-    http.client.HTTPConnection._http_vsn_str = _HTTP_VSN_STR
-
-
-def toggle_http_version(method):
-    @wraps(method)
-    def wrapper(self, *args, **kwargs):
-        downgrade_http_version()
-        response = method(self, *args, **kwargs)
-        undo_downgrade_http_version()
-        return response
-
-    return wrapper
 
 
 def action_type(action):
@@ -90,7 +62,7 @@ def action_type(action):
     return None
 
 
-class SCBillScraper(Scraper):
+class SCBillScraper(ParallelFetchMixin, Scraper):
     """
      Bill scraper that pulls down all legislatition on from sc website.
      Used to pull in information regarding Legislation, and basic associated metadata,
@@ -102,6 +74,16 @@ class SCBillScraper(Scraper):
         self.raise_errors = False
         self.retry_attempts = 5
 
+        # Workaround to prevent chunking error (thanks @showerst): the
+        # subject search mangles chunked responses, so talk HTTP/1.0 to it
+        #
+        # @see https://stackoverflow.com/a/37818792/1858091
+        adapter = HTTP10Adapter(
+            pool_connections=self.max_workers, pool_maxsize=self.max_workers
+        )
+        self.mount("https://www.scstatehouse.gov/subjectsearch.php", adapter)
+        self.mount("http://www.scstatehouse.gov/subjectsearch.php", adapter)
+
     urls = {
         "lower": {
             "daily-bill-index": "https://www.scstatehouse.gov/hintro/hintros.php",
@@ -117,14 +99,6 @@ class SCBillScraper(Scraper):
 
     _subjects = defaultdict(set)
 
-    @toggle_http_version
-    def downgraded_http_get(self, url, params=None, **kwargs):
-        return self.get(url, params=params, **kwargs)
-
-    @toggle_http_version
-    def downgraded_http_post(self, url, data=None, json=None, **kwargs):
-        return self.post(url, data=data, json=json, **kwargs)
-
     def scrape_subjects(self, session):
         """
         Obtain bill subjects, which will be saved onto _subjects global,
@@ -158,26 +132,21 @@ class SCBillScraper(Scraper):
             ),
         ).text
         doc = lxml.html.fromstring(data)
-        # skip first two subjects, filler options
-        for option in doc.xpath("//option")[2:]:
-            subject = option.text
-            code = option.get("value")
-            url = "%s?AORB=B&session=%s&indexcode=%s" % (
+
+        def subject_url(option):
+            return "%s?AORB=B&session=%s&indexcode=%s" % (
                 subject_search_url,
                 session_code,
-                code,
+                option.get("value"),
             )
 
-            # SC's server is sending some noncomplient server responses
-            # that are confusing self.get
-            # workaround via
-            # https://stackoverflow.com/questions/14442222/how-to-handle-incompleteread-in-python
-            try:
-                self.info(url)
-                data = urllib.request.urlopen(url).read()
-            except (http.client.IncompleteRead) as e:
-                self.warning("Client IncompleteRead error on {}".format(url))
-                data = e.partial
+        # skip first two subjects, filler options
+        options = doc.xpath("//option")[2:]
+        for option in self.prefetch(options, lambda option: [subject_url(option)]):
+            subject = option.text
+            url = subject_url(option)
+            self.info(url)
+            data = self.fetch(url).content
 
             doc = lxml.html.fromstring(data)
             for bill in doc.xpath('//span[@style="font-weight:bold;"]'):
@@ -199,6 +168,7 @@ class SCBillScraper(Scraper):
         doc = lxml.html.fromstring(html)
         doc.make_links_absolute(vurl)
 
+        votes = []
         # skip first two rows
         for row in doc.xpath("//table/tr")[2:]:
             tds = row.getchildren()
@@ -254,9 +224,7 @@ class SCBillScraper(Scraper):
 
             vote.add_source(vurl)
 
-            # obtain vote rollcall from pdf and add it to the VoteEvent object
             rollcall_pdf = vote_link.get("href")
-            self.scrape_rollcall(vote, rollcall_pdf)
             vote.add_source(rollcall_pdf)
             if rollcall_pdf in self._seen_vote_ids:
                 self.warning("duplicate usage of %s, skipping", rollcall_pdf)
@@ -264,17 +232,26 @@ class SCBillScraper(Scraper):
             else:
                 self._seen_vote_ids.add(rollcall_pdf)
             vote.pupa_id = rollcall_pdf  # distinct KEY for each one
+            votes.append((vote, rollcall_pdf))
 
-            yield vote
+        # obtain vote rollcalls from the pdfs, downloading them in parallel,
+        # and add them to the VoteEvent objects
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            downloads = pool.map(self.urlretrieve, [url for _, url in votes])
+            for (vote, rollcall_pdf), (path, _) in zip(votes, downloads):
+                self.scrape_rollcall(vote, rollcall_pdf, path)
+                yield vote
 
-    def scrape_rollcall(self, vote, vurl):
+    def scrape_rollcall(self, vote, vurl, path=None):
         """
          Get text information from the pdf, containing the vote roll call
          and add the information obtained to the related voteEvent object
         :param vote:  related voteEvent object
         :param vurl:  pdf source url
+        :param path:  the pdf, if it has already been downloaded
         """
-        (path, resp) = self.urlretrieve(vurl)
+        if path is None:
+            (path, resp) = self.urlretrieve(vurl)
         pdflines = convert_pdf(path, "text")
         os.remove(path)
 
@@ -327,7 +304,7 @@ class SCBillScraper(Scraper):
         :param bill_id:
         :return:
         """
-        page = self.get(bill_detail_url).text
+        page = self.fetch(bill_detail_url).text
 
         if "INVALID BILL NUMBER" in page:
             self.warning("INVALID BILL %s" % bill_detail_url)
@@ -432,6 +409,22 @@ class SCBillScraper(Scraper):
         bill.add_source(bill_detail_url)
         yield bill
 
+    def scrape_day(self, doc, session, chamber, chamber_letter):
+        """
+        Scrape the bills listed on a day's page, fetching the next few
+        bills' details while each one is scraped.
+        """
+        bill_links = [
+            bill_a
+            for bill_a in doc.xpath("//p/a[1]")
+            if bill_a.text.replace(".", "").startswith(chamber_letter)
+        ]
+        for bill_a in self.prefetch(bill_links, lambda a: [a.get("href")]):
+            bill_id = bill_a.text.replace(".", "")
+            yield from self.scrape_details(
+                bill_a.get("href"), session, chamber, bill_id
+            )
+
     def scrape(self, chamber=None, session=None):
         """
          Obtain the bill urls containing the bill information which will be used
@@ -472,13 +465,7 @@ class SCBillScraper(Scraper):
 
                 doc = lxml.html.fromstring(data)
                 doc.make_links_absolute(day_url)
-
-                for bill_a in doc.xpath("//p/a[1]"):
-                    bill_id = bill_a.text.replace(".", "")
-                    if bill_id.startswith(chamber_letter):
-                        yield from self.scrape_details(
-                            bill_a.get("href"), session, chamber, bill_id
-                        )
+                yield from self.scrape_day(doc, session, chamber, chamber_letter)
 
             prefile_url = self.urls[chamber]["prefile-index"].format(
                 last_two_digits_of_session_year=session[2:4]
@@ -501,10 +488,4 @@ class SCBillScraper(Scraper):
 
                 doc = lxml.html.fromstring(data)
                 doc.make_links_absolute(day_url)
-
-                for bill_a in doc.xpath("//p/a[1]"):
-                    bill_id = bill_a.text.replace(".", "")
-                    if bill_id.startswith(chamber_letter):
-                        yield from self.scrape_details(
-                            bill_a.get("href"), session, chamber, bill_id
-                        )
+                yield from self.scrape_day(doc, session, chamber, chamber_letter)
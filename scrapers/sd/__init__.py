@@ -1,12 +1,16 @@
 import scrapelib
 import lxml.html
-from .people import SDLegislatorScraper
-from .bills import SDBillScraper
-from utils import State
+from utils import State, LazyScrapers
 
 
 class SouthDakota(State):
-    scrapers = {"people": SDLegislatorScraper, "bills": SDBillScraper}
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:SDLegislatorScraper",
+            "bills": ".bills:SDBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009",
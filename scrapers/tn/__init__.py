@@ -1,18 +1,18 @@
-from utils import url_xpath, State
-from .bills import TNBillScraper
-from .events import TNEventScraper
-from .people import TNPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import TNCommitteeScraper
 
 
 class Tennessee(State):
-    scrapers = {
-        "bills": TNBillScraper,
-        # 'committees': TNCommitteeScraper,
-        "events": TNEventScraper,
-        "people": TNPersonScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:TNBillScraper",
+            # 'committees': TNCommitteeScraper,
+            "events": ".events:TNEventScraper",
+            "people": ".people:TNPersonScraper",
+        },
+    )
     legislative_sessions = [
         # {
         #     "_scraped_name": "106th General Assembly",
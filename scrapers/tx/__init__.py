@@ -1,21 +1,20 @@
-from utils import url_xpath, State
-from .bills import TXBillScraper
-from .events import TXEventScraper
-from .people import TXPersonScraper
-from .votes import TXVoteScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import TXCommitteeScraper
 
 
 class Texas(State):
-    scrapers = {
-        "people": TXPersonScraper,
-        # 'committees': TXCommitteeScraper,
-        "bills": TXBillScraper,
-        # Re-enable vote scraper when adding next regular session
-        "votes": TXVoteScraper,
-        "events": TXEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:TXPersonScraper",
+            # 'committees': TXCommitteeScraper,
+            "bills": ".bills:TXBillScraper",
+            # Re-enable vote scraper when adding next regular session
+            "votes": ".votes:TXVoteScraper",
+            "events": ".events:TXEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "81(R) - 2009",
@@ -1,13 +1,12 @@
 import datetime
-import ftplib
 import re
-import time
 from urllib import parse as urlparse
 import xml.etree.cElementTree as etree
 
 from openstates.scrape import Scraper, Bill
 from openstates.scrape.base import ScrapeError
 from utils import LXMLMixin
+from utils.ftp import FTPCrawler
 
 
 class TXBillScraper(Scraper, LXMLMixin):
@@ -26,37 +25,7 @@ class TXBillScraper(Scraper, LXMLMixin):
 
     def _get_ftp_files(self, dir_):
         """ Recursively traverse an FTP directory, returning all files """
-        for i in range(3):
-            try:
-                ftp = ftplib.FTP(self._FTP_ROOT)
-                break
-            except (EOFError, ftplib.error_temp):
-                time.sleep(2 ** i)
-        else:
-            raise Exception
-
-        ftp.login()
-        ftp.cwd("/" + dir_)
-        self.info("Searching an FTP folder for files ({})".format(dir_))
-
-        lines = []
-        ftp.retrlines("LIST", lines.append)
-        for line in lines:
-            (_date, _time, is_dir, _file_size, name) = re.search(
-                r"""(?x)
-                    ^(\d{2}-\d{2}-\d{2})\s+  # Date in mm-dd-yy
-                    (\d{2}:\d{2}[AP]M)\s+  # Time in hh:mmAM/PM
-                    (<DIR>)?\s+  # Directories will have an indicating flag
-                    (\d+)?\s+  # Files will have their size in bytes
-                    (.+?)\s*$  # Directory or file name is the remaining text
-                    """,
-                line,
-            ).groups()
-            if is_dir:
-                for item in self._get_ftp_files("/".join([dir_, name])):
-                    yield item
-            else:
-                yield "/".join(["ftp://" + self._FTP_ROOT, dir_, name])
+        return self.ftp.walk(dir_)
 
     @staticmethod
     def _get_bill_id_from_file_path(file_path):
@@ -78,25 +47,42 @@ class TXBillScraper(Scraper, LXMLMixin):
 
         session_code = self._format_session(session)
 
-        self.witnesses = []
-        witness_files = self._get_ftp_files(
-            "bills/{}/witlistbill/html".format(session_code)
-        )
-        for item in witness_files:
-            bill_id = self._get_bill_id_from_file_path(item)
-            self.witnesses.append((bill_id, item))
-
-        history_files = self._get_ftp_files("bills/{}/billhistory".format(session_code))
-        for bill_url in history_files:
-            if "house" in bill_url:
-                if "lower" in chambers:
-                    yield from self.scrape_bill(session, bill_url)
-            elif "senate" in bill_url:
-                if "upper" in chambers:
-                    yield from self.scrape_bill(session, bill_url)
-
-    def scrape_bill(self, session, history_url):
-        history_xml = self.get(history_url).text
+        with FTPCrawler(self._FTP_ROOT, logger=self.logger) as self.ftp:
+            self.witnesses = []
+            witness_files = self._get_ftp_files(
+                "bills/{}/witlistbill/html".format(session_code)
+            )
+            for item in witness_files:
+                item = self.ftp.url(item)
+                bill_id = self._get_bill_id_from_file_path(item)
+                self.witnesses.append((bill_id, item))
+
+            # only download the chambers being scraped
+            history_files = [
+                entry
+                for entry in self._get_ftp_files(
+                    "bills/{}/billhistory".format(session_code)
+                )
+                if ("house" in entry.path and "lower" in chambers)
+                or ("senate" in entry.path and "upper" in chambers)
+            ]
+            for entry, data in self.ftp.iter_fetch(history_files):
+                yield from self.scrape_bill(session, self.ftp.url(entry), data)
+
+            self.info(
+                "{} bill history files downloaded, {} unchanged since the last run".format(
+                    self.ftp.downloaded, self.ftp.reused
+                )
+            )
+
+    def scrape_bill(self, session, history_url, history_data=None):
+        if history_data is None:
+            history_xml = self.get(history_url).text
+        else:
+            try:
+                history_xml = history_data.decode("utf-8")
+            except UnicodeDecodeError:
+                history_xml = history_data.decode("latin-1")
         root = etree.fromstring(history_xml)
 
         bill_title = root.findtext("caption")
@@ -0,0 +1,75 @@
+import shutil
+import tempfile
+import unittest
+
+from utils.ftp import FTPCrawler, parse_list_line
+from utils.tests.ftp_server import FTPServerTestCase
+
+
+class TestListParsing(unittest.TestCase):
+    def test_dos_line(self):
+        self.assertEqual(
+            parse_list_line("01-05-21  09:32AM       <DIR>          house_bills"),
+            ("house_bills", True, 0, "2021-01-05T09:32:00"),
+        )
+        self.assertEqual(
+            parse_list_line("01-05-21  01:02PM                 5120 HB 1.xml"),
+            ("HB 1.xml", False, 5120, "2021-01-05T13:02:00"),
+        )
+
+    def test_unix_line(self):
+        self.assertEqual(
+            parse_list_line("-rw-r--r--   1 owner group  5120 Jan 05  2021 HB 1.xml"),
+            ("HB 1.xml", False, 5120, "2021-01-05T00:00:00"),
+        )
+        self.assertIsNone(parse_list_line("total 8"))
+
+
+class TestFTPCrawler(FTPServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = tempfile.mkdtemp()
+        self.write("bills/88R/billhistory/house_bills/HB00001_HB00099/HB 1.xml", "a")
+        self.write("bills/88R/billhistory/house_bills/HB00001_HB00099/HB 2.xml", "b")
+        self.write("bills/88R/billhistory/senate_bills/SB00001_SB00099/SB 1.xml", "c")
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(self.cache)
+
+    def crawler(self):
+        return FTPCrawler(
+            "127.0.0.1", port=self.port, connections=2, cache_dir=self.cache
+        )
+
+    def test_walk_and_fetch(self):
+        with self.crawler() as ftp:
+            files = ftp.walk("bills/88R/billhistory")
+            self.assertEqual(
+                sorted(entry.path.rsplit("/", 1)[1] for entry in files),
+                ["HB 1.xml", "HB 2.xml", "SB 1.xml"],
+            )
+            contents = {e.path[-8:]: data for e, data in ftp.iter_fetch(files)}
+            self.assertEqual(
+                contents, {"HB 1.xml": b"a", "HB 2.xml": b"b", "SB 1.xml": b"c"}
+            )
+            self.assertEqual(ftp.downloaded, 3)
+            self.assertLessEqual(ftp._open, 2)
+
+    def test_only_changed_files_downloaded(self):
+        with self.crawler() as ftp:
+            list(ftp.iter_fetch(ftp.walk("bills")))
+
+        self.write("bills/88R/billhistory/house_bills/HB00001_HB00099/HB 2.xml", "bb")
+
+        with self.crawler() as ftp:
+            contents = dict(
+                (e.path[-8:], data) for e, data in ftp.iter_fetch(ftp.walk("bills"))
+            )
+            self.assertEqual(contents["HB 2.xml"], b"bb")
+            self.assertEqual(ftp.downloaded, 1)
+            self.assertEqual(ftp.reused, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
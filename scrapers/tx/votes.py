@@ -7,6 +7,10 @@ import collections
 
 import lxml.html
 from openstates.scrape import Scraper, VoteEvent
+from utils.cache import KeyValueCache
+from utils.incremental import IncrementalMixin, imported, utcnow
+
+journal_state = KeyValueCache("tx_journals")
 
 
 def next_tag(el):
@@ -329,8 +333,156 @@ def viva_voce_votes(root, session, chamber):
         yield v
 
 
-class TXVoteScraper(Scraper):
-    def scrape(self, session=None, chamber=None):
+class JournalIndex(object):
+    """Finds a session's journals for a chamber, fetching each once.
+
+    The journals are found in the directory listing of the chamber's
+    journal folder; if that can't be had, every day from the start of the
+    year on is tried, as the journal URLs follow the day. Senate journals
+    are named for their date, so those more than ``missing_after`` in the
+    past that aren't there are remembered, and aren't tried again; House
+    journals are numbered by legislative day, which runs behind the
+    calendar, so a missing one is always tried again. Journals whose votes were all scraped are
+    remembered too, and skipped on later runs unless ``rescrape`` is set,
+    since a FINAL journal doesn't change once it's posted.
+
+    A journal only counts as scraped once its votes are in the database:
+    the journals a run got through are kept as pending, with when the run
+    started and finished, and a later run marks them processed if
+    os-update's RunPlan shows that run was imported (see
+    utils.incremental.imported), or forgets them if it wasn't.
+    """
+
+    roots = {
+        "lower": "https://journals.house.texas.gov/HJRNL/{session}/HTML/",
+        "upper": "https://journals.senate.texas.gov/SJRNL/{session}/HTML/",
+    }
+    filenames = {
+        "lower": r"{session}DAY(\d+)FINAL\.HTM",
+        "upper": r"{session}SJ(\d\d)-(\d\d)-F\.HTM",
+    }
+    missing_after = datetime.timedelta(days=30)
+
+    def __init__(self, scraper, session, rescrape=False):
+        self.scraper = scraper
+        self.session = session
+        self.rescrape = rescrape
+        self.pending_key = "pending:{}".format(session)
+        self.started = utcnow()
+        self.scraped = []
+        self.skipped = 0
+        self.resolve_pending()
+
+    def resolve_pending(self):
+        pending = journal_state.get(self.pending_key)
+        if not pending:
+            return
+        if imported(
+            pending["jurisdiction_id"],
+            datetime.datetime.fromisoformat(pending["started"]),
+            datetime.datetime.fromisoformat(pending["finished"]),
+        ):
+            for url in pending["urls"]:
+                journal_state.set(url, "processed")
+        else:
+            self.scraper.info(
+                "the journals scraped %s weren't imported, scraping them again",
+                pending["started"],
+            )
+        journal_state.delete(self.pending_key)
+
+    def listed(self, chamber):
+        """The journal URLs in the chamber's directory listing, in order,
+        or None if there's no listing to be had.
+        """
+        root = self.roots[chamber].format(session=self.session)
+        filename = re.compile(
+            self.filenames[chamber].format(session=self.session), re.IGNORECASE
+        )
+        try:
+            doc = lxml.html.fromstring(self.scraper.get(root).text)
+        except (scrapelib.HTTPError, lxml.etree.ParserError):
+            return None
+        doc.make_links_absolute(root)
+
+        journals = {}
+        for url in doc.xpath("//a/@href"):
+            match = filename.fullmatch(url.rsplit("/", 1)[-1])
+            if match:
+                journals[tuple(int(g) for g in match.groups())] = url
+        return [journals[key] for key in sorted(journals)] or None
+
+    def guessed(self, chamber):
+        """(url, day) for every day from the start of the year to today,
+        ``day`` being the date a journal at ``url`` would be for, or None
+        for the House's, which don't follow the date.
+        """
+        root = self.roots[chamber].format(session=self.session)
+        today = datetime.date.today()
+        day = datetime.date(today.year, 1, 1)
+        day_num = 1
+        while day <= today:
+            if chamber == "lower":
+                url = root + self.session + "DAY" + str(day_num).zfill(2) + "FINAL.HTM"
+                yield url, None
+            else:
+                url = root + "%sSJ%s-%s-F.HTM" % (
+                    self.session,
+                    str(day.month).zfill(2),
+                    str(day.day).zfill(2),
+                )
+                yield url, day
+            day += datetime.timedelta(days=1)
+            day_num += 1
+
+    def journals(self, chamber):
+        """Yield (url, page) for each journal not yet processed."""
+        listed = self.listed(chamber)
+        if listed:
+            candidates = ((url, None) for url in listed)
+        else:
+            self.scraper.info("no journal listing for %s, trying every day", chamber)
+            candidates = self.guessed(chamber)
+
+        for url, day in candidates:
+            state = journal_state.get(url)
+            if state == "missing":
+                continue
+            if state == "processed" and not self.rescrape:
+                self.skipped += 1
+                continue
+            try:
+                page = self.scraper.get(url).text
+            except scrapelib.HTTPError:
+                if listed:
+                    self.scraper.warning("listed journal %s couldn't be fetched", url)
+                elif day and day < datetime.date.today() - self.missing_after:
+                    journal_state.set(url, "missing")
+                continue
+            yield url, page
+
+    def processed(self, url):
+        self.scraped.append(url)
+
+    def finish(self):
+        """Keep the journals this run got through until it's imported."""
+        if not self.scraped:
+            return
+        jurisdiction = getattr(self.scraper, "jurisdiction", None)
+        journal_state.set(
+            self.pending_key,
+            {
+                "urls": self.scraped,
+                "started": self.started.isoformat(),
+                "finished": utcnow().isoformat(),
+                "jurisdiction_id": getattr(jurisdiction, "jurisdiction_id", None),
+            },
+        )
+
+
+class TXVoteScraper(IncrementalMixin, Scraper):
+    # rescrape=1 scrapes journals already scraped on an earlier run
+    def scrape(self, session=None, chamber=None, rescrape=False):
         if not session:
             session = self.latest_session()
             self.info("No session specified; using %s", session)
@@ -344,48 +496,18 @@ class TXVoteScraper(Scraper):
 
         chambers = [chamber] if chamber else ["upper", "lower"]
 
-        # go through every day this year before today
-        # and see if there were any journals that day
-        today = datetime.datetime.today()
-        today = datetime.datetime(today.year, today.month, today.day)
-        journal_day = datetime.datetime(today.year, 1, 1)
-        day_num = 1
-        while journal_day <= today:
-            if "lower" in chambers:
-                journal_root = (
-                    "https://journals.house.texas.gov/HJRNL/%s/HTML/" % session
-                )
-                journal_url = (
-                    journal_root + session + "DAY" + str(day_num).zfill(2) + "FINAL.HTM"
-                )
-                try:
-                    self.get(journal_url)
-                except scrapelib.HTTPError:
-                    pass
-                else:
-                    yield from self.scrape_journal(journal_url, "lower", session)
-
-            if "upper" in chambers:
-                journal_root = (
-                    "https://journals.senate.texas.gov/SJRNL/%s/HTML/" % session
-                )
-                journal_url = journal_root + "%sSJ%s-%s-F.HTM" % (
-                    session,
-                    str(journal_day.month).zfill(2),
-                    str(journal_day.day).zfill(2),
-                )
-                try:
-                    self.get(journal_url)
-                except scrapelib.HTTPError:
-                    pass
-                else:
-                    yield from self.scrape_journal(journal_url, "upper", session)
-
-            journal_day += datetime.timedelta(days=1)
-            day_num += 1
-
-    def scrape_journal(self, url, chamber, session):
-        page = self.get(url).text
+        rescrape = str(rescrape).lower() in ("1", "true", "yes")
+        index = JournalIndex(self, session, rescrape=rescrape)
+        for chamber in chambers:
+            for journal_url, page in index.journals(chamber):
+                yield from self.scrape_journal(journal_url, chamber, session, page)
+                index.processed(journal_url)
+        index.finish()
+        self.skipped += index.skipped
+
+    def scrape_journal(self, url, chamber, session, page=None):
+        if page is None:
+            page = self.get(url).text
 
         root = lxml.html.fromstring(page)
         clean_journal(root)
@@ -1,19 +1,19 @@
 import re
-from utils import url_xpath, State
-from .people import UTPersonScraper
-from .events import UTEventScraper
-from .bills import UTBillScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import UTCommitteeScraper
 
 
 class Utah(State):
-    scrapers = {
-        "people": UTPersonScraper,
-        "events": UTEventScraper,
-        # 'committees': UTCommitteeScraper,
-        "bills": UTBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:UTPersonScraper",
+            "events": ".events:UTEventScraper",
+            # 'committees': UTCommitteeScraper,
+            "bills": ".bills:UTBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011 General Session",
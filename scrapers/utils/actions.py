@@ -1,7 +1,14 @@
 import re
-from collections import namedtuple, defaultdict, Iterable
+from collections import namedtuple, defaultdict
+from collections.abc import Iterable
+from functools import lru_cache
 from six import string_types
 
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
 
 class Rule(namedtuple("Rule", "regexes types stop attrs")):
     """If any of ``regexes`` matches the action text, the resulting
@@ -59,23 +66,154 @@ class Rule(namedtuple("Rule", "regexes types stop attrs")):
             return None
 
 
+def _literal_runs(parsed, runs):
+    """Collect runs of literal characters that every match of ``parsed``
+    must contain.  Anything optional, alternated or case-insensitive is
+    skipped, so the result is always safe to use as a prefilter.
+    """
+    run = []
+    for op, av in parsed:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        runs.append("".join(run))
+        run = []
+        if op is sre_parse.SUBPATTERN:
+            group, add_flags, del_flags, p = av
+            if not add_flags & re.IGNORECASE:
+                _literal_runs(p, runs)
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            lo, hi, p = av
+            if lo >= 1:
+                _literal_runs(p, runs)
+    runs.append("".join(run))
+    return runs
+
+
+def required_literal(regex):
+    """Return the longest substring that must appear in any text ``regex``
+    can match, or an empty string if there isn't one we can be sure of.
+    """
+    pattern = regex.pattern
+    if not isinstance(pattern, str) or regex.flags & re.IGNORECASE:
+        return ""
+    try:
+        parsed = sre_parse.parse(pattern, regex.flags)
+    except Exception:
+        return ""
+    return max(_literal_runs(parsed, []), key=len)
+
+
+class CompiledRules(object):
+    """A rule list compiled once into a single matcher.
+
+    Every regex is paired with a literal substring it can't match without,
+    so a cheap ``in`` test rules out most regexes before ``search`` runs.
+    Results are kept in an LRU cache keyed on the (pre-categorized) text,
+    since the same action strings repeat across thousands of bills.
+
+    ``match`` returns the same types and attrs as looping over the rules
+    with ``Rule.match``, including ``stop``.
+    """
+
+    def __init__(self, rules, cache_size=4096):
+        self.rules = tuple(rules)
+        self._checks = [
+            (rule, [(required_literal(regex), regex) for regex in rule.regexes])
+            for rule in self.rules
+        ]
+        self._cached_match = lru_cache(maxsize=cache_size)(self._match)
+
+    def _match(self, text):
+        types = set()
+        return_val = defaultdict(set)
+
+        for rule, checks in self._checks:
+            attrs = {}
+            matched = False
+
+            for literal, regex in checks:
+                if literal not in text:
+                    continue
+                m = regex.search(text)
+                if m:
+                    matched = True
+                    attrs.update(m.groupdict())
+
+            if matched:
+                types |= rule.types
+                for k, v in attrs.items():
+                    return_val[k].add(v)
+                return_val.update(**rule.attrs)
+                if rule.stop:
+                    break
+
+        return types, return_val
+
+    def match(self, text):
+        """Return a fresh ``(types, attrs)`` pair for ``text``."""
+        types, return_val = self._cached_match(text)
+        # callers (and post_categorize hooks) mutate these, so hand out copies
+        copied = defaultdict(set)
+        for k, v in return_val.items():
+            copied[k] = set(v) if isinstance(v, set) else v
+        return set(types), copied
+
+    def cache_info(self):
+        return self._cached_match.cache_info()
+
+
 class BaseCategorizer(object):
     """A class that exposes a main categorizer function
     and before and after hooks, in case categorization requires specific
     steps that make use of action or category info. The return
     value is a 2-tuple of category types and a dictionary of
     attributes to overwrite on the target action object.
+
+    Setting ``compiled = True`` (on the class, or per instance via the
+    constructor) matches ``rules`` with a :class:`CompiledRules` engine
+    that is built once per class and caches results by text.
     """
 
     rules = []
-
-    def __init__(self):
-        pass
+    compiled = False
+    cache_size = 4096
+
+    def __init__(self, compiled=None):
+        if compiled is not None:
+            self.compiled = compiled
+
+    @classmethod
+    def compiled_rules(cls):
+        # look in the class's own __dict__ so subclasses don't share an engine
+        # built for a parent's rules
+        engine = cls.__dict__.get("_compiled_rules")
+        if engine is None:
+            engine = CompiledRules(cls.rules, cls.cache_size)
+            cls._compiled_rules = engine
+        return engine
 
     def categorize(self, text):
         # run pre-categorization hook on text
         text = self.pre_categorize(text)
 
+        if self.compiled:
+            types, return_val = self.compiled_rules().match(text)
+        else:
+            types, return_val = self.match_rules(text)
+
+        # set type
+        return_val["classification"] = list(types)
+
+        # run post-categorize hook
+        return_val = self.post_categorize(return_val)
+
+        return self.finalize(return_val)
+
+    def match_rules(self, text):
+        """Test ``text`` against each rule in turn, returning the matched
+        types and a dictionary of attrs.
+        """
         types = set()
         return_val = defaultdict(set)
 
@@ -99,13 +237,7 @@ class BaseCategorizer(object):
                 if rule.stop:
                     break
 
-        # set type
-        return_val["classification"] = list(types)
-
-        # run post-categorize hook
-        return_val = self.post_categorize(return_val)
-
-        return self.finalize(return_val)
+        return types, return_val
 
     def finalize(self, return_val):
         """Before the types and attrs get passed to the
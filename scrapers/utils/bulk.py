@@ -0,0 +1,203 @@
+import csv
+import atexit
+import codecs
+import logging
+import threading
+import urllib.parse
+
+import chardet
+
+from . import http
+from .cache import KeyValueCache
+from .ftp import FTPCrawler
+
+logger = logging.getLogger("openstates")
+
+# how much of a file is looked at to guess its encoding
+SNIFF_BYTES = 64 * 1024
+CHUNK_SIZE = 64 * 1024
+
+# how long a sniffed encoding is trusted before the file is sniffed again
+ENCODING_MAX_AGE = 7 * 24 * 60 * 60
+
+encodings = KeyValueCache("encodings")
+
+BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+_crawlers = {}
+_crawlers_lock = threading.Lock()
+
+
+def _cp1252_fallback(error):
+    # the bytes of a file taken to be utf-8 that aren't, read as cp1252
+    bad = error.object[error.start : error.end]
+    return bad.decode("cp1252", "replace"), error.end
+
+
+codecs.register_error("cp1252-fallback", _cp1252_fallback)
+
+
+def sniff_encoding(prefix):
+    """Guess the encoding of a file from its first few kilobytes: a byte
+    order mark, the NULs of BOM-less UTF-16 text, valid utf-8, or failing
+    those whatever chardet makes of it.
+    """
+    for bom, encoding in BOMS:
+        if prefix.startswith(bom):
+            return encoding
+
+    # ASCII text in UTF-16 has a NUL in every other byte
+    sample = prefix[:1024]
+    if len(sample) >= 2 and sample.count(b"\x00") * 3 > len(sample):
+        if sample[1::2].count(b"\x00") > sample[::2].count(b"\x00"):
+            return "utf-16-le"
+        return "utf-16-be"
+
+    try:
+        # the prefix may end part way through a character
+        codecs.getincrementaldecoder("utf-8")().decode(prefix)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    return chardet.detect(prefix)["encoding"] or "cp1252"
+
+
+def _ftp_crawler(netloc, user, passwd):
+    key = (netloc, user)
+    with _crawlers_lock:
+        if key not in _crawlers:
+            host, _, port = netloc.partition(":")
+            _crawlers[key] = FTPCrawler(
+                host, port=int(port or 21), user=user or "", passwd=passwd or ""
+            )
+        return _crawlers[key]
+
+
+def close():
+    """Close the FTP connections opened for bulk files (this is done at
+    exit anyway).
+    """
+    with _crawlers_lock:
+        for ftp in _crawlers.values():
+            ftp.close()
+        _crawlers.clear()
+
+
+atexit.register(close)
+
+
+def iter_chunks(url, scraper=None, chunk_size=None):
+    """Yield the bytes of ``url`` a chunk at a time.
+
+    Files on FTP servers are downloaded to the openstates cache directory
+    (only when their listing has changed, see utils.ftp) and read back from
+    there; anything else is streamed with ``scraper``, or the shared
+    session if there isn't one.
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    parsed = urllib.parse.urlsplit(url)
+    if parsed.scheme == "ftp":
+        ftp = _ftp_crawler(
+            parsed.hostname + (":%d" % parsed.port if parsed.port else ""),
+            urllib.parse.unquote(parsed.username or ""),
+            urllib.parse.unquote(parsed.password or ""),
+        )
+        path = urllib.parse.unquote(parsed.path).strip("/")
+        directory = path.rsplit("/", 1)[0] if "/" in path else ""
+        for entry in ftp.listdir(directory):
+            if entry.path.strip("/") == path:
+                break
+        else:
+            raise FileNotFoundError(url)
+        with open(ftp.download(entry), "rb") as f:
+            yield from iter(lambda: f.read(chunk_size), b"")
+    else:
+        response = (scraper or http.session()).get(url, stream=True)
+        response.raise_for_status()
+        yield from response.iter_content(chunk_size)
+
+
+def iter_text(url, scraper=None, encoding=None, drop="\x00"):
+    """Yield the text of ``url`` a piece at a time, with any of the
+    characters in ``drop`` (NULs, by default) taken out.
+
+    Unless ``encoding`` is given, it's sniffed from the start of the file
+    and remembered for the URL for ``ENCODING_MAX_AGE``, so runs in the
+    meantime don't sniff it again. If a file taken to be utf-8 turns out
+    not to be all utf-8, it's still read as utf-8, and only the bytes
+    that aren't are read as cp1252 (which is right for files that start
+    out as plain ASCII, and for stray characters in ones that don't); if
+    one in any other encoding doesn't decode, what was remembered is
+    forgotten, so the next run sniffs it afresh.
+    """
+    chunks = iter_chunks(url, scraper)
+    prefix = b""
+    if encoding is None:
+        encoding = encodings.get(url, max_age=ENCODING_MAX_AGE)
+    if encoding is None:
+        for chunk in chunks:
+            prefix += chunk
+            if len(prefix) >= SNIFF_BYTES:
+                break
+        encoding = sniff_encoding(prefix)
+        encodings.set(url, encoding)
+
+    drop_table = str.maketrans("", "", drop or "")
+    decoder = codecs.getincrementaldecoder(encoding)()
+
+    def pieces():
+        if prefix:
+            yield prefix
+        yield from chunks
+        # whatever's left over of a character split across the end
+        yield None
+
+    for chunk in pieces():
+        final = chunk is None
+        chunk = chunk or b""
+        pending = decoder.getstate()[0]
+        try:
+            text = decoder.decode(chunk, final)
+        except UnicodeDecodeError:
+            if codecs.lookup(encoding).name != "utf-8":
+                encodings.delete(url)
+                raise
+            logger.warning("%s isn't all utf-8, reading what isn't as cp1252", url)
+            decoder = codecs.getincrementaldecoder(encoding)(errors="cp1252-fallback")
+            text = decoder.decode(pending + chunk, final)
+        yield text.translate(drop_table)
+
+
+def iter_lines(url, scraper=None, encoding=None, drop="\x00"):
+    """Yield the lines of ``url`` (with their line endings) as they're
+    read, without ever holding more than a chunk of it in memory.
+
+    Lines end at ``\n`` only (keeping any ``\r`` before it), as they do
+    reading a StringIO, not at the form feeds, separators and other
+    characters ``str.splitlines`` also breaks on.
+    """
+    buffer = ""
+    for text in iter_text(url, scraper, encoding, drop):
+        lines = (buffer + text).split("\n")
+        # the last line is incomplete until its \n comes
+        buffer = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    if buffer:
+        yield buffer
+
+
+def open_csv(
+    url, scraper=None, encoding=None, drop="\x00", reader=csv.DictReader, **kwargs
+):
+    """A ``reader`` (csv.DictReader by default) over the rows of ``url``,
+    decoded and read a line at a time; see iter_text.
+    """
+    return reader(iter_lines(url, scraper, encoding, drop), **kwargs)
@@ -0,0 +1,91 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from openstates import settings
+
+
+class KeyValueCache(object):
+    """A persistent key/value store for things worth keeping between runs.
+
+    Each cache is a SQLite file named after it in the openstates cache
+    directory (``_cache`` by default). Values are stored as JSON, and the
+    file isn't opened until the cache is first used.
+    """
+
+    def __init__(self, name, directory=None):
+        directory = directory or settings.CACHE_DIR or "_cache"
+        self.path = os.path.join(directory, name + ".sqlite3")
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def get(self, key, default=None, max_age=None):
+        """Return the value stored for ``key``, or ``default`` if there isn't
+        one or it is older than ``max_age`` seconds.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT value, updated_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return default
+        value, updated_at = row
+        if max_age is not None and time.time() - updated_at > max_age:
+            return default
+        return json.loads(value)
+
+    def set(self, key, value):
+        with self._lock, self.connection:
+            self.connection.execute(
+                "REPLACE INTO cache (key, value, updated_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time()),
+            )
+
+    def delete(self, key):
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+
+def conditional_get(scraper, url, cache, parse, **kwargs):
+    """Fetch ``url`` with ``scraper`` and return ``parse(response)``.
+
+    The ETag/Last-Modified validators of the last response are kept in
+    ``cache`` along with what ``parse`` made of it (which must be JSON
+    serializable), and sent with the next request, so a page that hasn't
+    changed comes back as a bodiless 304 and isn't parsed again.
+    """
+    entry = cache.get(url)
+    headers = dict(kwargs.pop("headers", None) or {})
+    if entry:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = scraper.get(url, headers=headers, **kwargs)
+    if response.status_code == 304 and entry:
+        return entry["value"]
+
+    value = parse(response)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        cache.set(url, {"etag": etag, "last_modified": last_modified, "value": value})
+    return value
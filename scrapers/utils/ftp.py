@@ -0,0 +1,311 @@
+import os
+import re
+import time
+import queue
+import ftplib
+import logging
+import datetime
+import threading
+import contextlib
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+from openstates import settings
+
+from .cache import KeyValueCache
+
+# IIS style, e.g. "01-05-21  09:32AM       <DIR>          billhistory"
+DOS_LIST_RE = re.compile(
+    r"""(?x)
+    ^(?P<date>\d{2}-\d{2}-\d{2})\s+  # Date in mm-dd-yy
+    (?P<time>\d{2}:\d{2}[AP]M)\s+  # Time in hh:mmAM/PM
+    (?P<dir><DIR>)?\s+  # Directories will have an indicating flag
+    (?P<size>\d+)?\s+  # Files will have their size in bytes
+    (?P<name>.+?)\s*$  # Directory or file name is the remaining text
+    """
+)
+# ls style, e.g. "-rw-r--r--   1 owner group     5120 Jan 05 09:32 HB00001.xml"
+UNIX_LIST_RE = re.compile(
+    r"""(?x)
+    ^(?P<type>[-dl])\S*\s+\d+\s+\S+\s+\S+\s+
+    (?P<size>\d+)\s+
+    (?P<month>[A-Z][a-z]{2})\s+(?P<day>\d{1,2})\s+
+    (?P<time>\d{1,2}:\d{2}|\d{4})\s+  # time for recent files, year for older
+    (?P<name>.+?)(?:\s->\s.*)?\s*$
+    """
+)
+
+FTPEntry = collections.namedtuple("FTPEntry", "path is_dir size mtime")
+
+
+def parse_list_line(line, now=None):
+    """Parse a line of LIST output into (name, is_dir, size, mtime).
+
+    Both the DOS format IIS servers use and the usual ls format are
+    understood; mtime is an ISO 8601 string to the minute. Returns None for
+    lines that are neither (like the "total" line ls starts with).
+    """
+    match = DOS_LIST_RE.match(line)
+    if match:
+        mtime = datetime.datetime.strptime(
+            "%s %s" % (match.group("date"), match.group("time")), "%m-%d-%y %I:%M%p"
+        )
+        return (
+            match.group("name"),
+            bool(match.group("dir")),
+            int(match.group("size") or 0),
+            mtime.isoformat(),
+        )
+
+    match = UNIX_LIST_RE.match(line)
+    if match:
+        now = now or datetime.datetime.now()
+        stamp = match.group("time")
+        if ":" in stamp:
+            mtime = datetime.datetime.strptime(
+                "%s %s %d %s"
+                % (match.group("month"), match.group("day"), now.year, stamp),
+                "%b %d %Y %H:%M",
+            )
+            # no year means within the last six months, which may be last year
+            if mtime > now + datetime.timedelta(days=1):
+                mtime = mtime.replace(year=now.year - 1)
+        else:
+            mtime = datetime.datetime.strptime(
+                "%s %s %s" % (match.group("month"), match.group("day"), stamp),
+                "%b %d %Y",
+            )
+        return (
+            match.group("name"),
+            match.group("type") == "d",
+            int(match.group("size")),
+            mtime.isoformat(),
+        )
+
+    return None
+
+
+class FTPCrawler(object):
+    """Lists and downloads files from an FTP server over a small pool of
+    logged-in connections.
+
+    Directory listings are kept for the life of the crawler, and each
+    downloaded file is kept in the openstates cache directory along with
+    the size and mtime it was listed with, so on later runs only files
+    whose listing changed are downloaded again.
+    """
+
+    def __init__(
+        self,
+        host,
+        port=21,
+        user="",
+        passwd="",
+        connections=4,
+        retries=3,
+        timeout=60,
+        cache_dir=None,
+        logger=None,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.passwd = passwd
+        self.connections = connections
+        self.retries = retries
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.netloc = host if port == 21 else "%s:%d" % (host, port)
+        cache_dir = cache_dir or settings.CACHE_DIR or "_cache"
+        self.files_dir = os.path.join(cache_dir, "ftp", self.netloc)
+        self.state = KeyValueCache("ftp", directory=cache_dir)
+
+        self._idle = queue.LifoQueue()
+        self._open = 0
+        self._lock = threading.Lock()
+        self._listings = {}
+
+        self.downloaded = 0
+        self.reused = 0
+
+    def url(self, path):
+        if isinstance(path, FTPEntry):
+            path = path.path
+        return "ftp://%s/%s" % (self.netloc, path.strip("/"))
+
+    def _connect(self):
+        for i in range(self.retries):
+            try:
+                ftp = ftplib.FTP(timeout=self.timeout)
+                ftp.connect(self.host, self.port)
+                ftp.login(self.user, self.passwd)
+                return ftp
+            except (EOFError, OSError, ftplib.error_temp):
+                if i == self.retries - 1:
+                    raise
+                time.sleep(2 ** i)
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Borrow a logged-in connection, opening one if fewer than
+        ``connections`` are open and otherwise waiting for one to be returned.
+        """
+        ftp = None
+        try:
+            ftp = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._open < self.connections
+                if can_open:
+                    self._open += 1
+            if can_open:
+                try:
+                    ftp = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._open -= 1
+                    raise
+            else:
+                ftp = self._idle.get()
+
+        try:
+            yield ftp
+        except ftplib.error_perm:
+            # the server refused the command, the connection itself is fine
+            self._idle.put(ftp)
+            raise
+        except BaseException:
+            # anything else may have left it mid-transfer, so don't reuse it
+            ftp.close()
+            with self._lock:
+                self._open -= 1
+            raise
+        else:
+            self._idle.put(ftp)
+
+    def _retry(self, func):
+        for i in range(self.retries):
+            try:
+                with self.connection() as ftp:
+                    return func(ftp)
+            except ftplib.error_perm:
+                raise
+            except (EOFError, OSError, ftplib.error_temp, ftplib.error_reply):
+                if i == self.retries - 1:
+                    raise
+                time.sleep(2 ** i)
+
+    def listdir(self, path):
+        """The entries of the directory at ``path``."""
+        path = path.strip("/")
+        if path in self._listings:
+            return self._listings[path]
+
+        self.logger.info("Searching an FTP folder for files ({})".format(path))
+
+        def list_(ftp):
+            lines = []
+            ftp.cwd("/" + path)
+            ftp.retrlines("LIST", lines.append)
+            return lines
+
+        entries = []
+        for line in self._retry(list_):
+            parsed = parse_list_line(line)
+            if parsed is None:
+                continue
+            name, is_dir, size, mtime = parsed
+            if name in (".", ".."):
+                continue
+            entries.append(FTPEntry("/".join([path, name]), is_dir, size, mtime))
+
+        self._listings[path] = entries
+        return entries
+
+    def walk(self, path):
+        """All files below ``path``, listing each level's directories in
+        parallel.
+        """
+        files = []
+        pending = [path]
+        with ThreadPoolExecutor(max_workers=self.connections) as pool:
+            while pending:
+                listings = list(pool.map(self.listdir, pending))
+                pending = []
+                for entries in listings:
+                    for entry in entries:
+                        if entry.is_dir:
+                            pending.append(entry.path)
+                        else:
+                            files.append(entry)
+        return files
+
+    def download(self, entry):
+        """The local path of a copy of the file ``entry``, downloaded only
+        if it has changed since it was last downloaded. Large files can be
+        read from it a bit at a time instead of all at once with ``fetch``.
+        """
+        local_path = os.path.join(self.files_dir, *entry.path.split("/"))
+        key = self.url(entry)
+        listed = [entry.size, entry.mtime]
+
+        if self.state.get(key) == listed and os.path.exists(local_path):
+            self.reused += 1
+            return local_path
+
+        directory, name = entry.path.rsplit("/", 1)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        tmp_path = "%s.%d.%d.tmp" % (local_path, os.getpid(), threading.get_ident())
+
+        def retrieve(ftp):
+            with open(tmp_path, "wb") as f:
+                ftp.cwd("/" + directory)
+                ftp.retrbinary("RETR " + name, f.write)
+
+        try:
+            self._retry(retrieve)
+            os.replace(tmp_path, local_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.state.set(key, listed)
+        self.downloaded += 1
+        return local_path
+
+    def fetch(self, entry):
+        """The contents of the file ``entry``, downloaded only if it has
+        changed since it was last downloaded.
+        """
+        with open(self.download(entry), "rb") as f:
+            return f.read()
+
+    def iter_fetch(self, entries, chunk_size=None):
+        """Yield (entry, contents) for each of ``entries`` in order,
+        downloading a chunk of them at a time in parallel.
+        """
+        entries = list(entries)
+        chunk_size = chunk_size or self.connections * 8
+        with ThreadPoolExecutor(max_workers=self.connections) as pool:
+            for start in range(0, len(entries), chunk_size):
+                chunk = entries[start : start + chunk_size]
+                yield from zip(chunk, pool.map(self.fetch, chunk))
+
+    def close(self):
+        while True:
+            try:
+                ftp = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                ftp.quit()
+            except ftplib.all_errors:
+                ftp.close()
+            with self._lock:
+                self._open -= 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,168 @@
+import os
+import json
+import time
+import hashlib
+import threading
+
+import requests
+import scrapelib
+from openstates import settings
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# how long a cached response is served before it's fetched again
+CACHE_MAX_AGE = 60 * 60
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class ExpiringFileCache(scrapelib.FileCache):
+    """scrapelib's FileCache, but entries older than ``max_age`` seconds
+    are treated as missing (and so fetched and stored again).
+    """
+
+    def __init__(self, cache_dir, max_age):
+        super().__init__(cache_dir)
+        self.max_age = max_age
+
+    def get(self, orig_key):
+        path = os.path.join(self.cache_dir, self._clean_key(orig_key))
+        try:
+            if time.time() - os.path.getmtime(path) > self.max_age:
+                return None
+        except OSError:
+            return None
+        return super().get(orig_key)
+
+
+class SharedSession(scrapelib.Scraper):
+    """A scrapelib session set up the way openstates sets up a Scraper's
+    (timeout, requests per minute, retries and certificate checking), with
+    a larger keep-alive pool and a throttle that is safe to share between
+    threads.
+
+    Unlike a Scraper's write-only cache, successful GETs are served from
+    the cache for ``CACHE_MAX_AGE``, so pages that several scrapers (or
+    runs close together) ask for are fetched once. That cache is kept
+    apart from the Scrapers', in the ``shared`` folder of the cache
+    directory, and a request's headers are part of its key, so a response
+    is only served to requests made the same way. Streamed responses
+    aren't cached, so they're never read into memory whole, and nor are
+    ones to requests with ``auth``.
+
+    Like plain ``requests`` it doesn't raise for error status codes, so
+    callers that checked ``raise_for_status()`` keep doing so.
+    """
+
+    def __init__(self, pool_size=32):
+        super().__init__(raise_errors=False)
+        self.timeout = settings.SCRAPELIB_TIMEOUT
+        self.requests_per_minute = settings.SCRAPELIB_RPM
+        self.retry_attempts = settings.SCRAPELIB_RETRY_ATTEMPTS
+        self.retry_wait_seconds = settings.SCRAPELIB_RETRY_WAIT_SECONDS
+        self.verify = settings.SCRAPELIB_VERIFY
+        if settings.CACHE_DIR:
+            self.cache_storage = ExpiringFileCache(
+                os.path.join(settings.CACHE_DIR, "shared"), CACHE_MAX_AGE
+            )
+            self.cache_write_only = False
+
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+        self._throttle_lock = threading.Lock()
+
+    def _throttle(self):
+        with self._throttle_lock:
+            super()._throttle()
+
+    def key_for_request(self, method, url, **kwargs):
+        if kwargs.get("stream") or kwargs.get("auth"):
+            return None
+        key = super().key_for_request(method, url, **kwargs)
+        headers = kwargs.get("headers")
+        if key and headers:
+            # hashed, so credentials in them don't end up in file names
+            headers = sorted((k.lower(), str(v)) for k, v in headers.items())
+            digest = hashlib.sha1(json.dumps(headers).encode("utf-8")).hexdigest()
+            key += "#" + digest
+        return key
+
+
+class _HTTP10Mixin(object):
+    _http_vsn = 10
+    _http_vsn_str = "HTTP/1.0"
+
+    def putrequest(self, method, url, skip_host=False, skip_accept_encoding=False):
+        super().putrequest(
+            method, url, skip_host=True, skip_accept_encoding=skip_accept_encoding
+        )
+        # http.client only sends Host with HTTP/1.1 requests, but virtual
+        # hosts and CDNs need it whatever the version
+        if not skip_host:
+            host = self.host
+            if ":" in host:
+                host = "[%s]" % host
+            if self.port and self.port != self.default_port:
+                host = "%s:%d" % (host, self.port)
+            self.putheader("Host", host)
+
+
+class _HTTP10Connection(_HTTP10Mixin, HTTPConnection):
+    pass
+
+
+class _HTTP10SConnection(_HTTP10Mixin, HTTPSConnection):
+    pass
+
+
+class _HTTP10ConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _HTTP10Connection
+
+
+class _HTTP10SConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _HTTP10SConnection
+
+
+class HTTP10Adapter(requests.adapters.HTTPAdapter):
+    """A transport adapter whose connections speak HTTP/1.0 (still sending
+    Host), for servers that send broken chunked responses to HTTP/1.1
+    requests. Mount it on just the pages that need it::
+
+        scraper.mount("https://www.example.gov/search.php", HTTP10Adapter())
+
+    Unlike setting ``http.client.HTTPConnection._http_vsn``, this leaves
+    every other connection in the process alone, so it's safe to use from
+    several threads and alongside other scrapers.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _HTTP10ConnectionPool,
+            "https": _HTTP10SConnectionPool,
+        }
+
+
+def session():
+    """The process-wide session, for code that makes requests outside of a
+    Scraper (State classes, module level helpers) or from places that used
+    to call ``requests`` directly.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = SharedSession()
+    return _session
+
+
+def get(url, **kwargs):
+    return session().get(url, **kwargs)
+
+
+def post(url, **kwargs):
+    return session().post(url, **kwargs)
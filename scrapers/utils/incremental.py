@@ -0,0 +1,246 @@
+import re
+import logging
+import datetime
+
+from openstates.exceptions import ScrapeError
+
+from .cache import KeyValueCache
+
+logger = logging.getLogger("openstates")
+
+high_water_marks = KeyValueCache("high_water_marks")
+
+RELATIVE_TIME_RE = re.compile(
+    r"^((?P<days>\d+?)d)?((?P<hours>\d+?)h)?((?P<minutes>\d+?)m)?((?P<seconds>\d+?)s)?$"
+)
+
+
+def parse_relative_time(time_str):
+    """Turn a window like ``5d1h`` (days, hours, minutes, seconds) into a
+    timedelta, or return None if it isn't one.
+    """
+    parts = RELATIVE_TIME_RE.match(time_str)
+    if not parts or not any(parts.groupdict().values()):
+        return None
+    return datetime.timedelta(
+        **{name: int(param) for name, param in parts.groupdict().items() if param}
+    )
+
+
+def utcnow():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def to_utc(when, tz=None):
+    """Make ``when`` an aware UTC datetime; naive datetimes are taken to be
+    in ``tz`` (a pytz or datetime timezone), or UTC if it isn't given.
+    """
+    if when.tzinfo is None:
+        if tz is None:
+            when = when.replace(tzinfo=datetime.timezone.utc)
+        elif hasattr(tz, "localize"):
+            when = tz.localize(when)
+        else:
+            when = when.replace(tzinfo=tz)
+    return when.astimezone(datetime.timezone.utc)
+
+
+def imported(jurisdiction_id, started, finished):
+    """Whether an os-update run that was successful, import and all, took
+    in a scrape that ran from ``started`` to ``finished``: its RunPlan
+    must have begun before the scrape and ended after it.
+
+    Only runs that import set up the database, so after a scrape-only run
+    this is always False.
+    """
+    if jurisdiction_id is None:
+        return False
+    try:
+        from django.conf import settings as django_settings
+
+        if not django_settings.configured:
+            return False
+        from openstates.reports.models import RunPlan
+
+        return RunPlan.objects.filter(
+            jurisdiction_id=jurisdiction_id,
+            success=True,
+            start_time__lte=started,
+            end_time__gte=finished,
+        ).exists()
+    except Exception as e:
+        logger.warning("couldn't check for an import of the last scrape: %r", e)
+        return False
+
+
+class HighWaterMark(object):
+    """Bookkeeping for scrapers that can skip what hasn't changed.
+
+    Scrapers that support it take a ``since`` argument::
+
+        os-update or bills --scrape since=last     # since the last full run
+        os-update or bills --scrape since=1d6h     # changed in the last 30h
+        os-update or bills --scrape since=2021-03-01
+
+    and wrap their work in a HighWaterMark, skipping items whose source
+    says they were last changed before ``changed_since``::
+
+        with HighWaterMark(self, session, since) as mark:
+            for item in items:
+                if not mark.changed(item_modified_at, tz=self.tz):
+                    continue
+                ...
+
+    Without ``since`` everything is scraped. Either way, when the scrape
+    finishes (and only then) the time it started is stored, per
+    jurisdiction, scraper and session, as a pending mark. What was scraped
+    isn't in the database until os-update has imported it, so the pending
+    mark only becomes the one ``since=last`` picks up from once the run's
+    successful RunPlan shows the import went through (see ``imported``);
+    until then ``since=last`` goes back to the last mark that did.
+    ``overlap`` is taken off the mark to allow for clock skew and changes
+    made while the last run was going, and ``date_overlap`` off its day
+    for sources that only give dates (see ``changed``).
+    """
+
+    overlap = datetime.timedelta(minutes=15)
+    date_overlap = datetime.timedelta(days=1)
+
+    def __init__(self, scraper, session, since=None):
+        self.key = "{}:{}:{}".format(
+            type(scraper).__module__.split(".")[0], type(scraper).__name__, session
+        )
+        self.scraper = scraper
+        self.logger = getattr(scraper, "logger", None)
+        jurisdiction = getattr(scraper, "jurisdiction", None)
+        self.jurisdiction_id = getattr(jurisdiction, "jurisdiction_id", None)
+        self.changed_since = self._parse(since)
+        self.started = None
+        self.skipped = 0
+
+    def _parse(self, since):
+        if not since:
+            return None
+        if isinstance(since, datetime.datetime):
+            return to_utc(since)
+        if since == "last":
+            mark = self.last()
+            return None if mark is None else mark - self.overlap
+        window = parse_relative_time(since)
+        if window is not None:
+            return utcnow() - window
+        try:
+            return to_utc(datetime.datetime.fromisoformat(since))
+        except ValueError:
+            raise ValueError(
+                "since must be 'last', a window like 1d6h or an ISO date, not %r"
+                % since
+            )
+
+    def _entry(self):
+        entry = high_water_marks.get(self.key) or {}
+        if isinstance(entry, str):
+            # stored by a version that didn't wait for the import
+            entry = {"mark": entry}
+        return entry
+
+    def last(self):
+        """When the last scrape that was imported started, or None."""
+        entry = self._entry()
+        pending = entry.get("pending")
+        if pending and imported(
+            pending["jurisdiction_id"],
+            datetime.datetime.fromisoformat(pending["started"]),
+            datetime.datetime.fromisoformat(pending["finished"]),
+        ):
+            entry = {"mark": pending["started"]}
+            high_water_marks.set(self.key, entry)
+        elif pending and self.logger:
+            self.logger.info(
+                "the scrape started %s wasn't imported, not picking up from it",
+                pending["started"],
+            )
+        mark = entry.get("mark")
+        return None if mark is None else datetime.datetime.fromisoformat(mark)
+
+    def changed(self, *timestamps, tz=None, dates=()):
+        """Whether an item last changed at the latest of ``timestamps``
+        should be scraped: always on a full scrape, or if none of its
+        timestamps are known.
+
+        Sources that only say which day something happened (the dates of
+        a bill's actions, say) give ``dates`` instead, dates or datetimes
+        whose date is taken as it is. Those are often posted late in the
+        day or after the fact, so they are compared a day at a time, with
+        ``date_overlap`` taken off the day (in ``tz``) of ``changed_since``.
+        """
+        if self.changed_since is None:
+            return True
+        timestamps = [to_utc(ts, tz) for ts in timestamps if ts is not None]
+        dates = [
+            d.date() if isinstance(d, datetime.datetime) else d
+            for d in dates
+            if d is not None
+        ]
+        if not timestamps and not dates:
+            return True
+        if timestamps and max(timestamps) >= self.changed_since:
+            return True
+        if dates and max(dates) >= self._first_day(tz):
+            return True
+        self.skipped += 1
+        return False
+
+    def _first_day(self, tz=None):
+        since = self.changed_since.astimezone(tz or datetime.timezone.utc)
+        return since.date() - self.date_overlap
+
+    def __enter__(self):
+        self.started = utcnow()
+        if self.logger:
+            if self.changed_since is None:
+                self.logger.info("full scrape")
+            else:
+                self.logger.info(
+                    "scraping what changed since %s", self.changed_since.isoformat()
+                )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.scraper.skipped = getattr(self.scraper, "skipped", 0) + self.skipped
+        if exc_type is None:
+            entry = self._entry()
+            entry["pending"] = {
+                "started": self.started.isoformat(),
+                "finished": utcnow().isoformat(),
+                "jurisdiction_id": self.jurisdiction_id,
+            }
+            high_water_marks.set(self.key, entry)
+            if self.logger and self.skipped:
+                self.logger.info("skipped %s unchanged", self.skipped)
+
+
+class IncrementalMixin(object):
+    """For scrapers that use a HighWaterMark: a run in which nothing has
+    changed since the mark returns no objects, which openstates would
+    otherwise fail with "no objects returned"; here it's reported as a
+    scrape that skipped everything.
+    """
+
+    skipped = 0
+
+    def do_scrape(self, **kwargs):
+        start = utcnow()
+        self.skipped = 0
+        try:
+            return super().do_scrape(**kwargs)
+        except ScrapeError as e:
+            if "no objects returned" not in str(e) or not self.skipped:
+                raise
+            self.info("nothing changed, skipped %s", self.skipped)
+            return {
+                "objects": {},
+                "start": start,
+                "end": utcnow(),
+                "skipped": self.skipped,
+            }
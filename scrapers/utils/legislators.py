@@ -0,0 +1,191 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from openstates import settings
+
+_connections = {}
+_connections_lock = threading.Lock()
+
+
+def _connect(path):
+    with _connections_lock:
+        if path not in _connections:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.executescript(
+                "CREATE TABLE IF NOT EXISTS legislators ("
+                " jurisdiction TEXT NOT NULL, session TEXT NOT NULL,"
+                " member_id TEXT NOT NULL, value TEXT NOT NULL,"
+                " PRIMARY KEY (jurisdiction, session, member_id));"
+                "CREATE TABLE IF NOT EXISTS populated ("
+                " jurisdiction TEXT NOT NULL, session TEXT NOT NULL,"
+                " updated_at REAL NOT NULL,"
+                " PRIMARY KEY (jurisdiction, session));"
+            )
+            _connections[path] = (connection, threading.Lock())
+        return _connections[path]
+
+
+class LegislatorDirectory(object):
+    """The legislators of one jurisdiction's session, by the id the source
+    uses for them (a member GUID, a PersonId, a legislator code...), so
+    sponsors and voters can be resolved without a request apiece.
+
+    Entries are kept in ``legislators.sqlite3`` in the openstates cache
+    directory, keyed by (jurisdiction, session, member id), and read into
+    memory in one go, so lookups are dictionary lookups. Values can be
+    anything JSON serializable (a name, or the record the source returned).
+
+    ``populate(fetch)`` fills the directory in bulk, calling ``fetch()``
+    only if the stored copy is missing or older than ``max_age`` seconds;
+    ``resolve(member_id, fetch_one)`` looks a single member up, fetching
+    and storing them if they aren't known yet.
+    """
+
+    def __init__(self, jurisdiction, session, directory=None):
+        directory = directory or settings.CACHE_DIR or "_cache"
+        self.path = os.path.join(directory, "legislators.sqlite3")
+        self.jurisdiction = jurisdiction
+        self.session = str(session)
+        self._members = None
+        self._fetch = None
+        self._lock = threading.Lock()
+        # bumped whenever the members change, so indexes know to rebuild
+        self._version = 0
+        self._indexes = {}
+
+    @property
+    def members(self):
+        if self._members is None:
+            connection, lock = _connect(self.path)
+            with lock:
+                rows = connection.execute(
+                    "SELECT member_id, value FROM legislators "
+                    "WHERE jurisdiction = ? AND session = ?",
+                    (self.jurisdiction, self.session),
+                ).fetchall()
+            self._members = {member_id: json.loads(value) for member_id, value in rows}
+        return self._members
+
+    def age(self):
+        """Seconds since the directory was last populated in bulk, or None
+        if it never has been.
+        """
+        connection, lock = _connect(self.path)
+        with lock:
+            row = connection.execute(
+                "SELECT updated_at FROM populated WHERE jurisdiction = ? AND session = ?",
+                (self.jurisdiction, self.session),
+            ).fetchone()
+        return None if row is None else time.time() - row[0]
+
+    def populate(self, fetch, max_age=24 * 60 * 60):
+        """Fill the directory from ``fetch()``, an iterable of
+        ``(member_id, value)`` pairs, unless it was filled less than
+        ``max_age`` seconds ago. Returns the directory.
+
+        When the stored copy is used, ``fetch`` is kept: looking up an id
+        that isn't in it refreshes the directory (once) before giving up,
+        so a member who joined since isn't missed.
+        """
+        age = self.age()
+        if age is not None and max_age is not None and age <= max_age:
+            self._fetch = fetch
+            return self
+        self._replace(fetch())
+        return self
+
+    def _replace(self, members):
+        members = {str(member_id): value for member_id, value in members}
+        connection, lock = _connect(self.path)
+        key = (self.jurisdiction, self.session)
+        with lock, connection:
+            connection.execute(
+                "DELETE FROM legislators WHERE jurisdiction = ? AND session = ?", key
+            )
+            connection.executemany(
+                "INSERT INTO legislators VALUES (?, ?, ?, ?)",
+                [key + (k, json.dumps(v)) for k, v in members.items()],
+            )
+            connection.execute(
+                "REPLACE INTO populated VALUES (?, ?, ?)", key + (time.time(),)
+            )
+        self._members = members
+        self._fetch = None
+        self._version += 1
+
+    def _refresh(self, member_id):
+        with self._lock:
+            fetch, self._fetch = self._fetch, None
+            if fetch is not None and member_id not in self.members:
+                self._replace(fetch())
+
+    def set(self, member_id, value):
+        member_id = str(member_id)
+        connection, lock = _connect(self.path)
+        with lock, connection:
+            connection.execute(
+                "REPLACE INTO legislators VALUES (?, ?, ?, ?)",
+                (self.jurisdiction, self.session, member_id, json.dumps(value)),
+            )
+        self.members[member_id] = value
+        self._version += 1
+
+    def resolve(self, member_id, fetch_one=None):
+        """Return what's stored for ``member_id``. If it isn't known, a
+        stale bulk copy is refreshed, and failing that ``fetch_one(member_id)``
+        is called and its result stored; without ``fetch_one`` a KeyError
+        is raised.
+        """
+        member_id = str(member_id)
+        if member_id not in self.members:
+            self._refresh(member_id)
+        if member_id not in self.members:
+            if fetch_one is None:
+                raise KeyError(member_id)
+            self.set(member_id, fetch_one(member_id))
+        return self.members[member_id]
+
+    def _index(self, field):
+        members = self.members
+        version, index = self._indexes.get(field, (None, None))
+        if version != self._version:
+            index = {value.get(field): value for value in members.values()}
+            self._indexes[field] = (self._version, index)
+        return index
+
+    def find(self, field, value):
+        """The member whose record has ``value`` for ``field`` (for
+        directories of dicts, like a lookup by short name rather than id).
+        A miss refreshes a stale bulk copy, as ``resolve`` does, before
+        raising KeyError.
+        """
+        index = self._index(field)
+        if value not in index:
+            self._refresh(None)
+            index = self._index(field)
+        return index[value]
+
+    def get(self, member_id, default=None):
+        try:
+            return self.resolve(member_id)
+        except KeyError:
+            return default
+
+    def __getitem__(self, member_id):
+        return self.resolve(member_id)
+
+    def __contains__(self, member_id):
+        return str(member_id) in self.members
+
+    def __len__(self):
+        return len(self.members)
+
+    def __iter__(self):
+        return iter(self.members)
+
+    def values(self):
+        return self.members.values()
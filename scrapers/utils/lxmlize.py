@@ -1,9 +1,11 @@
 import requests
 import lxml.html
 
+from . import http
+
 
 def url_xpath(url, path, verify=True):
-    doc = lxml.html.fromstring(requests.get(url, verify=verify).text)
+    doc = lxml.html.fromstring(http.get(url, verify=verify).text)
     return doc.xpath(path)
 
 
@@ -0,0 +1,142 @@
+import io
+import os
+import csv
+import glob
+import json
+import hashlib
+import sqlite3
+import subprocess
+
+from openstates import settings
+
+
+def _quote(name):
+    return '"%s"' % name.replace('"', '""')
+
+
+def _glob_escape(value):
+    return "".join("[%s]" % c if c in "*?[" else c for c in value)
+
+
+class AccessDatabase(object):
+    """Tables of an Access database, read with mdbtools.
+
+    Each table is run through ``mdb-export`` the first time it's asked for
+    and stored in a SQLite file keyed on a hash of the database, so any
+    later read of the table (by another scraper, or on the next run if the
+    database hasn't changed) comes from SQLite instead, with indexes for
+    lookups by column.
+
+    Rows are dicts of strings, as ``csv.DictReader`` would return them.
+
+    ``source`` (the URL the database was downloaded from) names whose
+    copy the SQLite file is: opening a new version of a source's database
+    deletes the files kept for its old versions, so a database that's
+    downloaded daily doesn't leave a copy behind every day.
+    """
+
+    def __init__(self, mdbfile, source=None, cache_dir=None):
+        self.mdbfile = mdbfile
+
+        digest = hashlib.sha1()
+        with open(mdbfile, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+
+        directory = os.path.join(cache_dir or settings.CACHE_DIR or "_cache", "mdb")
+        os.makedirs(directory, exist_ok=True)
+        name = digest.hexdigest() + ".sqlite3"
+        if source is not None:
+            prefix = hashlib.sha1(source.encode("utf8")).hexdigest()[:16]
+            name = "%s.%s" % (prefix, name)
+            for old in glob.glob(os.path.join(directory, prefix + ".*")):
+                if not os.path.basename(old).startswith(name):
+                    os.remove(old)
+        self.path = os.path.join(directory, name)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS _exported "
+            "(name TEXT PRIMARY KEY, columns TEXT NOT NULL)"
+        )
+        self._columns = {}
+
+    def columns(self, table):
+        if table not in self._columns:
+            row = self.connection.execute(
+                "SELECT columns FROM _exported WHERE name = ?", (table,)
+            ).fetchone()
+            if row is None:
+                self._columns[table] = self._export(table)
+            else:
+                self._columns[table] = json.loads(row[0])
+        return self._columns[table]
+
+    def _export(self, table):
+        process = subprocess.Popen(
+            ["mdb-export", self.mdbfile, table], stdout=subprocess.PIPE, close_fds=True
+        )
+        reader = csv.reader(
+            io.TextIOWrapper(process.stdout, encoding="utf8", newline="")
+        )
+        columns = next(reader, [])
+        width = len(columns)
+
+        # column names can repeat, so the SQLite columns are just numbered
+        sql_table = _quote("t_" + table)
+        with self.connection:
+            self.connection.execute("DROP TABLE IF EXISTS %s" % sql_table)
+            self.connection.execute(
+                "CREATE TABLE %s (%s)"
+                % (sql_table, ", ".join("c%d" % i for i in range(width)) or "c0")
+            )
+            if width:
+                self.connection.executemany(
+                    "INSERT INTO %s VALUES (%s)" % (sql_table, ", ".join("?" * width)),
+                    # short rows are padded with None like DictReader does
+                    (row[:width] + [None] * (width - len(row)) for row in reader),
+                )
+            if process.wait() != 0:
+                raise OSError("mdb-export %s %s failed" % (self.mdbfile, table))
+            self.connection.execute(
+                "INSERT INTO _exported (name, columns) VALUES (?, ?)",
+                (table, json.dumps(columns)),
+            )
+        return columns
+
+    def _column(self, table, column):
+        columns = self.columns(table)
+        # with repeated names DictReader keeps the last one
+        i = len(columns) - 1 - columns[::-1].index(column)
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS %s ON %s (c%d)"
+            % (_quote("i_%s_%d" % (table, i)), _quote("t_" + table), i)
+        )
+        return "c%d" % i
+
+    def _select(self, table, where="", params=()):
+        columns = self.columns(table)
+        # fetched up front so no statement is left open when another table
+        # needs exporting
+        rows = self.connection.execute(
+            "SELECT * FROM %s %s ORDER BY rowid" % (_quote("t_" + table), where),
+            params,
+        ).fetchall()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def rows(self, table):
+        """All rows of ``table``, in export order."""
+        return self._select(table)
+
+    def lookup(self, table, column, value):
+        """Rows of ``table`` where ``column`` equals ``value``."""
+        return self._select(
+            table, "WHERE %s = ?" % self._column(table, column), (value,)
+        )
+
+    def startswith(self, table, column, prefix):
+        """Rows of ``table`` where ``column`` starts with ``prefix``."""
+        return self._select(
+            table,
+            "WHERE %s GLOB ?" % self._column(table, column),
+            (_glob_escape(prefix) + "*",),
+        )
@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+def paginate(fetch, first, next_key, prefetch=True):
+    """Yield each page of a paginated listing, in order.
+
+    ``fetch(key)`` retrieves the page for ``key`` (a URL, an offset, ...),
+    starting with ``first``, and ``next_key(key, page)`` returns the key of
+    the page after it, or None if it was the last one.
+
+    Pages are walked in a loop rather than by recursing, and unless
+    ``prefetch`` is off the next page is fetched on a background thread
+    while the caller works through the current one. An exception raised
+    fetching a page is raised here when that page is reached.
+
+    With prefetch, ``fetch`` runs on another thread at the same time as
+    whatever requests the caller makes, so a Scraper that paginates this
+    way needs utils.parallel.ParallelFetchMixin to keep its throttle safe.
+    """
+    if not prefetch:
+        key = first
+        while key is not None:
+            page = fetch(key)
+            yield page
+            key = next_key(key, page)
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        key = first
+        future = pool.submit(fetch, key)
+        try:
+            while future is not None:
+                page = future.result()
+                key = next_key(key, page)
+                future = pool.submit(fetch, key) if key is not None else None
+                yield page
+        finally:
+            # don't wait on a page nobody is going to read
+            if future is not None:
+                future.cancel()
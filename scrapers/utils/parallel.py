@@ -0,0 +1,58 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ParallelFetchMixin(object):
+    """Mixin for Scrapers that make requests from several threads at once.
+
+    scrapelib's requests_per_minute throttle isn't thread safe (every thread
+    that checks it at the same moment goes straight through), so here it is
+    taken one thread at a time; requests still overlap on the wire, but
+    they're started no faster than the scraper's budget allows. This must
+    come before ``Scraper`` in the class's bases.
+    """
+
+    max_workers = 4
+
+    def _throttle(self):
+        lock = self.__dict__.setdefault("_throttle_lock", threading.Lock())
+        with lock:
+            super()._throttle()
+
+    def prefetch(self, items, urls_for, window=None):
+        """Yield each of ``items`` once ``urls_for(item)`` have all been
+        requested, keeping requests for the next few items in flight while
+        the caller works on the current one.
+
+        The responses are handed out by ``fetch(url)``, which falls back to
+        ``self.get`` for anything that wasn't prefetched; a request's
+        exception is raised from ``fetch`` just as ``self.get`` would have.
+        """
+        window = window or self.max_workers * 2
+        self._prefetched = {}
+        items = list(items)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+
+            def submit(item):
+                urls = urls_for(item)
+                for url in urls:
+                    if url not in self._prefetched:
+                        self._prefetched[url] = pool.submit(self.get, url)
+                return urls
+
+            pending = [submit(item) for item in items[:window]]
+            for i, item in enumerate(items):
+                if i + window < len(items):
+                    pending.append(submit(items[i + window]))
+                urls = pending.pop(0)
+                yield item
+                # drop whatever the caller didn't use
+                for url in urls:
+                    self._prefetched.pop(url, None)
+
+    def fetch(self, url):
+        future = getattr(self, "_prefetched", {}).pop(url, None)
+        if future is None:
+            return self.get(url)
+        return future.result()
@@ -0,0 +1,74 @@
+import os
+import hashlib
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from openstates import settings
+
+
+def _command(filename, type):
+    return {
+        "text": ["pdftotext", "-layout", filename, "-"],
+        "text-nolayout": ["pdftotext", filename, "-"],
+        "xml": ["pdftohtml", "-xml", "-stdout", filename],
+        "html": ["pdftohtml", "-stdout", filename],
+    }[type]
+
+
+def _cache_path(digest, type):
+    cache_dir = settings.CACHE_DIR or "_cache"
+    return os.path.join(cache_dir, "pdf", digest[:2], "%s.%s" % (digest, type))
+
+
+def _run(filename, type):
+    command = _command(filename, type)
+    try:
+        process = subprocess.run(command, stdout=subprocess.PIPE, close_fds=True)
+    except OSError as e:
+        raise EnvironmentError(
+            "error running %s, missing executable? [%s]" % (" ".join(command), e)
+        )
+    return process.stdout
+
+
+def convert_pdf(filename, type="xml"):
+    """Convert a PDF with poppler, like ``openstates.utils.convert_pdf``.
+
+    Output is cached on disk keyed by a hash of the PDF's contents and
+    ``type``, so a document that has already been converted (on this run
+    or an earlier one) doesn't start another subprocess.
+    """
+    with open(filename, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    path = _cache_path(digest, type)
+
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+
+    data = _run(filename, type)
+
+    # empty output means poppler couldn't read the file, don't keep that
+    if data:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = "%s.%d.%d.tmp" % (path, os.getpid(), threading.get_ident())
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return data
+
+
+def convert_pdfs(filenames, type="xml", workers=None):
+    """Convert many PDFs at once, returning their output in the same order.
+
+    Each conversion is its own poppler process, so a thread pool is enough
+    to keep ``workers`` of them (one per CPU by default) running at a time.
+    """
+    filenames = list(filenames)
+    if len(filenames) < 2:
+        return [convert_pdf(filename, type) for filename in filenames]
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        return list(pool.map(lambda filename: convert_pdf(filename, type), filenames))
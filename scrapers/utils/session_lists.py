@@ -0,0 +1,33 @@
+"""
+Fetch and cache jurisdictions' session lists in parallel, e.g. ahead of a
+batch of os-update runs.
+
+Usage:
+
+    PYTHONPATH=scrapers python -m utils.session_lists [ak al ...] [--workers 8]
+"""
+import sys
+import argparse
+
+from .state import prefetch_session_lists
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("jurisdictions", nargs="*")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    failed = 0
+    results = prefetch_session_lists(args.jurisdictions, args.workers)
+    for module_name, sessions in results.items():
+        if isinstance(sessions, Exception):
+            failed += 1
+            print("{}: {!r}".format(module_name, sessions))
+        else:
+            print("{}: {} sessions".format(module_name, len(sessions)))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
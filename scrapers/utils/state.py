@@ -1,6 +1,19 @@
+import os
+import logging
+import functools
+import importlib
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
 from openstates.scrape import Jurisdiction, Organization
 import openstates_metadata
 
+from .cache import KeyValueCache
+
+logger = logging.getLogger(__name__)
+session_list_cache = KeyValueCache("session_lists")
+
 _name_fixes = {
     "SouthCarolina": "South Carolina",
     "NorthCarolina": "North Carolina",
@@ -17,6 +30,47 @@ _name_fixes = {
 }
 
 
+class LazyMetadata(object):
+    """
+    Looks up a State subclass's openstates_metadata the first time it's
+    used and then replaces itself on that class with the result, so
+    importing a jurisdiction doesn't pay for the lookup
+    """
+
+    def __get__(self, obj, cls):
+        name = _name_fixes.get(cls.__name__, cls.__name__)
+        metadata = openstates_metadata.lookup(name=name)
+        cls.metadata = metadata
+        return metadata
+
+
+class LazyScrapers(Mapping):
+    """
+    A State's scrapers, given as "module:Class" paths relative to the
+    jurisdiction's package and imported the first time each is looked up,
+    so running one scraper (or just listing them) doesn't import the
+    others and everything they depend on
+    """
+
+    def __init__(self, package, paths):
+        self.package = package
+        self.paths = paths
+        self._loaded = {}
+
+    def __getitem__(self, name):
+        if name not in self._loaded:
+            module_name, _, class_name = self.paths[name].partition(":")
+            module = importlib.import_module(module_name, self.package)
+            self._loaded[name] = getattr(module, class_name)
+        return self._loaded[name]
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+
 # this metaclass is a hack to only add the classification on subclasses
 # update checks for a few properties to ensure it has a complete Jurisdiction
 # and if they're all present on State it'll try to run with it instead
@@ -26,13 +80,81 @@ class MetaShim(type):
         c = super().__new__(cls, name, bases, dct)
         if name != "State":
             c.classification = "government"
-            # while we're here, load the metadata (formerly on a cached property)
-            name = _name_fixes.get(name, name)
-            c.metadata = openstates_metadata.lookup(name=name)
+            # metadata is looked up on first use, see LazyMetadata
+            c.metadata = LazyMetadata()
+            # and route get_session_list through the cache
+            if "get_session_list" in dct:
+                c.get_session_list = _cached_session_list(dct["get_session_list"])
         return c
 
 
+def _cached_session_list(get_session_list):
+    @functools.wraps(get_session_list)
+    def wrapper(self):
+        return self.cached_session_list(get_session_list)
+
+    wrapper.uncached = get_session_list
+    return wrapper
+
+
+def _call_with_timeout(func, timeout, *args):
+    if timeout is None:
+        return func(*args)
+
+    result = {}
+
+    def run():
+        try:
+            result["value"] = func(*args)
+        except BaseException as e:
+            result["error"] = e
+
+    # a daemon thread, so a request that never returns can't hold up exit
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError("no response after {}s".format(timeout))
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
 class State(Jurisdiction, metaclass=MetaShim):
+    # how long a scraped session list is used before asking the site again,
+    # and how long to wait on the site when there's an older list to fall
+    # back on
+    session_list_ttl = 6 * 60 * 60
+    session_list_timeout = 30
+
+    def cached_session_list(self, get_session_list):
+        """
+        Call a subclass's get_session_list, unless it was called less than
+        session_list_ttl seconds ago; if the site errors or is slow and there
+        is an older list, use that instead
+        """
+        key = type(self).__module__
+        sessions = session_list_cache.get(key, max_age=self.session_list_ttl)
+        if sessions is not None:
+            return sessions
+
+        stale = session_list_cache.get(key)
+        timeout = self.session_list_timeout if stale is not None else None
+        try:
+            sessions = list(_call_with_timeout(get_session_list, timeout, self))
+        except Exception as e:
+            if stale is None:
+                raise
+            logger.warning(
+                "couldn't get session list for %s (%r), using the cached one",
+                key,
+                e,
+            )
+            return stale
+
+        session_list_cache.set(key, sessions)
+        return sessions
+
     @property
     def division_id(self):
         return self.metadata.division_id
@@ -61,3 +183,40 @@ class State(Jurisdiction, metaclass=MetaShim):
                 classification="lower",
                 parent_id=legislature._id,
             )
+
+
+def jurisdiction_modules():
+    """ the names of the jurisdiction packages alongside utils """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return sorted(
+        name
+        for name in os.listdir(root)
+        if name not in ("utils", "benchmarks")
+        and os.path.exists(os.path.join(root, name, "__init__.py"))
+    )
+
+
+def get_state_class(module_name):
+    module = importlib.import_module(module_name)
+    for obj in vars(module).values():
+        if isinstance(obj, type) and issubclass(obj, State) and obj is not State:
+            return obj
+    raise ValueError("no State subclass in {}".format(module_name))
+
+
+def prefetch_session_lists(module_names=None, workers=8):
+    """
+    Fill the session list cache for many jurisdictions at once (all of them
+    by default), so a batch of os-update runs doesn't start with a page
+    load each. Returns {module name: session list or the exception raised}.
+    """
+    module_names = module_names or jurisdiction_modules()
+
+    def fetch(module_name):
+        try:
+            return get_state_class(module_name)().get_session_list()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(module_names, pool.map(fetch, module_names)))
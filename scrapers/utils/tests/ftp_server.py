@@ -0,0 +1,43 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+try:
+    from pyftpdlib.authorizers import DummyAuthorizer
+    from pyftpdlib.handlers import FTPHandler
+    from pyftpdlib.servers import FTPServer
+except ImportError:  # pragma: no cover
+    FTPServer = None
+
+
+@unittest.skipIf(FTPServer is None, "pyftpdlib isn't installed")
+class FTPServerTestCase(unittest.TestCase):
+    """Runs an anonymous FTP server on localhost for each test, serving
+    ``self.root`` (files are put there with ``write``) on ``self.port``.
+    pyftpdlib is only needed for tests, so they're skipped without it.
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        authorizer = DummyAuthorizer()
+        authorizer.add_anonymous(self.root)
+        handler = type("Handler", (FTPHandler,), {"authorizer": authorizer})
+        self.server = FTPServer(("127.0.0.1", 0), handler)
+        self.port = self.server.address[1]
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"timeout": 0.1}
+        )
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.close_all()
+        self.thread.join()
+        shutil.rmtree(self.root)
+
+    def write(self, path, data):
+        path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb" if isinstance(data, bytes) else "w") as f:
+            f.write(data)
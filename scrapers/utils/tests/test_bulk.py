@@ -0,0 +1,101 @@
+import csv
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from openstates import settings
+
+from utils import bulk
+from utils.cache import KeyValueCache
+from utils.tests.ftp_server import FTPServerTestCase
+
+
+class TestSniffEncoding(unittest.TestCase):
+    def test_sniff(self):
+        self.assertEqual(bulk.sniff_encoding("a|b\r\n".encode("utf-16")), "utf-16")
+        self.assertEqual(
+            bulk.sniff_encoding("a|b\r\n".encode("utf-16-le")), "utf-16-le"
+        )
+        self.assertEqual(bulk.sniff_encoding("café".encode("utf-8")[:-1]), "utf-8")
+        self.assertEqual(bulk.sniff_encoding(b"plain"), "utf-8")
+
+
+class TestBulkReader(FTPServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = tempfile.mkdtemp()
+        patches = [
+            mock.patch.object(settings, "CACHE_DIR", self.cache),
+            mock.patch.object(bulk, "encodings", KeyValueCache("enc", self.cache)),
+            mock.patch.object(bulk, "CHUNK_SIZE", 7),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.url = "ftp://127.0.0.1:%d/data/" % self.port
+
+    def tearDown(self):
+        bulk.close()
+        super().tearDown()
+        shutil.rmtree(self.cache)
+
+    def test_utf_16_with_nuls(self):
+        text = "H|1001|Café\x00\r\nS|2|\x00x\r\n"
+        self.write("data/measures.txt", text.encode("utf-16"))
+        rows = list(
+            csv.reader(
+                bulk.iter_lines(self.url + "measures.txt", drop="\x00\r"),
+                delimiter="|",
+            )
+        )
+        self.assertEqual(rows, [["H", "1001", "Café"], ["S", "2", "x"]])
+        self.assertEqual(bulk.encodings.get(self.url + "measures.txt"), "utf-16")
+
+    def test_csv_with_quoted_newlines(self):
+        self.write(
+            "data/bills.csv", b'bill_num,title\r\nHB1,"two\r\nlines"\r\nSB2,x\r\n'
+        )
+        rows = list(bulk.open_csv(self.url + "bills.csv"))
+        self.assertEqual(
+            rows,
+            [
+                {"bill_num": "HB1", "title": "two\r\nlines"},
+                {"bill_num": "SB2", "title": "x"},
+            ],
+        )
+
+    def test_lines_end_at_newlines_only(self):
+        self.write("data/ff.csv", b"a,b\r\nx\x0cy,z\x1e\r\nlast,\x85")
+        lines = list(bulk.iter_lines(self.url + "ff.csv", encoding="cp1252"))
+        self.assertEqual(lines, ["a,b\r\n", "x\x0cy,z\x1e\r\n", "last,\u2026"])
+        rows = list(bulk.open_csv(self.url + "ff.csv"))
+        self.assertEqual(
+            rows, [{"a": "x\x0cy", "b": "z\x1e"}, {"a": "last", "b": "\u2026"}]
+        )
+
+    def test_remembered_encoding_expires(self):
+        url = self.url + "enc.txt"
+        self.write("data/enc.txt", "a,b\r\n".encode("utf-16"))
+        bulk.encodings.set(url, "cp1252")
+        with mock.patch.object(bulk, "ENCODING_MAX_AGE", -1):
+            self.assertEqual(list(bulk.iter_lines(url)), ["a,b\r\n"])
+        self.assertEqual(bulk.encodings.get(url), "utf-16")
+
+    def test_late_cp1252_falls_back(self):
+        data = b"a,b\r\n" + b"x,y\r\n" * 20000 + b"caf\xe9,z\r\n"
+        self.write("data/late.csv", data)
+        url = self.url + "late.csv"
+        rows = list(bulk.open_csv(url))
+        self.assertEqual(rows[-1], {"a": "café", "b": "z"})
+        self.assertEqual(bulk.encodings.get(url), "utf-8")
+
+    def test_stray_byte_in_utf_8(self):
+        self.write("data/stray.csv", "a,b\r\ncafé,naïve\r\n".encode("utf-8") + b"\xe9")
+        url = self.url + "stray.csv"
+        self.assertEqual(list(bulk.iter_lines(url)), ["a,b\r\n", "café,naïve\r\n", "é"])
+        self.assertEqual(bulk.encodings.get(url), "utf-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import datetime
+import tempfile
+import unittest
+from unittest import mock
+
+from openstates.exceptions import ScrapeError
+
+from utils import incremental
+from utils.cache import KeyValueCache
+from utils.incremental import HighWaterMark, parse_relative_time
+
+
+class ORBillScraper(object):
+    pass
+
+
+class TestHighWaterMark(unittest.TestCase):
+    def setUp(self):
+        self.cache = KeyValueCache("marks", directory=tempfile.mkdtemp())
+        patcher = mock.patch.object(incremental, "high_water_marks", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.scraper = ORBillScraper()
+
+    def test_parse_relative_time(self):
+        self.assertEqual(
+            parse_relative_time("1d6h"), datetime.timedelta(days=1, hours=6)
+        )
+        self.assertIsNone(parse_relative_time("2021-03-01"))
+        self.assertIsNone(parse_relative_time(""))
+
+    def test_mark_waits_for_import(self):
+        with HighWaterMark(self.scraper, "2021R1") as mark:
+            self.assertTrue(mark.changed(datetime.datetime(2000, 1, 1)))
+
+        with mock.patch.object(incremental, "imported", return_value=False):
+            self.assertIsNone(HighWaterMark(self.scraper, "2021R1").last())
+            self.assertIsNone(
+                HighWaterMark(self.scraper, "2021R1", "last").changed_since
+            )
+
+        with mock.patch.object(incremental, "imported", return_value=True):
+            last = HighWaterMark(self.scraper, "2021R1").last()
+        self.assertEqual(last, mark.started)
+
+        # once confirmed, the mark stands until another scrape is imported
+        with HighWaterMark(self.scraper, "2021R1"):
+            pass
+        with mock.patch.object(incremental, "imported", return_value=False):
+            mark = HighWaterMark(self.scraper, "2021R1", since="last")
+        self.assertEqual(mark.changed_since, last - HighWaterMark.overlap)
+        self.assertIsNone(HighWaterMark(self.scraper, "2022R1", "last").changed_since)
+
+    def test_failed_scrape_keeps_mark(self):
+        with self.assertRaises(RuntimeError):
+            with HighWaterMark(self.scraper, "2021R1"):
+                raise RuntimeError
+        with mock.patch.object(incremental, "imported", return_value=True):
+            self.assertIsNone(HighWaterMark(self.scraper, "2021R1").last())
+
+    def test_imported_without_database(self):
+        now = incremental.utcnow()
+        self.assertFalse(incremental.imported("ocd-jurisdiction/x", now, now))
+        self.assertFalse(incremental.imported(None, now, now))
+
+    def test_nothing_changed(self):
+        class Base(object):
+            def do_scrape(self, **kwargs):
+                self.output_names = {}
+                for _ in self.scrape(**kwargs):
+                    pass
+                raise ScrapeError("no objects returned from ORBillScraper scrape")
+
+        class Scraper(incremental.IncrementalMixin, Base):
+            def info(self, *args):
+                pass
+
+            def scrape(self, since=None):
+                with HighWaterMark(self, "2021R1", since) as mark:
+                    if mark.changed(datetime.datetime(2000, 1, 1)):
+                        yield "bill"
+
+        record = Scraper().do_scrape(since="2021-03-01")
+        self.assertEqual(record["skipped"], 1)
+        self.assertEqual(record["objects"], {})
+        with self.assertRaises(ScrapeError):
+            Scraper().do_scrape()
+
+    def test_changed(self):
+        mark = HighWaterMark(self.scraper, "2021R1", since="2021-03-01T12:00")
+        self.assertTrue(mark.changed(datetime.datetime(2021, 3, 2)))
+        self.assertTrue(mark.changed(None))
+        self.assertTrue(
+            mark.changed(datetime.datetime(2021, 2, 1), datetime.datetime(2021, 3, 5))
+        )
+        self.assertFalse(mark.changed(datetime.datetime(2021, 3, 1, 11)))
+        self.assertEqual(mark.skipped, 1)
+
+        with self.assertRaises(ValueError):
+            HighWaterMark(self.scraper, "2021R1", since="yesterday")
+
+    def test_changed_dates(self):
+        mark = HighWaterMark(self.scraper, "2021R1", since="2021-03-02T03:00")
+        # an action dated the day before, posted after the last run started
+        self.assertTrue(mark.changed(dates=[datetime.date(2021, 3, 1)]))
+        self.assertTrue(mark.changed(dates=[datetime.datetime(2021, 3, 1, 0, 0)]))
+        self.assertFalse(mark.changed(dates=[datetime.date(2021, 2, 28)]))
+        # 03:00 UTC is still March 1st in the eastern US
+        tz = datetime.timezone(datetime.timedelta(hours=-5))
+        self.assertTrue(mark.changed(dates=[datetime.date(2021, 2, 28)], tz=tz))
+        self.assertTrue(
+            mark.changed(
+                datetime.datetime(2021, 3, 2, 4),
+                dates=[datetime.date(2021, 1, 1)],
+            )
+        )
+        self.assertEqual(mark.skipped, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import shutil
+import tempfile
+import unittest
+
+from utils.legislators import LegislatorDirectory
+
+
+class TestLegislatorDirectory(unittest.TestCase):
+    def setUp(self):
+        self.cache = tempfile.mkdtemp()
+        self.fetches = 0
+        self.roster = [(1, "Ann Smith"), (2, "Bob Jones")]
+
+    def tearDown(self):
+        shutil.rmtree(self.cache)
+
+    def fetch(self):
+        self.fetches += 1
+        return list(self.roster)
+
+    def directory(self, session="2021"):
+        return LegislatorDirectory("xx", session, directory=self.cache)
+
+    def test_populated_once_and_persisted(self):
+        members = self.directory().populate(self.fetch)
+        self.assertEqual(members["1"], "Ann Smith")
+        self.assertEqual(members[2], "Bob Jones")
+
+        members = self.directory().populate(self.fetch)
+        self.assertEqual(members[1], "Ann Smith")
+        self.assertEqual(len(members), 2)
+        self.assertEqual(self.fetches, 1)
+
+        self.assertEqual(len(self.directory("2022")), 0)
+
+    def test_stale_copy_refreshed_on_miss(self):
+        self.directory().populate(self.fetch)
+        self.roster.append((3, "Cy Young"))
+
+        members = self.directory().populate(self.fetch)
+        self.assertEqual(members[3], "Cy Young")
+        self.assertEqual(self.fetches, 2)
+        with self.assertRaises(KeyError):
+            members[4]
+        self.assertEqual(self.fetches, 2)
+
+        members = self.directory().populate(self.fetch, max_age=0)
+        self.assertEqual(self.fetches, 3)
+
+    def test_resolve_single_member(self):
+        members = self.directory()
+        self.assertEqual(members.resolve(7, lambda id: "Member %s" % id), "Member 7")
+        self.assertEqual(self.directory().resolve(7), "Member 7")
+        self.assertIsNone(self.directory().get(8))
+
+    def test_find_by_field_follows_refresh(self):
+        self.roster = [(1, {"ShortName": "Smith"}), (2, {"ShortName": "Jones"})]
+        self.directory().populate(self.fetch)
+        self.roster.append((3, {"ShortName": "Young"}))
+
+        members = self.directory().populate(self.fetch)
+        self.assertEqual(members.find("ShortName", "Smith"), {"ShortName": "Smith"})
+        self.assertEqual(members.find("ShortName", "Young"), {"ShortName": "Young"})
+        self.assertEqual(self.fetches, 2)
+
+        members.set(4, {"ShortName": "Day"})
+        self.assertEqual(members.find("ShortName", "Day"), {"ShortName": "Day"})
+        with self.assertRaises(KeyError):
+            members.find("ShortName", "Nobody")
+
+
+if __name__ == "__main__":
+    unittest.main()
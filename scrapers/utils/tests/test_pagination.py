@@ -0,0 +1,69 @@
+import sys
+import threading
+import unittest
+
+from utils.pagination import paginate
+
+
+def synthetic_pages(count, size=10):
+    def fetch(n):
+        return list(range(n * size, (n + 1) * size))
+
+    def next_key(n, page):
+        return n + 1 if n + 1 < count else None
+
+    return fetch, next_key
+
+
+class TestPaginate(unittest.TestCase):
+    def test_thousands_of_pages(self):
+        pages = 5 * sys.getrecursionlimit()
+        fetch, next_key = synthetic_pages(pages)
+        items = [item for page in paginate(fetch, 0, next_key) for item in page]
+        self.assertEqual(items, list(range(pages * 10)))
+
+    def test_without_prefetch(self):
+        fetch, next_key = synthetic_pages(3000)
+        pages = list(paginate(fetch, 0, next_key, prefetch=False))
+        self.assertEqual(len(pages), 3000)
+        self.assertEqual(pages[-1][-1], 29999)
+
+    def test_next_page_fetched_while_processing(self):
+        fetched = {0: threading.Event(), 1: threading.Event()}
+
+        def fetch(n):
+            fetched[n].set()
+            return [n]
+
+        pages = paginate(fetch, 0, lambda n, page: 1 if n == 0 else None)
+        self.assertEqual(next(pages), [0])
+        self.assertTrue(fetched[1].wait(5))
+        self.assertEqual(list(pages), [[1]])
+
+    def test_fetch_error_raised_at_page(self):
+        def fetch(n):
+            if n == 2:
+                raise ValueError("page 2")
+            return [n]
+
+        pages = paginate(fetch, 0, lambda n, page: n + 1)
+        self.assertEqual(next(pages), [0])
+        self.assertEqual(next(pages), [1])
+        with self.assertRaises(ValueError):
+            next(pages)
+
+    def test_stops_early(self):
+        calls = []
+
+        def fetch(n):
+            calls.append(n)
+            return [n]
+
+        for page in paginate(fetch, 0, lambda n, page: n + 1):
+            if page == [3]:
+                break
+        self.assertLessEqual(max(calls), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import unittest
+
+from utils.webforms import WebForm, parse_delta, scan_fields, scan_form
+
+PAGE = b"""<html><body>
+<form name="aspnetForm" method="post" action="./Results.aspx?s=20RS&amp;r=HB*" id="aspnetForm">
+<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="dDwtMTA4|MzU=" />
+<input type="hidden" name="__EVENTTARGET" id="__EVENTTARGET" value="" />
+<input type='hidden' name='__EVENTVALIDATION' value='/wEW&lt;AgL' />
+<input name="ctl00$txtSearch" value="taxes">
+<input type="submit" name="ctl00$btnSearch" value="Search" />
+<input type="checkbox" name="ctl00$chkActive" checked>
+<input type="checkbox" name="ctl00$chkPassed" value="1">
+<INPUT TYPE="radio" NAME="ctl00$rblChamber" VALUE="H" CHECKED>
+<input type="radio" name="ctl00$rblChamber" value="S">
+</form></body></html>"""
+
+
+class Response(object):
+    def __init__(self, url, content, content_type="text/html; charset=utf-8"):
+        self.url = url
+        self.content = content
+        self.text = content.decode("utf-8")
+        self.encoding = "utf-8"
+        self.headers = {"Content-Type": content_type}
+
+
+class Session(object):
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, **kwargs):
+        self.requests.append(("GET", url, kwargs))
+        return self.responses.pop(0)
+
+    def post(self, url, **kwargs):
+        self.requests.append(("POST", url, kwargs))
+        return self.responses.pop(0)
+
+
+def delta(*entries):
+    return "".join(
+        "%d|%s|%s|%s|" % (len(content), entry_type, entry_id, content)
+        for entry_type, entry_id, content in entries
+    ).encode("utf-8")
+
+
+class TestScan(unittest.TestCase):
+    def test_fields_a_browser_would_send(self):
+        self.assertEqual(
+            scan_fields(PAGE),
+            {
+                "__VIEWSTATE": "dDwtMTA4|MzU=",
+                "__EVENTTARGET": "",
+                "__EVENTVALIDATION": "/wEW<AgL",
+                "ctl00$txtSearch": "taxes",
+                "ctl00$chkActive": "on",
+                "ctl00$rblChamber": "H",
+            },
+        )
+
+    def test_form(self):
+        form = scan_form(PAGE, "aspnetForm")
+        self.assertEqual(form["action"], "./Results.aspx?s=20RS&r=HB*")
+        self.assertEqual(form["method"], "post")
+        self.assertIsNone(scan_form(PAGE, "other"))
+
+    def test_delta_content_with_pipes(self):
+        body = delta(
+            ("updatePanel", "ctl00_up", "<p>a|b</p>"),
+            ("hiddenField", "__VIEWSTATE", "xyz"),
+        )
+        self.assertEqual(
+            parse_delta(body.decode("utf-8")),
+            [
+                ("updatePanel", "ctl00_up", "<p>a|b</p>"),
+                ("hiddenField", "__VIEWSTATE", "xyz"),
+            ],
+        )
+
+    def test_malformed_delta(self):
+        with self.assertRaises(ValueError):
+            parse_delta("5|hiddenField|__VIEWSTATE|abc|")
+
+
+class TestWebForm(unittest.TestCase):
+    def test_post_back_carries_state(self):
+        second = PAGE.replace(b"dDwtMTA4|MzU=", b"second")
+        session = Session(
+            Response("http://example.gov/legis/Search.aspx", PAGE),
+            Response("http://example.gov/legis/Results.aspx?s=20RS&r=HB*", second),
+            Response("http://example.gov/legis/Results.aspx?s=20RS&r=HB*", PAGE),
+        )
+        form = WebForm(
+            session, "http://example.gov/legis/Search.aspx", headers={"referer": "x"}
+        )
+        form.get()
+        form.post_back("ctl00$gvResults", "Page$2")
+        form.post_back("ctl00$gvResults", "Page$3")
+
+        method, url, kwargs = session.requests[1]
+        self.assertEqual(method, "POST")
+        self.assertEqual(url, "http://example.gov/legis/Results.aspx?s=20RS&r=HB*")
+        self.assertEqual(kwargs["data"]["__VIEWSTATE"], "dDwtMTA4|MzU=")
+        self.assertEqual(kwargs["data"]["__EVENTTARGET"], "ctl00$gvResults")
+        self.assertEqual(kwargs["data"]["__EVENTARGUMENT"], "Page$2")
+        self.assertNotIn("ctl00$btnSearch", kwargs["data"])
+        self.assertEqual(kwargs["headers"], {"referer": "x"})
+        self.assertEqual(session.requests[2][2]["data"]["__VIEWSTATE"], "second")
+
+    def test_partial_post_back(self):
+        panel = '<div><input type="hidden" name="ctl00$hdnPage" value="2" /></div>'
+        session = Session(
+            Response("http://example.gov/Search.aspx", PAGE),
+            Response(
+                "http://example.gov/Search.aspx",
+                delta(
+                    ("updatePanel", "ctl00_upResults", panel),
+                    ("hiddenField", "__VIEWSTATE", "new|state"),
+                    ("formAction", "", "Search.aspx?page=2"),
+                ),
+                "text/plain; charset=utf-8",
+            ),
+        )
+        form = WebForm(session, "http://example.gov/Search.aspx")
+        form.get()
+        form.post_back(
+            "ctl00$gvResults", "Page$2", update_panel=("ctl00$sm", "ctl00$upResults")
+        )
+
+        data = session.requests[1][2]["data"]
+        self.assertEqual(data["ctl00$sm"], "ctl00$upResults|ctl00$gvResults")
+        self.assertEqual(data["__ASYNCPOST"], "true")
+        self.assertEqual(
+            session.requests[1][2]["headers"]["X-MicrosoftAjax"], "Delta=true"
+        )
+        self.assertEqual(form.panels, {"ctl00_upResults": panel})
+        self.assertEqual(form.fields["__VIEWSTATE"], "new|state")
+        self.assertEqual(form.fields["ctl00$hdnPage"], "2")
+        self.assertEqual(form.fields["ctl00$txtSearch"], "taxes")
+        self.assertEqual(form.action, "http://example.gov/Search.aspx?page=2")
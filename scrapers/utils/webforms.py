@@ -0,0 +1,200 @@
+import re
+import html
+import urllib.parse
+
+from . import http
+
+TAG_NAME_RE = re.compile(rb"<\w+")
+FORM_RE = re.compile(rb"<form\b[^>]*>", re.I)
+INPUT_RE = re.compile(rb"<input\b[^>]*>", re.I)
+ATTR_RE = re.compile(
+    rb"""([^\s=/>]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?""", re.S
+)
+
+# inputs a browser leaves out when it submits a form for a postback
+UNSENT_TYPES = {"submit", "button", "image", "reset", "file"}
+
+
+def _attributes(tag, encoding):
+    attrs = {}
+    for match in ATTR_RE.finditer(tag, TAG_NAME_RE.match(tag).end()):
+        name, double, single, bare = match.groups()
+        value = double if double is not None else single
+        if value is None:
+            value = bare if bare is not None else b""
+        attrs[name.decode("ascii", "replace").lower()] = html.unescape(
+            value.decode(encoding, "replace")
+        )
+    return attrs
+
+
+def scan_fields(content, encoding="utf-8"):
+    """The ``{name: value}`` of the inputs in ``content`` (bytes of HTML) a
+    browser would post back: hidden and text fields, and checkboxes and
+    radio buttons that are checked.
+
+    The markup is scanned for ``<input>`` tags rather than parsed, which
+    is much quicker than building a DOM when all that's wanted is the
+    __VIEWSTATE and friends of a large results page.
+    """
+    fields = {}
+    for tag in INPUT_RE.findall(content):
+        attrs = _attributes(tag, encoding)
+        name = attrs.get("name")
+        input_type = attrs.get("type", "text").lower()
+        if not name or input_type in UNSENT_TYPES:
+            continue
+        if input_type in ("checkbox", "radio") and "checked" not in attrs:
+            continue
+        fields[name] = attrs.get("value", "on" if input_type == "checkbox" else "")
+    return fields
+
+
+def scan_form(content, form_id=None, encoding="utf-8"):
+    """The attributes of the ``<form>`` with id ``form_id`` in ``content``
+    (or of the first form, without one), or None if there isn't one.
+    """
+    for tag in FORM_RE.findall(content):
+        attrs = _attributes(tag, encoding)
+        if form_id is None or attrs.get("id") == form_id:
+            return attrs
+    return None
+
+
+def parse_delta(text):
+    """Split the body of an ASP.NET AJAX partial postback into a list of
+    ``(type, id, content)`` entries. The body is a run of
+    ``length|type|id|content|`` records, where ``length`` is the length
+    of ``content``, which may itself contain pipes.
+    """
+    entries = []
+    position = 0
+    while position < len(text):
+        length_end = text.index("|", position)
+        length = int(text[position:length_end])
+        type_end = text.index("|", length_end + 1)
+        id_end = text.index("|", type_end + 1)
+        content_start = id_end + 1
+        content_end = content_start + length
+        if text[content_end : content_end + 1] != "|":
+            raise ValueError("malformed delta at %d" % position)
+        entries.append(
+            (
+                text[length_end + 1 : type_end],
+                text[type_end + 1 : id_end],
+                text[content_start:content_end],
+            )
+        )
+        position = content_end + 1
+    return entries
+
+
+class WebForm(object):
+    """A client for an ASP.NET WebForms page, carrying its form state
+    (__VIEWSTATE, __EVENTVALIDATION and the rest) from one response to the
+    next so postbacks don't have to rebuild it::
+
+        form = WebForm(self, "https://example.gov/Search.aspx")
+        form.get()
+        response = form.post({"ctl00$Body$txtYear": "2020", "ctl00$Body$btnSearch": "Search"})
+        while has_next_page(response):
+            response = form.post_back("ctl00$Body$gvResults", "Page$Next")
+
+    Requests are made with ``scraper`` (so they're throttled, retried and
+    share its cookies and connection pool) or the shared utils.http
+    session. Each response's state is found by scanning its markup for
+    ``<input>`` tags (see scan_fields), so callers only parse pages they
+    want more than the form state out of.
+
+    Passing ``update_panel`` (the ScriptManager's id, and the UpdatePanel
+    to refresh) to ``post_back`` makes a partial postback, as the page's
+    own script would; the delta it returns updates the hidden fields and
+    ``panels``, a dict of the HTML of each refreshed UpdatePanel by id.
+    """
+
+    def __init__(self, scraper=None, url=None, form_id=None, headers=None):
+        self.session = scraper or http.session()
+        self.url = url
+        self.action = url
+        self.method = "POST"
+        self.form_id = form_id
+        self.headers = headers or {}
+        self.fields = {}
+        self.panels = {}
+        self.response = None
+
+    def _request(self, method, url, **kwargs):
+        headers = dict(self.headers, **kwargs.pop("headers", {}))
+        if method == "GET":
+            response = self.session.get(url, headers=headers, **kwargs)
+        else:
+            response = self.session.post(url, headers=headers, **kwargs)
+        self.response = response
+        return response
+
+    def load(self, response):
+        """Take the form state from ``response``, a full page or a partial
+        postback's delta.
+        """
+        encoding = response.encoding or "utf-8"
+        base = response.url or self.url
+        if response.headers.get("Content-Type", "").startswith("text/plain"):
+            self._load_delta(response.text, encoding, base)
+            # a pageRedirect will have loaded another page
+            return self.response
+
+        content = response.content
+        form = scan_form(content, self.form_id, encoding)
+        if form is not None:
+            self.action = urllib.parse.urljoin(base, form.get("action") or base)
+            self.method = form.get("method", "post").upper()
+        self.fields = scan_fields(content, encoding)
+        self.panels = {}
+        return response
+
+    def _load_delta(self, text, encoding, base):
+        for entry_type, entry_id, content in parse_delta(text):
+            if entry_type == "hiddenField":
+                self.fields[entry_id] = content
+            elif entry_type == "updatePanel":
+                self.panels[entry_id] = content
+                self.fields.update(scan_fields(content.encode(encoding), encoding))
+            elif entry_type == "formAction":
+                self.action = urllib.parse.urljoin(base, html.unescape(content))
+            elif entry_type == "pageRedirect":
+                self.get(urllib.parse.urljoin(base, urllib.parse.unquote(content)))
+            elif entry_type == "error":
+                raise ValueError("partial postback failed: %s" % content)
+
+    def get(self, url=None, **kwargs):
+        """Load the page (``url``, or the one the form was made for)."""
+        if url is not None:
+            self.url = self.action = url
+        return self.load(self._request("GET", self.url, **kwargs))
+
+    def post(self, fields=None, **kwargs):
+        """Submit the form with the current state, overridden by ``fields``."""
+        data = dict(self.fields, **(fields or {}))
+        if self.method == "GET":
+            return self.load(self._request("GET", self.action, params=data, **kwargs))
+        return self.load(self._request("POST", self.action, data=data, **kwargs))
+
+    def post_back(
+        self, event_target, event_argument="", fields=None, update_panel=None, **kwargs
+    ):
+        """Do what ``__doPostBack(event_target, event_argument)`` does in a
+        browser. ``update_panel``, a ``(script_manager, panel)`` pair of
+        control names, makes it a partial postback.
+        """
+        data = dict(fields or {})
+        data["__EVENTTARGET"] = event_target
+        data["__EVENTARGUMENT"] = event_argument
+        if update_panel is not None:
+            script_manager, panel = update_panel
+            data[script_manager] = "%s|%s" % (panel, event_target)
+            data["__ASYNCPOST"] = "true"
+            headers = dict(kwargs.pop("headers", {}))
+            headers["X-MicrosoftAjax"] = "Delta=true"
+            headers["X-Requested-With"] = "XMLHttpRequest"
+            kwargs["headers"] = headers
+        return self.post(data, **kwargs)
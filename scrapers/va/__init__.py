@@ -1,18 +1,19 @@
 import logging
-from utils import url_xpath, State
-
-from .people import VaPersonScraper
-from .csv_bills import VaCSVBillScraper
-
+from utils import url_xpath, State, LazyScrapers
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-
 settings = {"SCRAPELIB_RPM": 40}
 
 
 class Virginia(State):
-    scrapers = {"people": VaPersonScraper, "bills": VaCSVBillScraper}
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:VaPersonScraper",
+            "bills": ".csv_bills:VaCSVBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2010 Session",
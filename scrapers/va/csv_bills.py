@@ -1,11 +1,15 @@
 import os
 import csv
 import re
+import codecs
 import pytz
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from openstates.scrape import Scraper, Bill, VoteEvent
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from sys import intern
 
+from utils.ftp import FTPCrawler
 from .common import SESSION_SITE_IDS
 
 tz = pytz.timezone("America/New_York")
@@ -41,156 +45,172 @@ ACTION_CLASSIFIERS = (
 )
 
 
-class VaCSVBillScraper(Scraper):
+# one of a bill's text versions
+TextDoc = namedtuple("TextDoc", "doc_abbr doc_date")
+# the first row for each bill in BILLS.CSV
+BillRow = namedtuple(
+    "BillRow",
+    "bill_id bill_description passed failed carried_over approved vetoed "
+    "introduction_date text_docs",
+)
+VOTE_RESULTS = {"Y": "yes", "N": "no", "X": "not voting", "A": "abstain"}
 
-    _url_base = (
-        f"ftp://{os.environ['VIRGINIA_FTP_USER']}:{os.environ['VIRGINIA_FTP_PASSWORD']}"
-    )
-    _url_base += "@legis.virginia.gov/fromdlas/csv"
-    _members = defaultdict(list)
-    _sponsors = defaultdict(list)
-    _amendments = defaultdict(list)
-    _history = defaultdict(list)
-    _votes = defaultdict(list)
-    _bills = defaultdict(list)
-    _summaries = defaultdict(list)
 
-    # Load members of legislative
-    def load_members(self):
-        resp = self.get(self._url_base + "Members.csv").text
+def _encoding(path, chunk_size=1 << 20):
+    """utf-8 if the whole file decodes as such, otherwise cp1252 (which is
+    what the LIS exports usually are). Reads the file a chunk at a time.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return "cp1252"
+    return "utf-8"
 
-        reader = csv.reader(resp.splitlines(), delimiter=",")
-        # ['MBR_HOU', 'MBR_MBRNO', 'MBR_NAME']
-        for row in reader:
-            self._members[row[1]].append(
-                {"chamber": row[0], "member_id": row[1], "name": row[2].strip()}
-            )
-        self.warning("Total Members Loaded: " + str(len(self._members)))
-        return True
 
-    def load_sponsors(self):
-        resp = self.get(self._url_base + "Sponsors.csv").text
+class VaCSVBillScraper(Scraper):
+    """Scrapes the CSV exports LIS puts on its FTP server for each session.
+
+    The files are downloaded in parallel over a few reused connections
+    (and not at all if they haven't changed since the last run), then read
+    a row at a time into indexes that belong to this scraper: tuples rather
+    than a dict per row, with member ids and names interned, since the
+    vote file alone has a row for every member on every roll call.
+    """
+
+    _ftp_host = "legis.virginia.gov"
+    _ftp_connections = 4
+    _files = [
+        "Members.csv",
+        "Sponsors.csv",
+        "Amendments.csv",
+        "HISTORY.CSV",
+        "Summaries.csv",
+        "VOTE.CSV",
+        "BILLS.CSV",
+    ]
+
+    def _rows(self, path, reader=csv.reader):
+        with open(path, newline="", encoding=_encoding(path)) as f:
+            yield from reader(f, delimiter=",")
 
-        reader = csv.reader(resp.splitlines(), delimiter=",")
-        # ['MEMBER_NAME', 'MEMBER_ID', 'BILL_NUMBER', 'PATRON_TYPE']
-        for row in reader:
-            self._sponsors[row[2]].append(
-                {
-                    "member_name": row[0].strip(),
-                    "member_id": row[1],
-                    "bill_number": row[2],
-                    "patron_type": row[3],
-                }
-            )
-        self.warning("Total Sponsors Loaded: " + str(len(self._sponsors)))
+    # Load members of legislative
+    def load_members(self, path):
+        members = {}
+        # ['MBR_HOU', 'MBR_MBRNO', 'MBR_NAME']
+        for row in self._rows(path):
+            members.setdefault(intern(row[1]), intern(row[2].strip()))
+        self.warning("Total Members Loaded: " + str(len(members)))
+        return members
 
-    def load_amendments(self):
-        resp = self.get(self._url_base + "Amendments.csv").text
-        reader = csv.reader(resp.splitlines(), delimiter=",")
+    def load_sponsors(self, path):
+        sponsors = defaultdict(list)
+        # ['MEMBER_NAME', 'MEMBER_ID', 'BILL_NUMBER', 'PATRON_TYPE']
+        for row in self._rows(path):
+            sponsors[row[2]].append((intern(row[0].strip()), intern(row[3])))
+        self.warning("Total Sponsors Loaded: " + str(len(sponsors)))
+        return dict(sponsors)
 
+    def load_amendments(self, path):
+        amendments = defaultdict(list)
         # ['BILL_NUMBER', 'TXT_DOCID']
-        for row in reader:
-            self._amendments[row[0].strip()].append(
-                {"bill_number": row[0].strip(), "txt_docid": row[1].strip()}
-            )
-        self.warning("Total Amendments Loaded: " + str(len(self._amendments)))
+        for row in self._rows(path):
+            amendments[row[0].strip()].append(row[1].strip())
+        self.warning("Total Amendments Loaded: " + str(len(amendments)))
+        return dict(amendments)
 
-    def load_history(self):
-        resp = self.get(self._url_base + "HISTORY.CSV").text
-        reader = csv.reader(resp.splitlines(), delimiter=",")
+    def load_history(self, path):
+        history = defaultdict(list)
         # ['Bill_id', 'History_date', 'History_description', 'History_refid']
-        for row in reader:
-            self._history[row[0]].append(
-                {
-                    "bill_id": row[0],
-                    "history_date": row[1],
-                    "history_description": row[2],
-                    "history_refid": row[3],
-                }
-            )
-        self.warning("Total Actions Loaded: " + str(len(self._history)))
-
-    def load_votes(self):
-        resp = self.get(self._url_base + "VOTE.CSV").text.splitlines()
-        for line in resp:
-            line = line.split(",")
+        for row in self._rows(path):
+            history[row[0]].append((row[1], row[2], row[3]))
+        self.warning("Total Actions Loaded: " + str(len(history)))
+        return dict(history)
+
+    def load_votes(self, path, members):
+        votes = {}
+        for row in self._rows(path):
             # First part of the line is always the history_refid number.
-            #   It has extra quotes around it
-            # Next number is the member_id number found in _members
-            # Y and X represent yes or no
-            history_refid = line[0].replace('"', "")
+            # After it come pairs of a member_id (found in members) and how
+            # they voted: Y, N, X (not voting) or A (abstain).
+            # Not every line has the same number of votes.
+            history_refid = row[0]
+            cast = []
+            for member_id, vote_result in zip(row[1::2], row[2::2]):
+                if member_id == "H0000" or member_id not in members:
+                    continue
+                cast.append(
+                    (members[member_id], VOTE_RESULTS.get(vote_result, vote_result))
+                )
             # Checks if votes are present
-            if len(line) > 1:
-                # Not every line has the same number of votes.
-                for v in range(1, len(line), 2):
-                    if (
-                        line[v] != '"H0000"'
-                        and len(self._members[line[v].replace('"', "")]) > 0
-                    ):
-                        member = self._members[line[v].replace('"', "")][0]["name"]
-                        vote_result = line[v + 1].replace('"', "")
-                        if vote_result == "Y":
-                            vote_result = "yes"
-                        elif vote_result == "N":
-                            vote_result = "no"
-                        elif vote_result == "X":
-                            vote_result = "not voting"
-                        elif vote_result == "A":
-                            vote_result = "abstain"
-                        self._votes[history_refid].append(
-                            {"member_id": member, "vote_result": vote_result}
-                        )
-        self.warning("Total Votes Loaded: " + str(len(self._votes)))
-
-    def load_bills(self):
-        resp = self.get(self._url_base + "BILLS.CSV").text
-        reader = csv.DictReader(resp.splitlines(), delimiter=",")
-        for row in reader:
-            text_doc_data = [
-                {"doc_abbr": row["Full_text_doc1"], "doc_date": row["Full_text_date1"]},
-                {"doc_abbr": row["Full_text_doc2"], "doc_date": row["Full_text_date2"]},
-                {"doc_abbr": row["Full_text_doc3"], "doc_date": row["Full_text_date3"]},
-                {"doc_abbr": row["Full_text_doc4"], "doc_date": row["Full_text_date4"]},
-                {"doc_abbr": row["Full_text_doc5"], "doc_date": row["Full_text_date5"]},
-                {"doc_abbr": row["Full_text_doc6"], "doc_date": row["Full_text_date6"]},
-            ]
-            self._bills[row["Bill_id"]].append(
-                {
-                    "bill_id": row["Bill_id"],
-                    "bill_description": row["Bill_description"],
-                    "passed": row["Passed"],
-                    "failed": row["Failed"],
-                    "carried_over": row["Carried_over"],
-                    "approved": row["Approved"],
-                    "vetoed": row["Vetoed"],
-                    "introduction_date": row["Introduction_date"],
-                    "text_docs": text_doc_data,
-                }
+            if cast:
+                votes.setdefault(history_refid, []).extend(cast)
+        self.warning("Total Votes Loaded: " + str(len(votes)))
+        return votes
+
+    def load_bills(self, path):
+        bills = {}
+        for row in self._rows(path, csv.DictReader):
+            if row["Bill_id"] in bills:
+                continue
+            text_docs = tuple(
+                TextDoc(row["Full_text_doc%d" % i], row["Full_text_date%d" % i])
+                for i in range(1, 7)
             )
-        self.warning("Total Bills Loaded: " + str(len(self._bills)))
+            bills[row["Bill_id"]] = BillRow(
+                row["Bill_id"],
+                row["Bill_description"],
+                row["Passed"],
+                row["Failed"],
+                row["Carried_over"],
+                row["Approved"],
+                row["Vetoed"],
+                row["Introduction_date"],
+                text_docs,
+            )
+        self.warning("Total Bills Loaded: " + str(len(bills)))
+        return bills
 
     # Used to clean summary texts
     def remove_html_tags(self, text):
         clean = re.compile("<.*?>")
         return re.sub(clean, "", text)
 
-    def load_summaries(self):
-        resp = self.get(self._url_base + "Summaries.csv").text
-        reader = csv.reader(resp.splitlines(), delimiter=",")
+    def load_summaries(self, path):
+        summaries = defaultdict(list)
         # ["SUM_BILNO", "SUMMARY_DOCID", "SUMMARY_TYPE", "SUMMARY_TEXT"]
-        for row in reader:
+        for row in self._rows(path):
             if row[0] == "SUM_BILNO":
                 continue
 
-            self._summaries[row[0]].append(
-                {
-                    "bill_id": row[0],
-                    "summary_doc_id": row[1],
-                    "summary_type": row[2],
-                    "summary_text": self.remove_html_tags(row[3]),
-                }
-            )
-        self.warning("Total Sponsors Loaded: " + str(len(self._summaries)))
+            summaries[row[0]].append((row[2], self.remove_html_tags(row[3])))
+        self.warning("Total Summaries Loaded: " + str(len(summaries)))
+        return dict(summaries)
+
+    def download(self, session_id):
+        """Download the session's files in parallel, returning their local
+        paths by name.
+        """
+        ftp = FTPCrawler(
+            self._ftp_host,
+            user=os.environ["VIRGINIA_FTP_USER"],
+            passwd=os.environ["VIRGINIA_FTP_PASSWORD"],
+            connections=self._ftp_connections,
+            logger=self.logger,
+        )
+        with ftp:
+            # names are matched without regard to case, LIS isn't consistent
+            listing = {
+                entry.path.rsplit("/", 1)[1].lower(): entry
+                for entry in ftp.listdir("fromdlas/csv" + session_id)
+            }
+            entries = [listing[name.lower()] for name in self._files]
+            with ThreadPoolExecutor(max_workers=self._ftp_connections) as pool:
+                paths = list(pool.map(ftp.download, entries))
+        return dict(zip(self._files, paths))
 
     def scrape(self, session=None):
         if not session:
@@ -203,21 +223,19 @@ class VaCSVBillScraper(Scraper):
             "C": "legislature",
         }
         session_id = SESSION_SITE_IDS[session]
-        self._url_base += session_id + "/"
         bill_url_base = "https://lis.virginia.gov/cgi-bin/"
 
-        self.load_members()
-        self.load_sponsors()
-        self.load_amendments()
-        self.load_history()
-        self.load_summaries()
-        self.load_votes()
-        self.load_bills()
-
-        for bill in self._bills:
-            bill = self._bills[bill][0]
-
-            bill_id = bill["bill_id"]
+        paths = self.download(session_id)
+        members = self.load_members(paths["Members.csv"])
+        sponsors = self.load_sponsors(paths["Sponsors.csv"])
+        amendments = self.load_amendments(paths["Amendments.csv"])
+        history = self.load_history(paths["HISTORY.CSV"])
+        summaries = self.load_summaries(paths["Summaries.csv"])
+        votes = self.load_votes(paths["VOTE.CSV"], members)
+        bills = self.load_bills(paths["BILLS.CSV"])
+
+        for bill in bills.values():
+            bill_id = bill.bill_id
             chamber = chamber_types[bill_id[0]]
             bill_type = {"B": "bill", "J": "joint resolution", "R": "resolution"}[
                 bill_id[1]
@@ -225,7 +243,7 @@ class VaCSVBillScraper(Scraper):
             b = Bill(
                 bill_id,
                 session,
-                bill["bill_description"],
+                bill.bill_description,
                 chamber=chamber,
                 classification=bill_type,
             )
@@ -243,43 +261,35 @@ class VaCSVBillScraper(Scraper):
                 long_bill_id = bill_id[0:2] + "0" + bill_id[-3:]
 
             # Sponsors
-            for spon in self._sponsors[long_bill_id]:
-                sponsor_type = spon["patron_type"]
+            for member_name, sponsor_type in sponsors.get(long_bill_id, ()):
                 if sponsor_type.endswith("Chief Patron"):
                     sponsor_type = "primary"
                 else:
                     sponsor_type = "cosponsor"
                 b.add_sponsorship(
-                    spon["member_name"],
+                    member_name,
                     classification=sponsor_type,
                     entity_type="person",
                     primary=sponsor_type == "primary",
                 )
 
             # Summary
-            summary_texts = self._summaries[long_bill_id]
-            for sum_text in summary_texts:
-                b.add_abstract(sum_text["summary_text"], sum_text["summary_type"])
+            for summary_type, summary_text in summaries.get(long_bill_id, ()):
+                b.add_abstract(summary_text, summary_type)
 
             # Amendment docs
-            amendments = self._amendments[bill_id]
-            for amend in amendments:
-                doc_link = (
-                    bill_url_base + f"legp604.exe?{session_id}+amd+{amend['txt_docid']}"
-                )
+            for txt_docid in amendments.get(bill_id, ()):
+                doc_link = bill_url_base + f"legp604.exe?{session_id}+amd+{txt_docid}"
                 b.add_document_link(
-                    "Amendment: " + amend["txt_docid"], doc_link, media_type="text/html"
+                    "Amendment: " + txt_docid, doc_link, media_type="text/html"
                 )
 
             # Action text is used to improve version text
             actions_text = []
             # History and then votes
-            for hist in self._history[bill_id]:
-                action = hist["history_description"]
-                action_date = hist["history_date"]
+            for action_date, action, vote_id in history.get(bill_id, ()):
                 date = datetime.datetime.strptime(action_date, "%m/%d/%y").date()
                 chamber = chamber_types[action[0]]
-                vote_id = hist["history_refid"]
                 cleaned_action = action[2:]
                 actions_text.append(cleaned_action)
 
@@ -300,14 +310,14 @@ class VaCSVBillScraper(Scraper):
                     total_no = 0
                     total_not_voting = 0
                     total_abstain = 0
-                    for v in self._votes[vote_id]:
-                        if v["vote_result"] == "yes":
+                    for _, vote_result in votes.get(vote_id, ()):
+                        if vote_result == "yes":
                             total_yes += 1
-                        elif v["vote_result"] == "no":
+                        elif vote_result == "no":
                             total_no += 1
-                        elif v["vote_result"] == "not voting":
+                        elif vote_result == "not voting":
                             total_not_voting += 1
-                        elif v["vote_result"] == "abstain":
+                        elif vote_result == "abstain":
                             total_abstain += 1
                     vote = VoteEvent(
                         identifier=vote_id,
@@ -328,22 +338,22 @@ class VaCSVBillScraper(Scraper):
                         + f"legp604.exe?{session_id}+vot+{vote_id}+{long_bill_id}"
                     )
                     vote.add_source(vote_url)
-                    for v in self._votes[vote_id]:
-                        vote.vote(v["vote_result"], v["member_id"])
+                    for member_name, vote_result in votes.get(vote_id, ()):
+                        vote.vote(vote_result, member_name)
                     yield vote
 
             # Versions
-            for version in bill["text_docs"]:
+            for version in bill.text_docs:
                 # Checks if abbr is blank as not every bill has multiple versions
-                if len(version["doc_abbr"]) > 0:
+                if len(version.doc_abbr) > 0:
                     version_url = (
                         bill_url_base
-                        + f"legp604.exe?{session_id}+ful+{version['doc_abbr']}"
+                        + f"legp604.exe?{session_id}+ful+{version.doc_abbr}"
                     )
                     version_date = datetime.datetime.strptime(
-                        version["doc_date"], "%m/%d/%y"
+                        version.doc_date, "%m/%d/%y"
                     ).date()
-                    version_text = version["doc_abbr"]
+                    version_text = version.doc_abbr
                     for act in actions_text:
                         if version_text in act:
                             version_text = act
@@ -1,12 +1,15 @@
-from utils import url_xpath, State
+from utils import url_xpath, State, LazyScrapers
 
 # from .bills import VIBillScraper
 
 
 class USVirginIslands(State):
-    scrapers = {
-        # 'bills': VIBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            # 'bills': VIBillScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "30",
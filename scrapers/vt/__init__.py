@@ -1,10 +1,6 @@
-from utils import url_xpath, State
-from .people import VTPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import VTCommitteeScraper
-from .bills import VTBillScraper
-from .events import VTEventScraper
-
 
 # As of March 2018, Vermont appears to be throttling hits
 # to its website. After a week of production failures, we
@@ -17,12 +13,15 @@ settings = dict(SCRAPELIB_RPM=20)
 
 
 class Vermont(State):
-    scrapers = {
-        "people": VTPersonScraper,
-        # 'committees': VTCommitteeScraper,
-        "bills": VTBillScraper,
-        "events": VTEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:VTPersonScraper",
+            # 'committees': VTCommitteeScraper,
+            "bills": ".bills:VTBillScraper",
+            "events": ".events:VTEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009-2010 Session",
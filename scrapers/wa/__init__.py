@@ -1,7 +1,4 @@
-from utils import State
-from .people import WAPersonScraper
-from .events import WAEventScraper
-from .bills import WABillScraper
+from utils import State, LazyScrapers
 
 # from .committees import WACommitteeScraper
 
@@ -9,12 +6,15 @@ settings = dict(SCRAPELIB_TIMEOUT=300)
 
 
 class Washington(State):
-    scrapers = {
-        "people": WAPersonScraper,
-        "events": WAEventScraper,
-        # 'committees': WACommitteeScraper,
-        "bills": WABillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:WAPersonScraper",
+            "events": ".events:WAEventScraper",
+            # 'committees': WACommitteeScraper,
+            "bills": ".bills:WABillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009-10",
@@ -8,18 +8,22 @@ from .actions import Categorizer
 from .utils import xpath
 from openstates.scrape import Scraper, Bill, VoteEvent as Vote
 from utils import LXMLMixin
+from utils.cache import KeyValueCache, conditional_get
+from utils.parallel import ParallelFetchMixin
 
 import lxml.etree
 import lxml.html
 import feedparser
 
 
-class WABillScraper(Scraper, LXMLMixin):
+class WABillScraper(ParallelFetchMixin, Scraper, LXMLMixin):
     # API Docs: http://wslwebservices.leg.wa.gov/legislationservice.asmx
 
     _base_url = "http://wslwebservices.leg.wa.gov/legislationservice.asmx"
     categorizer = Categorizer()
-    _subjects = defaultdict(list)
+    # validators and parsed contents of the RSS feeds, API bill lists and
+    # directory listings below, so unchanged ones aren't re-downloaded
+    index_cache = KeyValueCache("wa_bill_indexes")
 
     _chamber_map = {"House": "lower", "Senate": "upper", "Joint": "joint"}
 
@@ -37,7 +41,7 @@ class WABillScraper(Scraper, LXMLMixin):
         "": "",
     }
 
-    def build_subject_mapping(self, year):
+    def build_subject_mapping(self, year, subjects):
         url = "http://apps.leg.wa.gov/billsbytopic/Results.aspx?year=%s" % year
         html = self.get(url).text
         doc = lxml.html.fromstring(html)
@@ -46,13 +50,94 @@ class WABillScraper(Scraper, LXMLMixin):
             subject = link.rsplit("=", 1)[-1]
             link = link.replace(" ", "%20")
 
-            # Strip invalid characters
-            rss = re.sub(r"^[^<]+", "", self.get(link).text)
-            rss = feedparser.parse(rss)
-            for e in rss["entries"]:
-                match = re.match(r"\w\w \d{4}", e["title"])
-                if match:
-                    self._subjects[match.group()].append(subject)
+            for bill_id in conditional_get(
+                self, link, self.index_cache, self._parse_subject_feed
+            ):
+                subjects[bill_id].append(subject)
+
+    @staticmethod
+    def _parse_subject_feed(response):
+        # Strip invalid characters
+        rss = re.sub(r"^[^<]+", "", response.text)
+        rss = feedparser.parse(rss)
+        bill_ids = []
+        for e in rss["entries"]:
+            match = re.match(r"\w\w \d{4}", e["title"])
+            if match:
+                bill_ids.append(match.group())
+        return bill_ids
+
+    def _parse_legislation_by_year(self, response):
+        bills = []
+        page = lxml.etree.fromstring(response.content)
+        for leg_info in xpath(page, "//wa:LegislationInfo"):
+            bill_id = xpath(leg_info, "string(wa:BillId)")
+            bill_num = xpath(leg_info, "number(wa:BillNumber)")
+            bill_chamber = xpath(leg_info, "string(wa:OriginalAgency)")
+            bill_chamber = self._chamber_map[bill_chamber]
+
+            # Skip gubernatorial appointments
+            if bill_num >= 9000:
+                continue
+            # skip ballot initiatives
+            if bill_id.startswith("SI") or bill_id.startswith("HI"):
+                continue
+
+            # normalize bill_id
+            bill_id_norm = re.findall(r"(?:S|H)(?:B|CR|JM|JR|R) \d+", bill_id)
+            if not bill_id_norm:
+                self.warning("illegal bill_id %s" % bill_id)
+                continue
+
+            bills.append((bill_chamber, bill_id_norm[0]))
+        return bills
+
+    def get_session_index(self, session):
+        """
+        Biennium-wide bill lists and subjects, built the first time either
+        chamber asks for them and shared by both
+        """
+        if session in self._session_indexes:
+            return self._session_indexes[session]
+
+        year = int(session[0:4])
+        bill_ids = defaultdict(list)
+        subjects = defaultdict(list)
+
+        # first go through API response and get bill list
+        max_year = year if int(datetime.date.today().year) < year + 1 else year + 1
+        for y in sorted({year, max_year}):
+            self.build_subject_mapping(y, subjects)
+            url = "%s/GetLegislationByYear?year=%s" % (self._base_url, y)
+
+            try:
+                bills = conditional_get(
+                    self, url, self.index_cache, self._parse_legislation_by_year
+                )
+            except scrapelib.HTTPError:
+                continue  # future years.
+
+            for bill_chamber, bill_id in bills:
+                bill_ids[bill_chamber].append(bill_id)
+
+        self._session_indexes[session] = index = {
+            "bill_ids": bill_ids,
+            "subjects": subjects,
+        }
+        return index
+
+    def _directory_links(self, url):
+        """ (url, text) of each link in a lawfilesext directory listing """
+
+        def parse(response):
+            doc = lxml.html.fromstring(response.text)
+            doc.make_links_absolute(url)
+            return [
+                (document.get("href"), document.text)
+                for document in doc.xpath("//a")[1:]
+            ]
+
+        return conditional_get(self, url, self.index_cache, parse)
 
     def _load_versions(self, chamber):
         self.versions = {}
@@ -69,12 +154,9 @@ class WABillScraper(Scraper, LXMLMixin):
         chamber = {"lower": "House", "upper": "Senate"}[chamber]
 
         for bill_type in bill_types.keys():
-            doc = self.lxmlize(base_url + chamber + " " + bill_type)
-            documents = doc.xpath("//a")[1:]
-            for document in documents:
-                (link,) = document.xpath("@href")
-
-                (text,) = document.xpath("text()")
+            for link, text in self._directory_links(
+                base_url + chamber + " " + bill_type
+            ):
                 (
                     bill_num,
                     is_substitute,
@@ -119,13 +201,7 @@ class WABillScraper(Scraper, LXMLMixin):
                 self.biennium, document_type, chamber
             )
 
-            doc = self.lxmlize(url)
-            documents = doc.xpath("//a")[1:]
-            for document in documents:
-
-                (link,) = document.xpath("@href")
-                (text,) = document.xpath("text()")
-
+            for link, text in self._directory_links(url):
                 (
                     bill_number,
                     is_substitute,
@@ -197,6 +273,7 @@ class WABillScraper(Scraper, LXMLMixin):
             self.info("no session specified, using %s", session)
         chambers = [chamber] if chamber else ["upper", "lower"]
 
+        self._session_indexes = {}
         for chamber in chambers:
             yield from self.scrape_chamber(chamber, session)
 
@@ -213,56 +290,80 @@ class WABillScraper(Scraper, LXMLMixin):
 
         bill_id_list = self.get_prefiles(chamber, session, year)
 
-        # first go through API response and get bill list
-        max_year = year if int(datetime.date.today().year) < year + 1 else year + 1
-        for y in (year, max_year):
-            self.build_subject_mapping(y)
-            url = "%s/GetLegislationByYear?year=%s" % (self._base_url, y)
-
-            try:
-                page = self.get(url)
-            except scrapelib.HTTPError:
-                continue  # future years.
+        index = self.get_session_index(session)
+        self._subjects = index["subjects"]
+        bill_id_list.extend(index["bill_ids"][chamber])
 
-            page = lxml.etree.fromstring(page.content)
-            for leg_info in xpath(page, "//wa:LegislationInfo"):
-                bill_id = xpath(leg_info, "string(wa:BillId)")
-                bill_num = xpath(leg_info, "number(wa:BillNumber)")
-                bill_chamber = xpath(leg_info, "string(wa:OriginalAgency)")
-                bill_chamber = self._chamber_map[bill_chamber]
-
-                # Skip gubernatorial appointments
-                if bill_num >= 9000:
-                    continue
-                # skip ballot initiatives
-                if bill_id.startswith("SI") or bill_id.startswith("HI"):
-                    continue
-
-                if bill_chamber != chamber:
-                    continue
-
-                # normalize bill_id
-                bill_id_norm = re.findall(r"(?:S|H)(?:B|CR|JM|JR|R) \d+", bill_id)
-                if not bill_id_norm:
-                    self.warning("illegal bill_id %s" % bill_id)
-                    continue
-
-                bill_id_list.append(bill_id_norm[0])
-
-        # de-dup bill_id
-        for bill_id in list(set(bill_id_list)):
+        # de-dup bill_id, and request each bill's API pages a few bills ahead
+        for bill_id in self.prefetch(
+            list(set(bill_id_list)), lambda bill_id: self.bill_urls(session, bill_id)
+        ):
             yield from self.scrape_bill(chamber, session, bill_id)
 
-    def scrape_bill(self, chamber, session, bill_id):
+    def bill_urls(self, session, bill_id):
+        """ the API pages scrape_bill will need for bill_id """
         bill_num = bill_id.split()[1]
-
-        url = "%s/GetLegislation?biennium=%s&billNumber" "=%s" % (
+        return [
+            self.legislation_url(bill_num),
+            self.sponsors_url(bill_id),
+            self.actions_url(session, bill_num),
+            self.hearings_url(bill_num),
+            self.votes_url(bill_num),
+        ]
+
+    def legislation_url(self, bill_num):
+        return "%s/GetLegislation?biennium=%s&billNumber" "=%s" % (
             self._base_url,
             self.biennium,
             bill_num,
         )
 
-        page = self.get(url)
+    def sponsors_url(self, bill_id):
+        bill_id = bill_id.replace(" ", "%20")
+
+        return "%s/GetSponsors?biennium=%s&billId=%s" % (
+            self._base_url,
+            self.biennium,
+            bill_id,
+        )
+
+    def hearings_url(self, bill_num):
+        # http://wslwebservices.leg.wa.gov/LegislationService.asmx?op=GetHearings&
+        # biennium=2019-20&billNumber=5000
+        return (
+            "http://wslwebservices.leg.wa.gov/LegislationService.asmx/GetHearings"
+            "?biennium={}&billNumber={}".format(self.biennium, bill_num)
+        )
+
+    def actions_url(self, session, bill_num):
+        # GetLegislativeStatusChangesByBillNumber gives full results,
+        # unlike GetLegislativeStatusChangesByBillId
+        # http://wslwebservices.leg.wa.gov/legislationservice.asmx/GetLegislativeStatusChangesByBillNumber?
+        # biennium=2015-16&billNumber=1002&beginDate=2014-01-01&endDate=2018-12-31&chamber=senate
+        # biennium=2019-20&billNumber=5121&beginDate=2019-01-01&endDate=2019-12-31&chamber=house
+
+        # Set the start date back a year to catch prefile / intro actions
+        start_date = datetime.date(int(session[0:4]) - 1, 1, 1)
+        end_date = datetime.date(int(session[0:4]) + 1, 12, 31)
+
+        return (
+            "http://wslwebservices.leg.wa.gov/legislationservice.asmx/"
+            "GetLegislativeStatusChangesByBillNumber?biennium={}&billNumber={}"
+            "&beginDate={}&endDate={}".format(
+                self.biennium, bill_num, start_date, end_date
+            )
+        )
+
+    def votes_url(self, bill_num):
+        return (
+            "http://wslwebservices.leg.wa.gov/legislationservice.asmx/"
+            "GetRollCalls?billNumber=%s&biennium=%s" % (bill_num, self.biennium)
+        )
+
+    def scrape_bill(self, chamber, session, bill_id):
+        bill_num = bill_id.split()[1]
+
+        page = self.fetch(self.legislation_url(bill_num))
         page = lxml.etree.fromstring(page.content)
         page = xpath(page, "//wa:Legislation")[0]
 
@@ -321,15 +422,7 @@ class WABillScraper(Scraper, LXMLMixin):
         yield bill
 
     def scrape_sponsors(self, bill):
-        bill_id = bill.identifier.replace(" ", "%20")
-
-        url = "%s/GetSponsors?biennium=%s&billId=%s" % (
-            self._base_url,
-            self.biennium,
-            bill_id,
-        )
-
-        page = self.get(url)
+        page = self.fetch(self.sponsors_url(bill.identifier))
         page = lxml.etree.fromstring(page.content)
 
         first = True
@@ -345,14 +438,8 @@ class WABillScraper(Scraper, LXMLMixin):
             first = False
 
     def scrape_hearings(self, bill, bill_num):
-        # http://wslwebservices.leg.wa.gov/LegislationService.asmx?op=GetHearings&
-        # biennium=2019-20&billNumber=5000
-        url = (
-            "http://wslwebservices.leg.wa.gov/LegislationService.asmx/GetHearings"
-            "?biennium={}&billNumber={}".format(self.biennium, bill_num)
-        )
         try:
-            page = self.get(url)
+            page = self.fetch(self.hearings_url(bill_num))
         except scrapelib.HTTPError as e:
             self.warning(e)
             return
@@ -388,25 +475,8 @@ class WABillScraper(Scraper, LXMLMixin):
         session = bill.legislative_session
         # chamber = bill['chamber']
 
-        # GetLegislativeStatusChangesByBillNumber gives full results,
-        # unlike GetLegislativeStatusChangesByBillId
-        # http://wslwebservices.leg.wa.gov/legislationservice.asmx/GetLegislativeStatusChangesByBillNumber?
-        # biennium=2015-16&billNumber=1002&beginDate=2014-01-01&endDate=2018-12-31&chamber=senate
-        # biennium=2019-20&billNumber=5121&beginDate=2019-01-01&endDate=2019-12-31&chamber=house
-
-        # Set the start date back a year to catch prefile / intro actions
-        start_date = datetime.date(int(session[0:4]) - 1, 1, 1)
-        end_date = datetime.date(int(session[0:4]) + 1, 12, 31)
-
-        url = (
-            "http://wslwebservices.leg.wa.gov/legislationservice.asmx/"
-            "GetLegislativeStatusChangesByBillNumber?biennium={}&billNumber={}"
-            "&beginDate={}&endDate={}".format(
-                self.biennium, bill_num, start_date, end_date
-            )
-        )
         try:
-            page = self.get(url)
+            page = self.fetch(self.actions_url(session, bill_num))
         except scrapelib.HTTPError as e:
             self.warning(e)
             return
@@ -455,11 +525,8 @@ class WABillScraper(Scraper, LXMLMixin):
     def scrape_votes(self, bill):
         bill_num = bill.identifier.split()[1]
 
-        url = (
-            "http://wslwebservices.leg.wa.gov/legislationservice.asmx/"
-            "GetRollCalls?billNumber=%s&biennium=%s" % (bill_num, self.biennium)
-        )
-        page = self.get(url)
+        url = self.votes_url(bill_num)
+        page = self.fetch(url)
         page = lxml.etree.fromstring(page.content)
 
         for rc in xpath(page, "//wa:RollCall"):
@@ -1,19 +1,18 @@
-from utils import url_xpath, State
-
-from .bills import WIBillScraper
-from .events import WIEventScraper
-from .people import WIPersonScraper
+from utils import url_xpath, State, LazyScrapers
 
 # from .committees import WICommitteeScraper
 
 
 class Wisconsin(State):
-    scrapers = {
-        "bills": WIBillScraper,
-        "events": WIEventScraper,
-        "people": WIPersonScraper,
-        # 'committees': WICommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:WIBillScraper",
+            "events": ".events:WIEventScraper",
+            "people": ".people:WIPersonScraper",
+            # 'committees': WICommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009 Regular Session",
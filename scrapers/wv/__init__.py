@@ -1,16 +1,17 @@
-from utils import State
-from .people import WVPersonScraper
-from .bills import WVBillScraper
+from utils import State, LazyScrapers
 
 # from .committees import WVCommitteeScraper
 
 
 class WestVirginia(State):
-    scrapers = {
-        "people": WVPersonScraper,
-        # 'committees': WVCommitteeScraper,
-        "bills": WVBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": ".people:WVPersonScraper",
+            # 'committees': WVCommitteeScraper,
+            "bills": ".bills:WVBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011",
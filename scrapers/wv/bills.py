@@ -6,7 +6,7 @@ from urllib.parse import unquote_plus, parse_qsl, urlparse
 
 import lxml.html
 
-from openstates.utils import convert_pdf
+from utils.pdf import convert_pdf
 from openstates.scrape import Scraper, Bill, VoteEvent
 import scrapelib
 
@@ -1,6 +1,4 @@
-from utils import State
-from .bills import WYBillScraper
-from .people import WYPersonScraper
+from utils import State, LazyScrapers
 
 # from .committees import WYCommitteeScraper
 
@@ -9,11 +7,14 @@ import re
 
 
 class Wyoming(State):
-    scrapers = {
-        "bills": WYBillScraper,
-        "people": WYPersonScraper,
-        # 'committees': WYCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": ".bills:WYBillScraper",
+            "people": ".people:WYPersonScraper",
+            # 'committees': WYCommitteeScraper,
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011",